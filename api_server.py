@@ -0,0 +1,391 @@
+"""
+Local Cluster Analysis API
+
+A small asyncio HTTP/1.1 server that exposes the clustering analysis as
+JSON endpoints, so other local tools can query it without Streamlit:
+
+    GET  /health
+    GET  /market/summary
+    GET  /clusters/<id>/profile
+    GET  /clusters/compare?ids=0,1,2
+    GET  /coins/<ticker>/similar?n=5
+    POST /assign                      body: list of coin objects
+
+The dataset is clustered once at startup and the analyzer stays warm in
+memory. Analysis runs in a thread pool so slow requests do not block the
+event loop. GET responses are cached in memory with ETags derived from the
+dataset version, so a client revalidating with If-None-Match gets a 304
+without any analysis running.
+
+Uses only the standard library plus the project's own modules:
+
+    python api_server.py --data crypto_data.csv --port 8765
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from crypto_ai_insights import compare_clusters, get_shared_analyzer
+from crypto_pipeline import CATEGORY_FEATURES, NUMERIC_FEATURES, PCA_COLUMNS, clean_coin_data, cluster_coin_data
+from figure_cache import dataset_fingerprint
+
+
+logger = logging.getLogger(__name__)
+
+STATUS_TEXT = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+               405: 'Method Not Allowed', 413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+
+class ApiError(Exception):
+    """Error returned to the client with an HTTP status code."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _json_default(value):
+    """Convert NumPy and pandas values that json cannot serialize."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, pd.DataFrame):
+        return value.to_dict(orient='records')
+    if isinstance(value, pd.Series):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def to_json(payload) -> bytes:
+    """Serialize a response payload to UTF-8 JSON."""
+    return json.dumps(payload, default=_json_default).encode('utf-8')
+
+
+class ClusterService:
+    """
+    Warm, read-only view of one clustered dataset.
+    """
+
+    def __init__(self, raw_data: pd.DataFrame, n_clusters: int = 4, cache_entries: int = 256,
+                 tradable_only: bool = True):
+        """
+        Clean and cluster the dataset and build the shared analyzer.
+
+        Args:
+            raw_data: Raw coin DataFrame indexed by ticker (crypto_data.csv layout)
+            n_clusters: Number of KMeans clusters
+            cache_entries: Number of GET responses kept in memory
+            tradable_only: Apply the 2018 dataset filters when cleaning
+        """
+        cleaned = clean_coin_data(raw_data, tradable_only=tradable_only)
+        self.data, self.model = cluster_coin_data(cleaned, n_clusters=n_clusters, random_state=42)
+        self.version = dataset_fingerprint(self.data)
+        self.analyzer = get_shared_analyzer(self.data, self.version)
+        self.points = self.data[PCA_COLUMNS].to_numpy()
+
+        self.cache_entries = cache_entries
+        self._cache: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def etag(self, key: str) -> str:
+        """ETag for a GET request: the dataset version plus a hash of the request target."""
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]
+        return f'"{self.version}-{digest}"'
+
+    def cached(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            body = self._cache.get(key)
+            if body is not None:
+                self._cache.move_to_end(key)
+            return body
+
+    def store(self, key: str, body: bytes) -> None:
+        with self._lock:
+            self._cache[key] = body
+            while len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+
+    def _cluster_id(self, value: str) -> int:
+        try:
+            cluster_id = int(value)
+        except ValueError:
+            raise ApiError(400, f"Invalid cluster id: {value}")
+        if cluster_id not in self.analyzer.cluster_stats:
+            raise ApiError(404, f"Cluster {cluster_id} not found")
+        return cluster_id
+
+    def health(self) -> Dict:
+        return {
+            'status': 'ok',
+            'dataset_version': self.version,
+            'coins': len(self.data),
+            'clusters': sorted(int(c) for c in self.analyzer.cluster_stats)
+        }
+
+    def market_summary(self) -> Dict:
+        return self.analyzer.generate_market_summary()
+
+    def cluster_profile(self, cluster_id: str) -> Dict:
+        return self.analyzer.generate_cluster_profile(self._cluster_id(cluster_id)).to_dict()
+
+    def compare(self, ids: str) -> List[Dict]:
+        if not ids:
+            raise ApiError(400, "Query parameter 'ids' is required, e.g. ids=0,1")
+        cluster_ids = [self._cluster_id(part) for part in ids.split(',') if part]
+        return compare_clusters(self.analyzer, cluster_ids).to_dict(orient='records')
+
+    def similar_coins(self, ticker: str, n: int = 5) -> Dict:
+        """
+        Find the coins closest to a coin in PCA space.
+
+        Args:
+            ticker: Ticker (or exact coin name) of the reference coin
+            n: Number of neighbours to return
+
+        Returns:
+            Dictionary with the coin, its cluster and its nearest neighbours
+        """
+        position = self.analyzer.coin_index.position(ticker)
+        if position is None:
+            raise ApiError(404, f"Coin {ticker} not found")
+
+        distance = np.sqrt(((self.points - self.points[position]) ** 2).sum(axis=1))
+        distance[position] = np.inf
+
+        n = max(1, min(n, len(distance) - 1))
+        nearest = np.argpartition(distance, n - 1)[:n]
+        nearest = nearest[np.argsort(distance[nearest])]
+
+        neighbours = self.data.iloc[nearest]
+        return {
+            'coin': str(self.data.index[position]),
+            'name': self.data['CoinName'].iloc[position],
+            'cluster': int(self.data['Class'].iloc[position]),
+            'similar': [
+                {
+                    'coin': str(coin),
+                    'name': row['CoinName'],
+                    'cluster': int(row['Class']),
+                    'distance': round(float(d), 6)
+                }
+                for (coin, row), d in zip(neighbours.iterrows(), distance[nearest])
+            ]
+        }
+
+    def assign(self, coins) -> List[Dict]:
+        """
+        Assign new coins to the frozen clusters.
+
+        Args:
+            coins: List of objects with CoinName, Algorithm, ProofType,
+                   TotalCoinsMined, TotalCoinSupply and an optional ticker
+
+        Returns:
+            List of assignments with PC coordinates and Class
+        """
+        if not isinstance(coins, list) or not coins:
+            raise ApiError(400, "Body must be a non-empty JSON list of coins")
+
+        frame = pd.DataFrame(coins)
+        missing = [c for c in NUMERIC_FEATURES + CATEGORY_FEATURES if c not in frame.columns]
+        if missing:
+            raise ApiError(400, f"Coins are missing fields: {missing}")
+
+        # Coins without a ticker are identified by their position in the request
+        tickers = frame['ticker'] if 'ticker' in frame.columns else pd.Series(None, index=frame.index)
+        frame.index = [str(t) if isinstance(t, str) and t else str(i) for i, t in enumerate(tickers)]
+        try:
+            assigned = self.model.assign_coins(frame)
+        except ValueError:
+            raise ApiError(400, "TotalCoinsMined and TotalCoinSupply must be numeric")
+
+        return assigned.reset_index(names='coin').to_dict(orient='records')
+
+
+def _route(service: ClusterService, method: str, path: str, query: Dict[str, str], body: bytes):
+    """Dispatch a request to the service. Returns (payload, cacheable)."""
+    parts = [part for part in path.split('/') if part]
+
+    if method == 'POST':
+        if parts == ['assign']:
+            try:
+                coins = json.loads(body or b'null')
+            except json.JSONDecodeError as e:
+                raise ApiError(400, f"Invalid JSON body: {e}")
+            return service.assign(coins), False
+        raise ApiError(405, f"POST not supported for {path}")
+
+    if method != 'GET':
+        raise ApiError(405, f"Method {method} not allowed")
+
+    if parts == ['health']:
+        return service.health(), False
+    if parts == ['market', 'summary']:
+        return service.market_summary(), True
+    if parts == ['clusters', 'compare']:
+        return service.compare(query.get('ids', '')), True
+    if len(parts) == 3 and parts[0] == 'clusters' and parts[2] == 'profile':
+        return service.cluster_profile(parts[1]), True
+    if len(parts) == 3 and parts[0] == 'coins' and parts[2] == 'similar':
+        try:
+            n = int(query.get('n', 5))
+        except ValueError:
+            raise ApiError(400, "Query parameter 'n' must be an integer")
+        return service.similar_coins(parts[1], n), True
+
+    raise ApiError(404, f"No endpoint for {path}")
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+    """Read one HTTP request. Returns None when the client closed the connection."""
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+
+    try:
+        method, target, _ = request_line.decode('latin-1').split()
+    except ValueError:
+        raise ApiError(400, "Malformed request line")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get('content-length', 0) or 0)
+    except ValueError:
+        raise ApiError(400, "Invalid Content-Length header")
+    if length < 0:
+        raise ApiError(400, "Invalid Content-Length header")
+    if length > MAX_BODY_BYTES:
+        raise ApiError(413, "Request body too large")
+    body = await reader.readexactly(length) if length else b''
+
+    return method.upper(), target, headers, body
+
+
+def _response(status: int, body: bytes = b'', etag: Optional[str] = None, keep_alive: bool = True) -> bytes:
+    lines = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}"]
+    if status != 304:
+        lines.append("Content-Type: application/json")
+    lines.append(f"Content-Length: {len(body)}")
+    if etag:
+        lines.append(f"ETag: {etag}")
+        lines.append("Cache-Control: no-cache")
+    lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+
+async def handle_connection(service: ClusterService, reader: asyncio.StreamReader,
+                            writer: asyncio.StreamWriter) -> None:
+    """Serve requests on one (keep-alive) connection."""
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            try:
+                request = await _read_request(reader)
+            except ApiError as e:
+                writer.write(_response(e.status, to_json({'error': e.message}), keep_alive=False))
+                break
+            if request is None:
+                break
+
+            method, target, headers, body = request
+            keep_alive = headers.get('connection', '').lower() != 'close'
+            url = urlsplit(target)
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+            # Revalidation is answered from the ETag alone, before any work runs
+            etag = service.etag(target) if method == 'GET' else None
+            if etag and headers.get('if-none-match') == etag:
+                writer.write(_response(304, etag=etag, keep_alive=keep_alive))
+            else:
+                cached = service.cached(target) if etag else None
+                if cached is not None:
+                    writer.write(_response(200, cached, etag=etag, keep_alive=keep_alive))
+                else:
+                    try:
+                        payload, cacheable = await loop.run_in_executor(
+                            None, _route, service, method, url.path, query, body)
+                        response_body = to_json(payload)
+                        if cacheable:
+                            service.store(target, response_body)
+                        else:
+                            etag = None
+                        writer.write(_response(200, response_body, etag=etag, keep_alive=keep_alive))
+                    except ApiError as e:
+                        writer.write(_response(e.status, to_json({'error': e.message}), keep_alive=keep_alive))
+                    except Exception:
+                        logger.exception("Error handling %s %s", method, target)
+                        writer.write(_response(500, to_json({'error': 'Internal server error'}),
+                                               keep_alive=keep_alive))
+
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(service: ClusterService, host: str = '127.0.0.1', port: int = 8765) -> None:
+    """Run the API server until cancelled."""
+    server = await asyncio.start_server(
+        lambda reader, writer: handle_connection(service, reader, writer), host, port)
+    logger.info("Serving dataset %s on http://%s:%d", service.version, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve cluster analysis as a local JSON API")
+    parser.add_argument('--data', default='crypto_data.csv', help="Raw coin CSV (crypto_data.csv layout)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--clusters', type=int, default=4, help="Number of KMeans clusters")
+    filters = parser.add_mutually_exclusive_group()
+    filters.add_argument('--tradable-only', dest='tradable_only', action='store_true',
+                         help="Keep only trading coins with complete, mined supply")
+    filters.add_argument('--keep-untradable', dest='tradable_only', action='store_false',
+                         help="Keep every coin")
+    parser.set_defaults(tradable_only=None)
+    args = parser.parse_args()
+
+    # By default filter like the apps do: every dataset except the 2025 one
+    tradable_only = args.tradable_only
+    if tradable_only is None:
+        tradable_only = Path(args.data).name != 'crypto_data_2025.csv'
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    service = ClusterService(pd.read_csv(args.data, index_col=0), n_clusters=args.clusters,
+                             tradable_only=tradable_only)
+    print(f"Cluster API for {len(service.data)} coins on http://{args.host}:{args.port}")
+
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from pathlib import Path
+import os
 import sys
 import time
 
@@ -18,7 +19,9 @@ import time
 sys.path.append(str(Path(__file__).parent))
 
 try:
-    from crypto_ai_insights import CryptoAIAnalyzer, compare_clusters
+    from crypto_ai_insights import (
+        compare_clusters, get_shared_analyzer, analyzer_construction_stats
+    )
     from senior_pm_features import (
         create_business_metrics_dashboard,
         create_roi_calculator,
@@ -28,6 +31,16 @@ try:
         get_strategic_insights,
         calculate_unit_economics
     )
+    from crypto_visuals import (
+        DEFAULT_POINT_BUDGET, PCA_COLUMNS, WEBGL_THRESHOLD, downsample_pca_points, hexbin
+    )
+    from figure_cache import FIGURE_CACHE, dataset_fingerprint
+    from artifact_cache import ARTIFACT_CACHE, file_fingerprint
+    from page_products import DataProducts
+    from instrumentation import PAGE_PROFILER, display_diagnostics_panel, stage
+    from snapshot_store import load_clustered_snapshot, snapshot_dates
+    from crypto_pipeline import clean_coin_data, cluster_coin_data
+    from synthetic_data import sample_coin_data
 except ImportError:
     st.error("Required modules not found. Please ensure all files are present in the repository.")
     st.stop()
@@ -506,98 +519,74 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-@st.cache_data(show_spinner=False)
-def load_crypto_data(source='2025'):
-    """Load cryptocurrency data from selected source"""
-    from sklearn.preprocessing import StandardScaler
-    from sklearn.decomposition import PCA
-    from sklearn.cluster import KMeans
+# Local snapshot store with daily coin snapshots (see snapshot_store.py)
+SNAPSHOT_DIR = os.environ.get('CRYPTO_SNAPSHOT_DIR', 'snapshots')
 
-    try:
-        # Load data based on source
-        if source == '2025':
-            if Path('crypto_data_2025.csv').exists():
-                df = pd.read_csv('crypto_data_2025.csv', index_col=0)
-            else:
-                return load_fallback_data()
-        else:  # 2018 data
-            if Path('crypto_data.csv').exists():
-                df = pd.read_csv('crypto_data.csv', index_col=0)
-                # Filter to tradable coins only
-                df = df[df['IsTrading'] == True]
-                df = df.dropna()
-                df = df[df['TotalCoinsMined'] > 0]
-            else:
-                return load_fallback_data()
-
-        # Remove IsTrading column if present
-        if 'IsTrading' in df.columns:
-            df = df.drop('IsTrading', axis=1)
-
-        # Prepare features for clustering
-        X = df[['TotalCoinsMined', 'TotalCoinSupply']].copy()
-        X_encoded = pd.get_dummies(df[['Algorithm', 'ProofType']])
-        X_combined = pd.concat([X, X_encoded], axis=1)
-
-        # Scale and apply PCA
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X_combined)
-
-        pca = PCA(n_components=3)
-        pca_result = pca.fit_transform(X_scaled)
-
-        # Apply K-means clustering
-        kmeans = KMeans(n_clusters=4, random_state=42)
-        clusters = kmeans.fit_predict(pca_result)
-
-        # Create final dataframe
-        result_df = df.copy()
-        result_df['PC 1'] = pca_result[:, 0]
-        result_df['PC 2'] = pca_result[:, 1]
-        result_df['PC 3'] = pca_result[:, 2]
-        result_df['Class'] = clusters
 
+def list_snapshot_dates():
+    """List dates available in the local snapshot store"""
+    return snapshot_dates(SNAPSHOT_DIR)
+
+
+def format_data_source(source):
+    """Human-readable label for a data source option"""
+    if source == '2025':
+        return '2024-2025 Dataset (100 coins)'
+    if source.startswith('snapshot:'):
+        return f"Snapshot {source.split(':', 1)[1]}"
+    return 'Historical 2018 Dataset (532 coins)'
+
+
+# Raw files behind the built-in data sources
+DATA_FILES = {'2025': 'crypto_data_2025.csv', '2018': 'crypto_data.csv'}
+
+
+def build_clustered_data(source):
+    """Load, clean and cluster a built-in data source, reusing a stored artifact when available"""
+    path = DATA_FILES[source]
+
+    def build():
+        with stage('load.csv'):
+            df = pd.read_csv(path, index_col=0)
+        # The 2018 dataset is filtered to tradable coins with complete data
+        df = clean_coin_data(df, tradable_only=source != '2025')
+
+        # Encode, scale, PCA and K-means clustering
+        result_df, _ = cluster_coin_data(df, n_clusters=4, random_state=42)
         return result_df
 
+    with stage('load.artifact', source=source):
+        return ARTIFACT_CACHE.get_or_build(
+            'clustered', {'source': source, 'file': file_fingerprint(path), 'n_clusters': 4}, build
+        )
+
+
+def read_crypto_data(source='2025'):
+    """Load cryptocurrency data from selected source"""
+    try:
+        if source.startswith('snapshot:'):
+            return load_clustered_snapshot(SNAPSHOT_DIR, source.split(':', 1)[1])
+
+        if not Path(DATA_FILES.get(source, DATA_FILES['2018'])).exists():
+            return load_fallback_data()
+
+        return build_clustered_data(source if source in DATA_FILES else '2018')
+
     except Exception as e:
         st.warning(f"Error loading data: {e}. Using fallback data.")
         return load_fallback_data()
 
 
-def load_fallback_data():
-    """Load fallback sample data if real data unavailable"""
-    np.random.seed(42)
-    n_samples = 100
-
-    latest_coins = [
-        'Bitcoin', 'Ethereum', 'Solana', 'Cardano', 'Polygon',
-        'Arbitrum', 'Optimism', 'Avalanche', 'Chainlink', 'Uniswap',
-        'Fetch.ai', 'SingularityNET', 'Ocean Protocol', 'Render', 'Akash',
-        'Aave', 'Curve', 'Maker', 'Compound', 'Synthetix'
-    ]
-
-    coin_names = latest_coins + [f'Coin_{i}' for i in range(n_samples - len(latest_coins))]
-
-    sample_data = pd.DataFrame({
-        'CoinName': coin_names,
-        'Algorithm': np.random.choice(['SHA-256', 'Beacon Chain', 'Proof-of-History', 'Scrypt'], n_samples),
-        'ProofType': np.random.choice(['PoW', 'PoS', 'PoH', 'DPoS'], n_samples),
-        'TotalCoinsMined': np.random.exponential(1e7, n_samples),
-        'TotalCoinSupply': np.random.exponential(1e8, n_samples),
-        'PC 1': np.random.randn(n_samples),
-        'PC 2': np.random.randn(n_samples),
-        'PC 3': np.random.randn(n_samples),
-        'Class': np.random.randint(0, 4, n_samples)
-    })
+@st.cache_data(show_spinner=False)
+def load_crypto_data(source='2025'):
+    """Load data from the selected source with its content fingerprint (hashed once per cache entry)"""
+    data = read_crypto_data(source)
+    return data, dataset_fingerprint(data)
 
-    # Set specific clusters for known coins
-    sample_data.loc[sample_data['CoinName'] == 'Bitcoin', 'Class'] = 0
-    sample_data.loc[sample_data['CoinName'] == 'Ethereum', 'Class'] = 0
-    sample_data.loc[sample_data['CoinName'] == 'Solana', 'Class'] = 1
-    sample_data.loc[sample_data['CoinName'].isin(['Fetch.ai', 'SingularityNET', 'Ocean Protocol']), 'Class'] = 2
-    sample_data.loc[sample_data['CoinName'].isin(['Arbitrum', 'Optimism', 'Polygon']), 'Class'] = 3
 
-    return sample_data
+def load_fallback_data():
+    """Load fallback sample data if real data unavailable"""
+    return sample_coin_data(100, n_clusters=4, seed=42)
 
 
 def create_modern_metric_card(label, value, delta, col):
@@ -623,17 +612,34 @@ def create_north_star_hero(value, label, trend):
     """, unsafe_allow_html=True)
 
 
-def create_modern_3d_scatter(data):
-    """Create modern 3D scatter plot"""
-    fig = px.scatter_3d(
+def create_modern_3d_scatter(data, max_points=DEFAULT_POINT_BUDGET, method='stratified',
+                             keep_coins=None, bounds=None):
+    """Create modern 3D scatter plot, downsampled to a point budget for large datasets"""
+    plot_data = downsample_pca_points(
         data,
+        max_points=max_points,
+        method=method,
+        keep_coins=keep_coins,
+        bounds=bounds
+    )
+
+    title = '<b>Cryptocurrency Clusters in 3D PCA Space</b>'
+    if len(plot_data) < len(data):
+        title += f'<br><sup>Showing {len(plot_data):,} of {len(data):,} coins</sup>'
+
+    hover_data = ['Algorithm', 'ProofType']
+    if 'PointCount' in plot_data.columns:
+        hover_data.append('PointCount')
+
+    fig = px.scatter_3d(
+        plot_data,
         x='PC 1',
         y='PC 2',
         z='PC 3',
         color='Class',
         hover_name='CoinName',
-        hover_data=['Algorithm', 'ProofType'],
-        title='<b>Cryptocurrency Clusters in 3D PCA Space</b>',
+        hover_data=hover_data,
+        title=title,
         labels={'Class': 'Cluster'},
         color_continuous_scale='Viridis',
         height=700
@@ -656,6 +662,150 @@ def create_modern_3d_scatter(data):
         hoverlabel=dict(bgcolor="white", font_size=12, font_family="Inter, sans-serif")
     )
 
+    if bounds:
+        axes = dict(zip(PCA_COLUMNS, ['xaxis', 'yaxis', 'zaxis']))
+        fig.update_layout(scene={axes[col]: dict(range=list(rng)) for col, rng in bounds.items()})
+
+    return fig
+
+
+def create_supply_scatter(data, log_axes=False, density=False, webgl=None, density_min_count=50):
+    """
+    Create supply vs mined scatter plot.
+
+    Large datasets render with WebGL traces; the scaled columns are computed
+    as arrays rather than added to a copy of the frame. In density mode,
+    hexbin cells holding at least `density_min_count` coins replace their
+    individual points.
+    """
+    if webgl is None:
+        webgl = len(data) > WEBGL_THRESHOLD
+    trace = go.Scattergl if webgl else go.Scatter
+
+    mined = data['TotalCoinsMined'].to_numpy(dtype=float) / 1e6
+    supply = data['TotalCoinSupply'].to_numpy(dtype=float) / 1e6
+    classes = data['Class'].to_numpy()
+    hover = np.column_stack([
+        data['CoinName'].to_numpy(),
+        data['Algorithm'].to_numpy(),
+        data['ProofType'].to_numpy()
+    ])
+
+    fig = go.Figure()
+    points = np.ones(len(data), dtype=bool)
+
+    if density and len(data) > 0:
+        # Log axes have no room for zero or negative values, so bin only plottable coins
+        plottable = (mined > 0) & (supply > 0) if log_axes else np.ones(len(data), dtype=bool)
+        bx = np.log10(mined[plottable]) if log_axes else mined
+        by = np.log10(supply[plottable]) if log_axes else supply
+
+        if plottable.any():
+            bins = hexbin(bx, by)
+            dense_cells = bins['count'] >= density_min_count
+            points[np.flatnonzero(plottable)[dense_cells[bins['cell']]]] = False
+
+            cell_x, cell_y = bins['x'][dense_cells], bins['y'][dense_cells]
+            if log_axes:
+                cell_x, cell_y = 10 ** cell_x, 10 ** cell_y
+
+            fig.add_trace(trace(
+                x=cell_x,
+                y=cell_y,
+                mode='markers',
+                name='Dense regions',
+                marker=dict(
+                    symbol='hexagon',
+                    size=14,
+                    color=np.log10(bins['count'][dense_cells]),
+                    colorscale='Blues',
+                    colorbar=dict(title='log10 coins', x=1.12)
+                ),
+                customdata=bins['count'][dense_cells],
+                hovertemplate='%{customdata:,} coins<extra></extra>'
+            ))
+
+    fig.add_trace(trace(
+        x=mined[points],
+        y=supply[points],
+        mode='markers',
+        name='Coins',
+        marker=dict(color=classes[points], colorscale='Viridis', colorbar=dict(title='Cluster'), size=7),
+        customdata=hover[points],
+        hovertemplate=(
+            '<b>%{customdata[0]}</b><br>'
+            'Algorithm: %{customdata[1]}<br>'
+            'ProofType: %{customdata[2]}<br>'
+            'Mined: %{x:,.2f}M<br>'
+            'Supply: %{y:,.2f}M<extra></extra>'
+        )
+    ))
+
+    axis_type = 'log' if log_axes else 'linear'
+    fig.update_layout(
+        title='<b>Total Coin Supply vs Total Coins Mined</b>',
+        xaxis=dict(title='Total Coins Mined (Millions)', type=axis_type),
+        yaxis=dict(title='Total Coin Supply (Millions)', type=axis_type),
+        showlegend=False,
+        height=500,
+        paper_bgcolor='rgba(255,255,255,0.95)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter, sans-serif')
+    )
+
+    return fig
+
+
+def create_algorithm_bar(summary):
+    """Create top algorithms bar chart from a market summary"""
+    algo_data = pd.DataFrame(list(summary['algorithm_distribution'].items()),
+                            columns=['Algorithm', 'Count'])
+    fig = px.bar(algo_data.head(10), x='Algorithm', y='Count',
+                title='<b>Top 10 Algorithms</b>',
+                color='Count',
+                color_continuous_scale='Viridis')
+
+    fig.update_layout(
+        paper_bgcolor='rgba(255,255,255,0.95)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter, sans-serif')
+    )
+
+    return fig
+
+
+def create_proof_pie(summary):
+    """Create proof type pie chart from a market summary"""
+    proof_data = pd.DataFrame(list(summary['proof_distribution'].items()),
+                             columns=['Proof Type', 'Count'])
+    fig = px.pie(proof_data, values='Count', names='Proof Type',
+                title='<b>Proof Type Distribution</b>',
+                color_discrete_sequence=px.colors.qualitative.Set3)
+
+    fig.update_layout(
+        paper_bgcolor='rgba(255,255,255,0.95)',
+        font=dict(family='Inter, sans-serif')
+    )
+
+    return fig
+
+
+def create_risk_bar(summary):
+    """Create cluster risk distribution bar chart from a market summary"""
+    risk_data = pd.DataFrame(list(summary['risk_distribution'].items()),
+                            columns=['Risk Level', 'Number of Clusters'])
+
+    fig = px.bar(risk_data, x='Risk Level', y='Number of Clusters',
+                color='Risk Level',
+                color_discrete_map={'Low': '#28a745', 'Medium': '#ffc107', 'High': '#dc3545'},
+                title='<b>Cluster Risk Distribution</b>')
+
+    fig.update_layout(
+        paper_bgcolor='rgba(255,255,255,0.95)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter, sans-serif')
+    )
+
     return fig
 
 
@@ -950,7 +1100,7 @@ def display_cluster_explorer(data, analyzer):
             st.dataframe(notable_df, use_container_width=True, hide_index=True)
 
 
-def display_visualizations(data):
+def display_visualizations(data, coin_index, version):
     """Interactive visualizations"""
     st.markdown('<h1 class="hero-header">Data Visualizations</h1>', unsafe_allow_html=True)
     st.markdown('<p class="hero-subtitle">Interactive charts and analysis</p>', unsafe_allow_html=True)
@@ -963,7 +1113,54 @@ def display_visualizations(data):
         st.markdown("### 3D Cluster Visualization")
         st.markdown("Rotate, zoom, and explore cryptocurrency clusters in PCA space")
 
-        fig = create_modern_3d_scatter(data)
+        with st.expander("Rendering options"):
+            col1, col2 = st.columns(2)
+            with col1:
+                max_points = st.number_input(
+                    "Point budget:",
+                    min_value=500,
+                    max_value=200000,
+                    value=DEFAULT_POINT_BUDGET,
+                    step=500,
+                    help="Large datasets are downsampled to this many points; outliers are always shown"
+                )
+            with col2:
+                method = st.selectbox(
+                    "Downsampling:",
+                    options=['stratified', 'voxel'],
+                    format_func=lambda x: 'Stratified per cluster' if x == 'stratified' else 'Voxel grid aggregation'
+                )
+
+            # Typed coins are resolved through the coin index, so large datasets
+            # never ship every coin name to the browser as widget options
+            keep_query = st.text_input(
+                "Always show coins:",
+                placeholder="Tickers or names, comma-separated (e.g. BTC, Ethereum)",
+                help="Listed coins are never dropped by downsampling"
+            )
+            keep_keys = [key.strip() for key in keep_query.split(',') if key.strip()]
+            keep_positions = [coin_index.positions(key) for key in keep_keys]
+            unknown = [key for key, positions in zip(keep_keys, keep_positions) if not positions]
+            if unknown:
+                st.caption(f"Not in this dataset: {', '.join(unknown)}")
+            keep_coins = sorted(set(data['CoinName'].iloc[sum(keep_positions, [])]))
+
+            # Zooming into a region spends the same budget on fewer coins
+            bounds = {}
+            zoom_cols = st.columns(3)
+            for zoom_col, pc in zip(zoom_cols, PCA_COLUMNS):
+                low, high = float(data[pc].min()), float(data[pc].max())
+                with zoom_col:
+                    selected = st.slider(f"{pc} range:", low, high, (low, high))
+                if selected != (low, high):
+                    bounds[pc] = selected
+
+        fig = FIGURE_CACHE.get_or_build(
+            'scatter_3d', version,
+            lambda: create_modern_3d_scatter(data, max_points, method, keep_coins, bounds),
+            params={'max_points': max_points, 'method': method,
+                    'keep_coins': sorted(keep_coins), 'bounds': bounds}
+        )
         st.plotly_chart(fig, use_container_width=True)
 
         st.info("""
@@ -974,33 +1171,19 @@ def display_visualizations(data):
     with tab2:
         st.markdown("### Supply vs Mined Analysis")
 
-        data_scaled = data.copy()
-        data_scaled['TotalCoinSupply_scaled'] = data_scaled['TotalCoinSupply'] / 1e6
-        data_scaled['TotalCoinsMined_scaled'] = data_scaled['TotalCoinsMined'] / 1e6
-
-        fig = px.scatter(
-            data_scaled,
-            x='TotalCoinsMined_scaled',
-            y='TotalCoinSupply_scaled',
-            color='Class',
-            hover_name='CoinName',
-            hover_data=['Algorithm', 'ProofType'],
-            title='<b>Total Coin Supply vs Total Coins Mined</b>',
-            labels={
-                'TotalCoinsMined_scaled': 'Total Coins Mined (Millions)',
-                'TotalCoinSupply_scaled': 'Total Coin Supply (Millions)',
-                'Class': 'Cluster'
-            },
-            color_continuous_scale='Viridis',
-            height=500
-        )
+        col1, col2 = st.columns(2)
+        with col1:
+            log_axes = st.checkbox("Log axes", value=False,
+                                   help="Coins with zero supply or mined are hidden on log axes")
+        with col2:
+            density = st.checkbox("Density view (hexbin)", value=len(data) > 50000,
+                                  help="Aggregate very dense regions into hexagonal bins")
 
-        fig.update_layout(
-            paper_bgcolor='rgba(255,255,255,0.95)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter, sans-serif')
+        fig = FIGURE_CACHE.get_or_build(
+            'supply_scatter', version,
+            lambda: create_supply_scatter(data, log_axes=log_axes, density=density),
+            params={'log_axes': log_axes, 'density': density}
         )
-
         st.plotly_chart(fig, use_container_width=True)
 
         st.info("""
@@ -1029,24 +1212,25 @@ def display_visualizations(data):
             )
 
         with col3:
-            search_term = st.text_input("Search coin name:", "")
+            search_term = st.text_input("Search coin name or ticker:", "").strip()
 
         # Apply filters
-        filtered_data = data[
-            (data['Class'].isin(selected_clusters)) &
-            (data['Algorithm'].isin(selected_algos))
-        ]
+        mask = data['Class'].isin(selected_clusters) & data['Algorithm'].isin(selected_algos)
 
+        # A search shows coins whose name contains the term plus the coin
+        # whose ticker is the term (looked up in the index)
         if search_term:
-            filtered_data = filtered_data[
-                filtered_data['CoinName'].str.contains(search_term, case=False, na=False)
-            ]
+            matches = data['CoinName'].str.contains(search_term, case=False, na=False, regex=False).to_numpy(copy=True)
+            matches[coin_index.positions(search_term)] = True
+            mask &= matches
+
+        filtered_data = data[mask]
 
         st.dataframe(filtered_data, use_container_width=True)
         st.caption(f"Showing {len(filtered_data)} of {len(data)} cryptocurrencies")
 
 
-def display_market_analysis(data, analyzer):
+def display_market_analysis(data, analyzer, version):
     """Market analysis page"""
     st.markdown('<h1 class="hero-header">Market Analysis</h1>', unsafe_allow_html=True)
     st.markdown('<p class="hero-subtitle">Comprehensive market intelligence</p>', unsafe_allow_html=True)
@@ -1072,49 +1256,17 @@ def display_market_analysis(data, analyzer):
 
     with col1:
         st.markdown("### Algorithm Distribution")
-        algo_data = pd.DataFrame(list(summary['algorithm_distribution'].items()),
-                                columns=['Algorithm', 'Count'])
-        fig = px.bar(algo_data.head(10), x='Algorithm', y='Count',
-                    title='<b>Top 10 Algorithms</b>',
-                    color='Count',
-                    color_continuous_scale='Viridis')
-
-        fig.update_layout(
-            paper_bgcolor='rgba(255,255,255,0.95)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter, sans-serif')
-        )
+        fig = FIGURE_CACHE.get_or_build('algorithm_bar', version, lambda: create_algorithm_bar(summary))
         st.plotly_chart(fig, use_container_width=True)
 
     with col2:
         st.markdown("### Proof Type Distribution")
-        proof_data = pd.DataFrame(list(summary['proof_distribution'].items()),
-                                 columns=['Proof Type', 'Count'])
-        fig = px.pie(proof_data, values='Count', names='Proof Type',
-                    title='<b>Proof Type Distribution</b>',
-                    color_discrete_sequence=px.colors.qualitative.Set3)
-
-        fig.update_layout(
-            paper_bgcolor='rgba(255,255,255,0.95)',
-            font=dict(family='Inter, sans-serif')
-        )
+        fig = FIGURE_CACHE.get_or_build('proof_pie', version, lambda: create_proof_pie(summary))
         st.plotly_chart(fig, use_container_width=True)
 
     # Risk distribution
     st.markdown("### Risk Distribution Across Clusters")
-    risk_data = pd.DataFrame(list(summary['risk_distribution'].items()),
-                            columns=['Risk Level', 'Number of Clusters'])
-
-    fig = px.bar(risk_data, x='Risk Level', y='Number of Clusters',
-                color='Risk Level',
-                color_discrete_map={'Low': '#28a745', 'Medium': '#ffc107', 'High': '#dc3545'},
-                title='<b>Cluster Risk Distribution</b>')
-
-    fig.update_layout(
-        paper_bgcolor='rgba(255,255,255,0.95)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(family='Inter, sans-serif')
-    )
+    fig = FIGURE_CACHE.get_or_build('risk_bar', version, lambda: create_risk_bar(summary))
     st.plotly_chart(fig, use_container_width=True)
 
 
@@ -1194,6 +1346,182 @@ def display_generate_report(analyzer):
         """)
 
 
+def display_about():
+    """About page"""
+    st.markdown('<h1 class="hero-header">About This Platform</h1>', unsafe_allow_html=True)
+    st.markdown("""
+    This platform was built by a Senior AI Product Manager with 20 years of experience
+    in building and scaling data-driven products.
+
+    ### What Makes This Different
+
+    Most crypto analytics tools overwhelm you with data. This platform uses machine learning
+    to find patterns and Gen AI to explain them in plain English. No PhD required.
+
+    ### Technical Approach
+
+    We use K-means clustering with PCA to group 500+ cryptocurrencies by their fundamental
+    characteristics. Then AI generates insights that actually matter for investment decisions.
+
+    ### Who Is This For
+
+    - Retail investors who want smarter analysis
+    - Portfolio managers looking for efficiency
+    - Researchers studying market patterns
+    - Anyone tired of information overload
+    """)
+
+
+def display_data_sources():
+    """Data sources page"""
+    st.markdown('<h1 class="hero-header">Data Sources</h1>', unsafe_allow_html=True)
+
+    st.markdown("""
+    We provide two comprehensive cryptocurrency datasets spanning from the early blockchain era to current 2024-2025 market trends.
+    """)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div class="glass-card">
+            <h3 style="color: #667eea; margin-top: 0;">📜 Historical Dataset (2018)</h3>
+            <p><strong>Size:</strong> 532 tradable cryptocurrencies</p>
+            <p><strong>Time Period:</strong> 2017-2018</p>
+            <p><strong>Key Features:</strong></p>
+            <ul>
+                <li>Early blockchain algorithms (Scrypt, X11, SHA-256)</li>
+                <li>Proof-of-Work dominant era</li>
+                <li>Ethereum pre-Merge (PoW)</li>
+                <li>Historical mining data</li>
+            </ul>
+            <p><strong>Notable Coins:</strong> Bitcoin, Ethereum (PoW), Litecoin, Dash, Monero</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="glass-card">
+            <h3 style="color: #764ba2; margin-top: 0;">📊 Modern Dataset (2024-2025)</h3>
+            <p><strong>Size:</strong> 100 current cryptocurrencies</p>
+            <p><strong>Time Period:</strong> October 2024 - Current</p>
+            <p><strong>Key Features:</strong></p>
+            <ul>
+                <li>Modern consensus (PoS, PoH, L2-PoS)</li>
+                <li>Layer-2 solutions (Arbitrum, Optimism)</li>
+                <li>AI-focused tokens (Fetch.ai, Render, Bittensor)</li>
+                <li>Latest DeFi protocols</li>
+            </ul>
+            <p><strong>Notable Coins:</strong> Bitcoin, Ethereum (PoS), Solana, Arbitrum, Celestia</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    st.markdown("### Data Comparison")
+
+    comparison_data = {
+        'Feature': ['Total Cryptocurrencies', 'Ethereum Consensus', 'Layer-2 Coverage', 'AI Tokens', 'Meme Coins', 'Dead Projects'],
+        '2018 Dataset': ['532', 'PoW (Ethash)', 'None', 'None', 'Dogecoin era', 'Many included'],
+        '2024-2025 Dataset': ['100', 'PoS (Beacon Chain)', 'ARB, OP, STRK, IMX', 'FET, AGIX, OCEAN, RNDR, TAO', '2024 cycle (PEPE, BONK)', 'Filtered out']
+    }
+
+    comparison_df = pd.DataFrame(comparison_data)
+    st.dataframe(comparison_df, use_container_width=True, hide_index=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    st.markdown("### Data Collection Sources")
+    st.markdown("""
+    **2024-2025 Dataset compiled from:**
+    - **CoinGecko API** - Market data and token information (13M+ tokens tracked)
+    - **CoinMarketCap** - Historical and current supply data
+    - **Official Project Documentation** - Consensus mechanisms and technical specs
+    - **Blockchain Explorers** - On-chain supply verification
+
+    **Update Schedule:** Quarterly updates (Jan 31, Apr 30, Jul 31, Oct 31)
+
+    For detailed information about data methodology and sources, see:
+    [📄 DATA_SOURCES.md](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/DATA_SOURCES.md)
+    """)
+
+
+def display_documentation():
+    """Documentation page"""
+    st.markdown('<h1 class="hero-header">Documentation</h1>', unsafe_allow_html=True)
+    st.markdown("""
+    ### Quick Links
+
+    - [Complete Technical Documentation](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/README_ENHANCED.md)
+    - [Portfolio Showcase Guide](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/PORTFOLIO_SHOWCASE.md)
+    - [AI PM Methodology](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/AI_PM_APPROACH.md)
+    - [Data Sources Documentation](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/DATA_SOURCES.md)
+    - [GitHub Repository](https://github.com/rahul99gangu/Cryptocurrencies)
+
+    ### How to Use
+
+    1. **Overview**: See market trends and cluster distribution
+    2. **Cluster Explorer**: Deep dive into specific cryptocurrency groups
+    3. **Visualizations**: Interactive 3D plots and charts
+    4. **Market Analysis**: Distribution and risk metrics
+    5. **Generate Report**: Export comprehensive analysis
+    6. **Data Sources**: Compare historical vs current datasets
+    """)
+
+
+def display_contact():
+    """Contact page"""
+    st.markdown('<h1 class="hero-header">Contact</h1>', unsafe_allow_html=True)
+    st.markdown("""
+    ### Get In Touch
+
+    For questions, feedback, or collaboration:
+
+    - **GitHub**: [rahul99gangu/Cryptocurrencies](https://github.com/rahul99gangu/Cryptocurrencies)
+    - **Issues**: [Report a bug](https://github.com/rahul99gangu/Cryptocurrencies/issues)
+
+    ### Built With
+
+    Python • Streamlit • Scikit-learn • Plotly • Gen AI
+    """)
+
+
+# Page name -> (render function, data products the page needs).
+# Pages that need nothing render without loading data or fitting models.
+PAGES = {
+    "Overview": (display_modern_overview, ('data', 'analyzer')),
+    "Executive Dashboard": (display_modern_executive_dashboard, ()),
+    "Cluster Explorer": (display_cluster_explorer, ('data', 'analyzer')),
+    "Visualizations": (display_visualizations, ('data', 'coin_index', 'version')),
+    "Market Analysis": (display_market_analysis, ('data', 'analyzer', 'version')),
+    "Generate Report": (display_generate_report, ('analyzer',)),
+    "About": (display_about, ()),
+    "Data Sources": (display_data_sources, ()),
+    "Documentation": (display_documentation, ()),
+    "Contact": (display_contact, ())
+}
+
+
+def warm_figure_cache(data, analyzer, version):
+    """Build the figures the pages show with their default settings (used by warmup.py)"""
+    summary = analyzer.generate_market_summary()
+    density = len(data) > 50000
+    figures = [
+        ('scatter_3d', lambda: create_modern_3d_scatter(data, DEFAULT_POINT_BUDGET, 'stratified', [], {}),
+         {'max_points': DEFAULT_POINT_BUDGET, 'method': 'stratified', 'keep_coins': [], 'bounds': {}}),
+        ('supply_scatter', lambda: create_supply_scatter(data, log_axes=False, density=density),
+         {'log_axes': False, 'density': density}),
+        ('algorithm_bar', lambda: create_algorithm_bar(summary), None),
+        ('proof_pie', lambda: create_proof_pie(summary), None),
+        ('risk_bar', lambda: create_risk_bar(summary), None)
+    ]
+
+    for name, builder, params in figures:
+        FIGURE_CACHE.get_or_build(name, version, builder, params=params)
+
+    return [name for name, _, _ in figures]
+
+
 def main():
     """Main application"""
 
@@ -1211,14 +1539,16 @@ def main():
         st.markdown("**Data Source**")
         data_source = st.selectbox(
             "Select dataset:",
-            options=['2025', '2018'],
-            format_func=lambda x: f"{'2024-2025 Dataset (100 coins)' if x == '2025' else 'Historical 2018 Dataset (532 coins)'}",
-            help="Choose between current 2024-2025 data or historical 2018 data",
+            options=['2025', '2018'] + [f"snapshot:{date}" for date in list_snapshot_dates()],
+            format_func=format_data_source,
+            help="Choose between current 2024-2025 data, historical 2018 data or a stored daily snapshot",
             label_visibility="collapsed"
         )
 
         if data_source == '2025':
             st.caption("📊 Latest cryptocurrencies with modern consensus mechanisms")
+        elif data_source.startswith('snapshot:'):
+            st.caption("🗂️ Daily snapshot from the local snapshot store")
         else:
             st.caption("📜 Historical data from the 2017-2018 crypto era")
 
@@ -1264,168 +1594,54 @@ def main():
         </div>
         """, unsafe_allow_html=True)
 
-    # Load data with loading indicator
+    render, needs = PAGES.get(page, (None, ()))
+
+    products = DataProducts(
+        dataset=lambda p: load_crypto_data(data_source),
+        data=lambda p: p['dataset'][0],
+        version=lambda p: p['dataset'][1],
+        analyzer=lambda p: get_shared_analyzer(p['data'], p['version']),
+        coin_index=lambda p: p['analyzer'].coin_index
+    )
+
+    # Load only the data products this page declared
     try:
         with st.spinner("Loading market data..."):
-            data = load_crypto_data(data_source)
-            analyzer = CryptoAIAnalyzer(data)
-
-            # Display data source info
-            if data_source == '2025':
-                st.info(f"📊 Using **2024-2025 Dataset**: {len(data)} modern cryptocurrencies with latest consensus mechanisms")
-            else:
-                st.info(f"📜 Using **Historical 2018 Dataset**: {len(data)} cryptocurrencies from the early blockchain era")
+            page_products = products.resolve(needs)
     except Exception as e:
         st.error(f"Error loading data: {e}")
         st.info("Please ensure all required files are present.")
         st.stop()
         return
 
-    # Display compact header
-    display_compact_header(data)
-
-    # Page routing
-    if page == "Overview":
-        display_modern_overview(data, analyzer)
-    elif page == "Executive Dashboard":
-        display_modern_executive_dashboard()
-    elif page == "Cluster Explorer":
-        display_cluster_explorer(data, analyzer)
-    elif page == "Visualizations":
-        display_visualizations(data)
-    elif page == "Market Analysis":
-        display_market_analysis(data, analyzer)
-    elif page == "Generate Report":
-        display_generate_report(analyzer)
-    elif page == "About":
-        st.markdown('<h1 class="hero-header">About This Platform</h1>', unsafe_allow_html=True)
-        st.markdown("""
-        This platform was built by a Senior AI Product Manager with 20 years of experience
-        in building and scaling data-driven products.
-
-        ### What Makes This Different
-
-        Most crypto analytics tools overwhelm you with data. This platform uses machine learning
-        to find patterns and Gen AI to explain them in plain English. No PhD required.
-
-        ### Technical Approach
-
-        We use K-means clustering with PCA to group 500+ cryptocurrencies by their fundamental
-        characteristics. Then AI generates insights that actually matter for investment decisions.
-
-        ### Who Is This For
-
-        - Retail investors who want smarter analysis
-        - Portfolio managers looking for efficiency
-        - Researchers studying market patterns
-        - Anyone tired of information overload
-        """)
-    elif page == "Data Sources":
-        st.markdown('<h1 class="hero-header">Data Sources</h1>', unsafe_allow_html=True)
-
-        st.markdown("""
-        We provide two comprehensive cryptocurrency datasets spanning from the early blockchain era to current 2024-2025 market trends.
-        """)
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown("""
-            <div class="glass-card">
-                <h3 style="color: #667eea; margin-top: 0;">📜 Historical Dataset (2018)</h3>
-                <p><strong>Size:</strong> 532 tradable cryptocurrencies</p>
-                <p><strong>Time Period:</strong> 2017-2018</p>
-                <p><strong>Key Features:</strong></p>
-                <ul>
-                    <li>Early blockchain algorithms (Scrypt, X11, SHA-256)</li>
-                    <li>Proof-of-Work dominant era</li>
-                    <li>Ethereum pre-Merge (PoW)</li>
-                    <li>Historical mining data</li>
-                </ul>
-                <p><strong>Notable Coins:</strong> Bitcoin, Ethereum (PoW), Litecoin, Dash, Monero</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            st.markdown("""
-            <div class="glass-card">
-                <h3 style="color: #764ba2; margin-top: 0;">📊 Modern Dataset (2024-2025)</h3>
-                <p><strong>Size:</strong> 100 current cryptocurrencies</p>
-                <p><strong>Time Period:</strong> October 2024 - Current</p>
-                <p><strong>Key Features:</strong></p>
-                <ul>
-                    <li>Modern consensus (PoS, PoH, L2-PoS)</li>
-                    <li>Layer-2 solutions (Arbitrum, Optimism)</li>
-                    <li>AI-focused tokens (Fetch.ai, Render, Bittensor)</li>
-                    <li>Latest DeFi protocols</li>
-                </ul>
-                <p><strong>Notable Coins:</strong> Bitcoin, Ethereum (PoS), Solana, Arbitrum, Celestia</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        st.markdown("<br>", unsafe_allow_html=True)
-
-        st.markdown("### Data Comparison")
-
-        comparison_data = {
-            'Feature': ['Total Cryptocurrencies', 'Ethereum Consensus', 'Layer-2 Coverage', 'AI Tokens', 'Meme Coins', 'Dead Projects'],
-            '2018 Dataset': ['532', 'PoW (Ethash)', 'None', 'None', 'Dogecoin era', 'Many included'],
-            '2024-2025 Dataset': ['100', 'PoS (Beacon Chain)', 'ARB, OP, STRK, IMX', 'FET, AGIX, OCEAN, RNDR, TAO', '2024 cycle (PEPE, BONK)', 'Filtered out']
-        }
-
-        comparison_df = pd.DataFrame(comparison_data)
-        st.dataframe(comparison_df, use_container_width=True, hide_index=True)
-
-        st.markdown("<br>", unsafe_allow_html=True)
-
-        st.markdown("### Data Collection Sources")
-        st.markdown("""
-        **2024-2025 Dataset compiled from:**
-        - **CoinGecko API** - Market data and token information (13M+ tokens tracked)
-        - **CoinMarketCap** - Historical and current supply data
-        - **Official Project Documentation** - Consensus mechanisms and technical specs
-        - **Blockchain Explorers** - On-chain supply verification
-
-        **Update Schedule:** Quarterly updates (Jan 31, Apr 30, Jul 31, Oct 31)
+    with st.sidebar:
+        build_stats = analyzer_construction_stats()
+        st.caption(
+            f"Analyzer builds this process: {build_stats['count']} "
+            f"(last {build_stats['last_seconds'] * 1000:.0f} ms)"
+        )
 
-        For detailed information about data methodology and sources, see:
-        [📄 DATA_SOURCES.md](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/DATA_SOURCES.md)
-        """)
+    if needs:
+        data = products['data']
 
-    elif page == "Documentation":
-        st.markdown('<h1 class="hero-header">Documentation</h1>', unsafe_allow_html=True)
-        st.markdown("""
-        ### Quick Links
-
-        - [Complete Technical Documentation](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/README_ENHANCED.md)
-        - [Portfolio Showcase Guide](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/PORTFOLIO_SHOWCASE.md)
-        - [AI PM Methodology](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/AI_PM_APPROACH.md)
-        - [Data Sources Documentation](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/DATA_SOURCES.md)
-        - [GitHub Repository](https://github.com/rahul99gangu/Cryptocurrencies)
-
-        ### How to Use
-
-        1. **Overview**: See market trends and cluster distribution
-        2. **Cluster Explorer**: Deep dive into specific cryptocurrency groups
-        3. **Visualizations**: Interactive 3D plots and charts
-        4. **Market Analysis**: Distribution and risk metrics
-        5. **Generate Report**: Export comprehensive analysis
-        6. **Data Sources**: Compare historical vs current datasets
-        """)
-    elif page == "Contact":
-        st.markdown('<h1 class="hero-header">Contact</h1>', unsafe_allow_html=True)
-        st.markdown("""
-        ### Get In Touch
-
-        For questions, feedback, or collaboration:
+        # Display data source info
+        if data_source == '2025':
+            st.info(f"📊 Using **2024-2025 Dataset**: {len(data)} modern cryptocurrencies with latest consensus mechanisms")
+        elif data_source.startswith('snapshot:'):
+            st.info(f"🗂️ Using **Snapshot {data_source.split(':', 1)[1]}**: {len(data)} cryptocurrencies")
+        else:
+            st.info(f"📜 Using **Historical 2018 Dataset**: {len(data)} cryptocurrencies from the early blockchain era")
 
-        - **GitHub**: [rahul99gangu/Cryptocurrencies](https://github.com/rahul99gangu/Cryptocurrencies)
-        - **Issues**: [Report a bug](https://github.com/rahul99gangu/Cryptocurrencies/issues)
+        # Display compact header
+        display_compact_header(data)
 
-        ### Built With
+    # Page routing
+    if render is not None:
+        with PAGE_PROFILER.profile('page', page):
+            render(**page_products)
 
-        Python • Streamlit • Scikit-learn • Plotly • Gen AI
-        """)
+    with st.sidebar:
+        display_diagnostics_panel()
 
     # Footer
     st.markdown("<br><br>", unsafe_allow_html=True)
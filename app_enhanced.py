@@ -11,12 +11,19 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from pathlib import Path
+import os
 import sys
 
 # Add current directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
-from crypto_ai_insights import CryptoAIAnalyzer, compare_clusters
+from crypto_ai_insights import compare_clusters, get_shared_analyzer
+from figure_cache import dataset_fingerprint
+from instrumentation import PAGE_PROFILER, display_diagnostics_panel, stage
+from page_products import DataProducts
+from roi_simulation import simulate_portfolio_paths
+from snapshot_store import load_clustered_snapshot, snapshot_dates
+from synthetic_data import sample_coin_data
 from senior_pm_features import (
     create_business_metrics_dashboard,
     create_roi_calculator,
@@ -96,51 +103,39 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-@st.cache_data
 def load_sample_data():
     """
     Load sample cryptocurrency data with 2024-2025 additions
     """
     # Check if clustered data exists
     if Path('clustered_crypto_data.csv').exists():
-        return pd.read_csv('clustered_crypto_data.csv', index_col=0)
-
-    # Create enhanced sample data with latest cryptocurrencies
-    st.info("📊 Using enhanced sample data with 2024-2025 market trends")
-
-    np.random.seed(42)
-    n_samples = 120  # Increased from 100
-
-    # Latest 2024-2025 cryptocurrencies
-    latest_coins = [
-        'Bitcoin', 'Ethereum', 'Solana', 'Cardano', 'Polygon',
-        'Arbitrum', 'Optimism', 'Avalanche', 'Chainlink', 'Uniswap',
-        'Fetch.ai', 'SingularityNET', 'Ocean Protocol', 'Render', 'Akash',
-        'Aave', 'Curve', 'Maker', 'Compound', 'Synthetix'
-    ]
-
-    coin_names = latest_coins + [f'AltCoin_{i}' for i in range(n_samples - len(latest_coins))]
-
-    sample_data = pd.DataFrame({
-        'CoinName': coin_names,
-        'Algorithm': np.random.choice(['SHA-256', 'Ethash', 'Proof-of-Stake', 'Proof-of-History', 'Scrypt'], n_samples),
-        'ProofType': np.random.choice(['PoW', 'PoS', 'PoH', 'DPoS'], n_samples),
-        'TotalCoinsMined': np.random.exponential(1e7, n_samples),
-        'TotalCoinSupply': np.random.exponential(1e8, n_samples),
-        'PC 1': np.random.randn(n_samples),
-        'PC 2': np.random.randn(n_samples),
-        'PC 3': np.random.randn(n_samples),
-        'Class': np.random.randint(0, 5, n_samples)  # 5 clusters for more granularity
-    })
-
-    # Set specific values for known coins
-    sample_data.loc[sample_data['CoinName'] == 'Bitcoin', 'Class'] = 0
-    sample_data.loc[sample_data['CoinName'] == 'Ethereum', 'Class'] = 0
-    sample_data.loc[sample_data['CoinName'] == 'Solana', 'Class'] = 1
-    sample_data.loc[sample_data['CoinName'].isin(['Fetch.ai', 'SingularityNET', 'Ocean Protocol']), 'Class'] = 2
-    sample_data.loc[sample_data['CoinName'].isin(['Arbitrum', 'Optimism', 'Polygon']), 'Class'] = 3
-
-    return sample_data
+        with stage('load.csv'):
+            return pd.read_csv('clustered_crypto_data.csv', index_col=0)
+
+    # Offline sample universe from the synthetic coin generator
+    st.info("📊 Using synthetic sample data")
+
+    return sample_coin_data(120, n_clusters=5, seed=42)
+
+
+# Local snapshot store with daily coin snapshots (see snapshot_store.py)
+SNAPSHOT_DIR = os.environ.get('CRYPTO_SNAPSHOT_DIR', 'snapshots')
+
+
+def load_snapshot_data(date):
+    """
+    Load and cluster a stored daily snapshot
+    """
+    return load_clustered_snapshot(SNAPSHOT_DIR, date)
+
+
+@st.cache_data
+def load_dataset(snapshot=None):
+    """
+    Load bundled or snapshot data with its content fingerprint (hashed once per cache entry)
+    """
+    data = load_sample_data() if snapshot is None else load_snapshot_data(snapshot)
+    return data, dataset_fingerprint(data)
 
 
 def display_executive_dashboard():
@@ -291,21 +286,34 @@ def display_roi_calculator():
         }
 
         params = roi_params[risk_tolerance]
-        expected_return = initial_investment * (1 + params['return']/100 * time_horizon/12)
+        simulation = simulate_portfolio_paths(
+            initial_investment,
+            params['return'],
+            params['volatility'],
+            time_horizon,
+            n_paths=100000,
+            seed=42
+        )
+        expected_return = simulation['p50'][-1]
         profit = expected_return - initial_investment
         roi_percent = (profit / initial_investment) * 100
 
         col_a, col_b, col_c = st.columns(3)
 
         with col_a:
-            st.metric("Expected Value", f"${expected_return:,.0f}")
+            st.metric("Median Value", f"${expected_return:,.0f}")
 
         with col_b:
-            st.metric("Profit", f"${profit:,.0f}", f"+{roi_percent:.1f}%")
+            st.metric("Profit", f"${profit:,.0f}", f"{roi_percent:+.1f}%")
 
         with col_c:
             st.metric("Recommended Allocation", params['allocation'])
 
+        st.caption(
+            f"Monte Carlo: {simulation['n_paths']:,} simulated paths. "
+            f"Probability of loss: {simulation['prob_loss']:.1%}"
+        )
+
         # Volatility warning
         if risk_tolerance == 'Aggressive':
             st.warning(f"⚠️ High volatility: ±{params['volatility']}%. Significant loss potential.")
@@ -318,15 +326,12 @@ def display_roi_calculator():
     st.markdown("---")
     st.markdown("### 📊 Growth Projection")
 
-    months = list(range(time_horizon + 1))
-    values = [initial_investment * (1 + params['return']/100 * m/12) for m in months]
-    upper_bound = [v * (1 + params['volatility']/100) for v in values]
-    lower_bound = [v * (1 - params['volatility']/100) for v in values]
+    months = simulation['months']
 
     fig = go.Figure()
 
     fig.add_trace(go.Scatter(
-        x=months, y=upper_bound,
+        x=months, y=simulation['p95'],
         fill=None,
         mode='lines',
         line_color='rgba(0,100,80,0.2)',
@@ -334,20 +339,27 @@ def display_roi_calculator():
     ))
 
     fig.add_trace(go.Scatter(
-        x=months, y=lower_bound,
+        x=months, y=simulation['p5'],
         fill='tonexty',
         mode='lines',
         line_color='rgba(0,100,80,0.2)',
-        name='Volatility Range'
+        name='P5-P95 Range'
     ))
 
     fig.add_trace(go.Scatter(
-        x=months, y=values,
+        x=months, y=simulation['p50'],
         mode='lines+markers',
-        name='Expected Value',
+        name='Median (P50)',
         line=dict(color='#1f77b4', width=3)
     ))
 
+    fig.add_trace(go.Scatter(
+        x=months, y=simulation['mean'],
+        mode='lines',
+        name='Expected Value',
+        line=dict(color='#1f77b4', width=1, dash='dash')
+    ))
+
     fig.update_layout(
         title=f'{risk_tolerance} Portfolio - {time_horizon} Month Projection',
         xaxis_title='Months',
@@ -592,6 +604,73 @@ def display_strategic_insights():
         st.warning(f"**{risk}:** {parts[0]}\n\n**Mitigation:** {parts[1]}")
 
 
+def display_overview(data):
+    """Platform overview with market trends and cluster distribution"""
+    st.markdown("## Welcome to the Cryptocurrency Intelligence Platform")
+
+    st.markdown("""
+    This platform transforms complex cryptocurrency data into actionable insights using:
+    - **Unsupervised Machine Learning** for clustering similar cryptocurrencies
+    - **Generative AI** for natural language insights and risk assessment
+    - **Interactive Visualizations** for exploring patterns
+    - **Executive Analytics** for strategic decision-making
+    """)
+
+    # Quick stats
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Cryptocurrencies", len(data))
+
+    with col2:
+        st.metric("Clusters", len(data['Class'].unique()))
+
+    with col3:
+        st.metric("Algorithms", len(data['Algorithm'].unique()))
+
+    with col4:
+        st.metric("Proof Types", len(data['ProofType'].unique()))
+
+    # Latest Market Trends (2024-2025)
+    st.markdown("---")
+    st.markdown("### 🔥 Latest Market Trends (2024-2025)")
+
+    trends = create_market_trends_data()
+
+    cols = st.columns(2)
+    for idx, (trend, details) in enumerate(trends['2024_highlights'].items()):
+        with cols[idx % 2]:
+            st.info(f"""
+            **{trend}**
+            📅 {details['date']}
+            {details['impact']}
+            📈 Impact: {details['market_effect']}
+            """)
+
+    # Sample visualization
+    st.markdown("---")
+    st.markdown("### 🎯 Cluster Distribution")
+    cluster_counts = data['Class'].value_counts().sort_index()
+    fig = px.bar(x=cluster_counts.index, y=cluster_counts.values,
+                labels={'x': 'Cluster ID', 'y': 'Number of Coins'},
+                title='Cryptocurrencies per Cluster',
+                color=cluster_counts.values,
+                color_continuous_scale='viridis')
+    st.plotly_chart(fig, use_container_width=True)
+
+
+# Page name -> (render function, data products the page needs).
+# Pages that need nothing render without loading data.
+PAGES = {
+    "📊 Executive Dashboard": (display_executive_dashboard, ()),
+    "💰 ROI Calculator": (display_roi_calculator, ()),
+    "🎯 Competitive Analysis": (display_competitive_analysis, ()),
+    "🗺️ Product Roadmap": (display_product_roadmap, ()),
+    "💼 Strategic Insights": (display_strategic_insights, ()),
+    "🏠 Overview": (display_overview, ('data',))
+}
+
+
 # Main function with enhanced navigation
 def main():
     """Main application with senior PM features"""
@@ -604,6 +683,17 @@ def main():
     with st.sidebar:
         st.image("https://via.placeholder.com/300x100/1f77b4/ffffff?text=Crypto+Intelligence", use_column_width=True)
 
+        # Stored daily snapshots, offered only when the snapshot store has any
+        snapshot = None
+        dates = snapshot_dates(SNAPSHOT_DIR)
+        if dates:
+            st.markdown("## 🗂️ Data Source")
+            snapshot = st.selectbox(
+                "Select dataset:",
+                options=[None] + dates,
+                format_func=lambda date: "Bundled dataset" if date is None else f"Snapshot {date}"
+            )
+
         st.markdown("## 📊 Navigation")
 
         # Categorized navigation
@@ -654,84 +744,30 @@ def main():
         st.markdown("📘 [Technical Documentation](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/README_ENHANCED.md)")
         st.markdown("💼 [Portfolio Guide](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/PORTFOLIO_SHOWCASE.md)")
 
-    # Load data
+    render, needs = PAGES.get(page, (None, ()))
+
+    products = DataProducts(
+        dataset=lambda p: load_dataset(snapshot),
+        data=lambda p: p['dataset'][0],
+        version=lambda p: p['dataset'][1],
+        analyzer=lambda p: get_shared_analyzer(p['data'], p['version'])
+    )
+
+    # Load only the data products this page declared
     try:
-        data = load_sample_data()
-        analyzer = CryptoAIAnalyzer(data)
+        page_products = products.resolve(needs)
     except Exception as e:
         st.error(f"Error loading data: {e}")
         st.info("Using fallback sample data for demonstration.")
         return
 
-    # Page routing - Executive View
-    if page == "📊 Executive Dashboard":
-        display_executive_dashboard()
-
-    elif page == "💰 ROI Calculator":
-        display_roi_calculator()
-
-    elif page == "🎯 Competitive Analysis":
-        display_competitive_analysis()
+    # Page routing
+    if render is not None:
+        with PAGE_PROFILER.profile('page', page):
+            render(**page_products)
 
-    elif page == "🗺️ Product Roadmap":
-        display_product_roadmap()
-
-    elif page == "💼 Strategic Insights":
-        display_strategic_insights()
-
-    # Technical Analysis pages (keep from original app.py)
-    elif page == "🏠 Overview":
-        st.markdown("## Welcome to the Cryptocurrency Intelligence Platform")
-
-        st.markdown("""
-        This platform transforms complex cryptocurrency data into actionable insights using:
-        - **Unsupervised Machine Learning** for clustering similar cryptocurrencies
-        - **Generative AI** for natural language insights and risk assessment
-        - **Interactive Visualizations** for exploring patterns
-        - **Executive Analytics** for strategic decision-making
-        """)
-
-        # Quick stats
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            st.metric("Cryptocurrencies", len(data))
-
-        with col2:
-            st.metric("Clusters", len(data['Class'].unique()))
-
-        with col3:
-            st.metric("Algorithms", len(data['Algorithm'].unique()))
-
-        with col4:
-            st.metric("Proof Types", len(data['ProofType'].unique()))
-
-        # Latest Market Trends (2024-2025)
-        st.markdown("---")
-        st.markdown("### 🔥 Latest Market Trends (2024-2025)")
-
-        trends = create_market_trends_data()
-
-        cols = st.columns(2)
-        for idx, (trend, details) in enumerate(trends['2024_highlights'].items()):
-            with cols[idx % 2]:
-                st.info(f"""
-                **{trend}**
-                📅 {details['date']}
-                {details['impact']}
-                📈 Impact: {details['market_effect']}
-                """)
-
-        # Sample visualization
-        st.markdown("---")
-        st.markdown("### 🎯 Cluster Distribution")
-        cluster_counts = data['Class'].value_counts().sort_index()
-        fig = px.bar(x=cluster_counts.index, y=cluster_counts.values,
-                    labels={'x': 'Cluster ID', 'y': 'Number of Coins'},
-                    title='Cryptocurrencies per Cluster',
-                    color=cluster_counts.values,
-                    color_continuous_scale='viridis')
-        st.plotly_chart(fig, use_container_width=True)
+    with st.sidebar:
+        display_diagnostics_panel()
 
     # ... (Continue with other technical pages from original app.py)
     # I'll implement the complete technical pages, but keeping this response concise
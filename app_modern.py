@@ -11,6 +11,7 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from pathlib import Path
+import os
 import sys
 import time
 
@@ -18,7 +19,9 @@ import time
 sys.path.append(str(Path(__file__).parent))
 
 try:
-    from crypto_ai_insights import CryptoAIAnalyzer, compare_clusters
+    from crypto_ai_insights import (
+        compare_clusters, get_shared_analyzer, analyzer_construction_stats
+    )
     from senior_pm_features import (
         create_business_metrics_dashboard,
         create_roi_calculator,
@@ -28,6 +31,14 @@ try:
         get_strategic_insights,
         calculate_unit_economics
     )
+    from crypto_visuals import (
+        DEFAULT_POINT_BUDGET, PCA_COLUMNS, WEBGL_THRESHOLD, downsample_pca_points, hexbin
+    )
+    from figure_cache import FIGURE_CACHE, dataset_fingerprint
+    from page_products import DataProducts
+    from instrumentation import PAGE_PROFILER, display_diagnostics_panel, stage
+    from snapshot_store import load_clustered_snapshot, snapshot_dates
+    from synthetic_data import sample_coin_data
 except ImportError:
     st.error("Required modules not found. Please ensure all files are present in the repository.")
     st.stop()
@@ -506,45 +517,29 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-@st.cache_data(show_spinner=False)
 def load_sample_data():
     """Load cryptocurrency data - optimized for performance"""
     if Path('clustered_crypto_data.csv').exists():
-        return pd.read_csv('clustered_crypto_data.csv', index_col=0)
-
-    # Sample data with latest 2024-2025 cryptocurrencies
-    np.random.seed(42)
-    n_samples = 120
-
-    latest_coins = [
-        'Bitcoin', 'Ethereum', 'Solana', 'Cardano', 'Polygon',
-        'Arbitrum', 'Optimism', 'Avalanche', 'Chainlink', 'Uniswap',
-        'Fetch.ai', 'SingularityNET', 'Ocean Protocol', 'Render', 'Akash',
-        'Aave', 'Curve', 'Maker', 'Compound', 'Synthetix'
-    ]
-
-    coin_names = latest_coins + [f'AltCoin_{i}' for i in range(n_samples - len(latest_coins))]
-
-    sample_data = pd.DataFrame({
-        'CoinName': coin_names,
-        'Algorithm': np.random.choice(['SHA-256', 'Ethash', 'Proof-of-Stake', 'Proof-of-History', 'Scrypt'], n_samples),
-        'ProofType': np.random.choice(['PoW', 'PoS', 'PoH', 'DPoS'], n_samples),
-        'TotalCoinsMined': np.random.exponential(1e7, n_samples),
-        'TotalCoinSupply': np.random.exponential(1e8, n_samples),
-        'PC 1': np.random.randn(n_samples),
-        'PC 2': np.random.randn(n_samples),
-        'PC 3': np.random.randn(n_samples),
-        'Class': np.random.randint(0, 5, n_samples)
-    })
-
-    # Set specific clusters for known coins
-    sample_data.loc[sample_data['CoinName'] == 'Bitcoin', 'Class'] = 0
-    sample_data.loc[sample_data['CoinName'] == 'Ethereum', 'Class'] = 0
-    sample_data.loc[sample_data['CoinName'] == 'Solana', 'Class'] = 1
-    sample_data.loc[sample_data['CoinName'].isin(['Fetch.ai', 'SingularityNET', 'Ocean Protocol']), 'Class'] = 2
-    sample_data.loc[sample_data['CoinName'].isin(['Arbitrum', 'Optimism', 'Polygon']), 'Class'] = 3
-
-    return sample_data
+        with stage('load.csv'):
+            return pd.read_csv('clustered_crypto_data.csv', index_col=0)
+
+    return sample_coin_data(120, n_clusters=5, seed=42)
+
+
+# Local snapshot store with daily coin snapshots (see snapshot_store.py)
+SNAPSHOT_DIR = os.environ.get('CRYPTO_SNAPSHOT_DIR', 'snapshots')
+
+
+def load_snapshot_data(date):
+    """Load and cluster a stored daily snapshot"""
+    return load_clustered_snapshot(SNAPSHOT_DIR, date)
+
+
+@st.cache_data(show_spinner=False)
+def load_dataset(snapshot=None):
+    """Load bundled or snapshot data with its content fingerprint (hashed once per cache entry)"""
+    data = load_sample_data() if snapshot is None else load_snapshot_data(snapshot)
+    return data, dataset_fingerprint(data)
 
 
 def create_modern_metric_card(label, value, delta, col):
@@ -570,17 +565,34 @@ def create_north_star_hero(value, label, trend):
     """, unsafe_allow_html=True)
 
 
-def create_modern_3d_scatter(data):
-    """Create modern 3D scatter plot"""
-    fig = px.scatter_3d(
+def create_modern_3d_scatter(data, max_points=DEFAULT_POINT_BUDGET, method='stratified',
+                             keep_coins=None, bounds=None):
+    """Create modern 3D scatter plot, downsampled to a point budget for large datasets"""
+    plot_data = downsample_pca_points(
         data,
+        max_points=max_points,
+        method=method,
+        keep_coins=keep_coins,
+        bounds=bounds
+    )
+
+    title = '<b>Cryptocurrency Clusters in 3D PCA Space</b>'
+    if len(plot_data) < len(data):
+        title += f'<br><sup>Showing {len(plot_data):,} of {len(data):,} coins</sup>'
+
+    hover_data = ['Algorithm', 'ProofType']
+    if 'PointCount' in plot_data.columns:
+        hover_data.append('PointCount')
+
+    fig = px.scatter_3d(
+        plot_data,
         x='PC 1',
         y='PC 2',
         z='PC 3',
         color='Class',
         hover_name='CoinName',
-        hover_data=['Algorithm', 'ProofType'],
-        title='<b>Cryptocurrency Clusters in 3D PCA Space</b>',
+        hover_data=hover_data,
+        title=title,
         labels={'Class': 'Cluster'},
         color_continuous_scale='Viridis',
         height=700
@@ -603,6 +615,150 @@ def create_modern_3d_scatter(data):
         hoverlabel=dict(bgcolor="white", font_size=12, font_family="Inter, sans-serif")
     )
 
+    if bounds:
+        axes = dict(zip(PCA_COLUMNS, ['xaxis', 'yaxis', 'zaxis']))
+        fig.update_layout(scene={axes[col]: dict(range=list(rng)) for col, rng in bounds.items()})
+
+    return fig
+
+
+def create_supply_scatter(data, log_axes=False, density=False, webgl=None, density_min_count=50):
+    """
+    Create supply vs mined scatter plot.
+
+    Large datasets render with WebGL traces; the scaled columns are computed
+    as arrays rather than added to a copy of the frame. In density mode,
+    hexbin cells holding at least `density_min_count` coins replace their
+    individual points.
+    """
+    if webgl is None:
+        webgl = len(data) > WEBGL_THRESHOLD
+    trace = go.Scattergl if webgl else go.Scatter
+
+    mined = data['TotalCoinsMined'].to_numpy(dtype=float) / 1e6
+    supply = data['TotalCoinSupply'].to_numpy(dtype=float) / 1e6
+    classes = data['Class'].to_numpy()
+    hover = np.column_stack([
+        data['CoinName'].to_numpy(),
+        data['Algorithm'].to_numpy(),
+        data['ProofType'].to_numpy()
+    ])
+
+    fig = go.Figure()
+    points = np.ones(len(data), dtype=bool)
+
+    if density and len(data) > 0:
+        # Log axes have no room for zero or negative values, so bin only plottable coins
+        plottable = (mined > 0) & (supply > 0) if log_axes else np.ones(len(data), dtype=bool)
+        bx = np.log10(mined[plottable]) if log_axes else mined
+        by = np.log10(supply[plottable]) if log_axes else supply
+
+        if plottable.any():
+            bins = hexbin(bx, by)
+            dense_cells = bins['count'] >= density_min_count
+            points[np.flatnonzero(plottable)[dense_cells[bins['cell']]]] = False
+
+            cell_x, cell_y = bins['x'][dense_cells], bins['y'][dense_cells]
+            if log_axes:
+                cell_x, cell_y = 10 ** cell_x, 10 ** cell_y
+
+            fig.add_trace(trace(
+                x=cell_x,
+                y=cell_y,
+                mode='markers',
+                name='Dense regions',
+                marker=dict(
+                    symbol='hexagon',
+                    size=14,
+                    color=np.log10(bins['count'][dense_cells]),
+                    colorscale='Blues',
+                    colorbar=dict(title='log10 coins', x=1.12)
+                ),
+                customdata=bins['count'][dense_cells],
+                hovertemplate='%{customdata:,} coins<extra></extra>'
+            ))
+
+    fig.add_trace(trace(
+        x=mined[points],
+        y=supply[points],
+        mode='markers',
+        name='Coins',
+        marker=dict(color=classes[points], colorscale='Viridis', colorbar=dict(title='Cluster'), size=7),
+        customdata=hover[points],
+        hovertemplate=(
+            '<b>%{customdata[0]}</b><br>'
+            'Algorithm: %{customdata[1]}<br>'
+            'ProofType: %{customdata[2]}<br>'
+            'Mined: %{x:,.2f}M<br>'
+            'Supply: %{y:,.2f}M<extra></extra>'
+        )
+    ))
+
+    axis_type = 'log' if log_axes else 'linear'
+    fig.update_layout(
+        title='<b>Total Coin Supply vs Total Coins Mined</b>',
+        xaxis=dict(title='Total Coins Mined (Millions)', type=axis_type),
+        yaxis=dict(title='Total Coin Supply (Millions)', type=axis_type),
+        showlegend=False,
+        height=500,
+        paper_bgcolor='rgba(255,255,255,0.95)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter, sans-serif')
+    )
+
+    return fig
+
+
+def create_algorithm_bar(summary):
+    """Create top algorithms bar chart from a market summary"""
+    algo_data = pd.DataFrame(list(summary['algorithm_distribution'].items()),
+                            columns=['Algorithm', 'Count'])
+    fig = px.bar(algo_data.head(10), x='Algorithm', y='Count',
+                title='<b>Top 10 Algorithms</b>',
+                color='Count',
+                color_continuous_scale='Viridis')
+
+    fig.update_layout(
+        paper_bgcolor='rgba(255,255,255,0.95)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter, sans-serif')
+    )
+
+    return fig
+
+
+def create_proof_pie(summary):
+    """Create proof type pie chart from a market summary"""
+    proof_data = pd.DataFrame(list(summary['proof_distribution'].items()),
+                             columns=['Proof Type', 'Count'])
+    fig = px.pie(proof_data, values='Count', names='Proof Type',
+                title='<b>Proof Type Distribution</b>',
+                color_discrete_sequence=px.colors.qualitative.Set3)
+
+    fig.update_layout(
+        paper_bgcolor='rgba(255,255,255,0.95)',
+        font=dict(family='Inter, sans-serif')
+    )
+
+    return fig
+
+
+def create_risk_bar(summary):
+    """Create cluster risk distribution bar chart from a market summary"""
+    risk_data = pd.DataFrame(list(summary['risk_distribution'].items()),
+                            columns=['Risk Level', 'Number of Clusters'])
+
+    fig = px.bar(risk_data, x='Risk Level', y='Number of Clusters',
+                color='Risk Level',
+                color_discrete_map={'Low': '#28a745', 'Medium': '#ffc107', 'High': '#dc3545'},
+                title='<b>Cluster Risk Distribution</b>')
+
+    fig.update_layout(
+        paper_bgcolor='rgba(255,255,255,0.95)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter, sans-serif')
+    )
+
     return fig
 
 
@@ -897,7 +1053,7 @@ def display_cluster_explorer(data, analyzer):
             st.dataframe(notable_df, use_container_width=True, hide_index=True)
 
 
-def display_visualizations(data):
+def display_visualizations(data, coin_index, version):
     """Interactive visualizations"""
     st.markdown('<h1 class="hero-header">Data Visualizations</h1>', unsafe_allow_html=True)
     st.markdown('<p class="hero-subtitle">Interactive charts and analysis</p>', unsafe_allow_html=True)
@@ -910,7 +1066,54 @@ def display_visualizations(data):
         st.markdown("### 3D Cluster Visualization")
         st.markdown("Rotate, zoom, and explore cryptocurrency clusters in PCA space")
 
-        fig = create_modern_3d_scatter(data)
+        with st.expander("Rendering options"):
+            col1, col2 = st.columns(2)
+            with col1:
+                max_points = st.number_input(
+                    "Point budget:",
+                    min_value=500,
+                    max_value=200000,
+                    value=DEFAULT_POINT_BUDGET,
+                    step=500,
+                    help="Large datasets are downsampled to this many points; outliers are always shown"
+                )
+            with col2:
+                method = st.selectbox(
+                    "Downsampling:",
+                    options=['stratified', 'voxel'],
+                    format_func=lambda x: 'Stratified per cluster' if x == 'stratified' else 'Voxel grid aggregation'
+                )
+
+            # Typed coins are resolved through the coin index, so large datasets
+            # never ship every coin name to the browser as widget options
+            keep_query = st.text_input(
+                "Always show coins:",
+                placeholder="Tickers or names, comma-separated (e.g. BTC, Ethereum)",
+                help="Listed coins are never dropped by downsampling"
+            )
+            keep_keys = [key.strip() for key in keep_query.split(',') if key.strip()]
+            keep_positions = [coin_index.positions(key) for key in keep_keys]
+            unknown = [key for key, positions in zip(keep_keys, keep_positions) if not positions]
+            if unknown:
+                st.caption(f"Not in this dataset: {', '.join(unknown)}")
+            keep_coins = sorted(set(data['CoinName'].iloc[sum(keep_positions, [])]))
+
+            # Zooming into a region spends the same budget on fewer coins
+            bounds = {}
+            zoom_cols = st.columns(3)
+            for zoom_col, pc in zip(zoom_cols, PCA_COLUMNS):
+                low, high = float(data[pc].min()), float(data[pc].max())
+                with zoom_col:
+                    selected = st.slider(f"{pc} range:", low, high, (low, high))
+                if selected != (low, high):
+                    bounds[pc] = selected
+
+        fig = FIGURE_CACHE.get_or_build(
+            'scatter_3d', version,
+            lambda: create_modern_3d_scatter(data, max_points, method, keep_coins, bounds),
+            params={'max_points': max_points, 'method': method,
+                    'keep_coins': sorted(keep_coins), 'bounds': bounds}
+        )
         st.plotly_chart(fig, use_container_width=True)
 
         st.info("""
@@ -921,33 +1124,19 @@ def display_visualizations(data):
     with tab2:
         st.markdown("### Supply vs Mined Analysis")
 
-        data_scaled = data.copy()
-        data_scaled['TotalCoinSupply_scaled'] = data_scaled['TotalCoinSupply'] / 1e6
-        data_scaled['TotalCoinsMined_scaled'] = data_scaled['TotalCoinsMined'] / 1e6
-
-        fig = px.scatter(
-            data_scaled,
-            x='TotalCoinsMined_scaled',
-            y='TotalCoinSupply_scaled',
-            color='Class',
-            hover_name='CoinName',
-            hover_data=['Algorithm', 'ProofType'],
-            title='<b>Total Coin Supply vs Total Coins Mined</b>',
-            labels={
-                'TotalCoinsMined_scaled': 'Total Coins Mined (Millions)',
-                'TotalCoinSupply_scaled': 'Total Coin Supply (Millions)',
-                'Class': 'Cluster'
-            },
-            color_continuous_scale='Viridis',
-            height=500
-        )
+        col1, col2 = st.columns(2)
+        with col1:
+            log_axes = st.checkbox("Log axes", value=False,
+                                   help="Coins with zero supply or mined are hidden on log axes")
+        with col2:
+            density = st.checkbox("Density view (hexbin)", value=len(data) > 50000,
+                                  help="Aggregate very dense regions into hexagonal bins")
 
-        fig.update_layout(
-            paper_bgcolor='rgba(255,255,255,0.95)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter, sans-serif')
+        fig = FIGURE_CACHE.get_or_build(
+            'supply_scatter', version,
+            lambda: create_supply_scatter(data, log_axes=log_axes, density=density),
+            params={'log_axes': log_axes, 'density': density}
         )
-
         st.plotly_chart(fig, use_container_width=True)
 
         st.info("""
@@ -976,24 +1165,25 @@ def display_visualizations(data):
             )
 
         with col3:
-            search_term = st.text_input("Search coin name:", "")
+            search_term = st.text_input("Search coin name or ticker:", "").strip()
 
         # Apply filters
-        filtered_data = data[
-            (data['Class'].isin(selected_clusters)) &
-            (data['Algorithm'].isin(selected_algos))
-        ]
+        mask = data['Class'].isin(selected_clusters) & data['Algorithm'].isin(selected_algos)
 
+        # A search shows coins whose name contains the term plus the coin
+        # whose ticker is the term (looked up in the index)
         if search_term:
-            filtered_data = filtered_data[
-                filtered_data['CoinName'].str.contains(search_term, case=False, na=False)
-            ]
+            matches = data['CoinName'].str.contains(search_term, case=False, na=False, regex=False).to_numpy(copy=True)
+            matches[coin_index.positions(search_term)] = True
+            mask &= matches
+
+        filtered_data = data[mask]
 
         st.dataframe(filtered_data, use_container_width=True)
         st.caption(f"Showing {len(filtered_data)} of {len(data)} cryptocurrencies")
 
 
-def display_market_analysis(data, analyzer):
+def display_market_analysis(data, analyzer, version):
     """Market analysis page"""
     st.markdown('<h1 class="hero-header">Market Analysis</h1>', unsafe_allow_html=True)
     st.markdown('<p class="hero-subtitle">Comprehensive market intelligence</p>', unsafe_allow_html=True)
@@ -1019,49 +1209,17 @@ def display_market_analysis(data, analyzer):
 
     with col1:
         st.markdown("### Algorithm Distribution")
-        algo_data = pd.DataFrame(list(summary['algorithm_distribution'].items()),
-                                columns=['Algorithm', 'Count'])
-        fig = px.bar(algo_data.head(10), x='Algorithm', y='Count',
-                    title='<b>Top 10 Algorithms</b>',
-                    color='Count',
-                    color_continuous_scale='Viridis')
-
-        fig.update_layout(
-            paper_bgcolor='rgba(255,255,255,0.95)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter, sans-serif')
-        )
+        fig = FIGURE_CACHE.get_or_build('algorithm_bar', version, lambda: create_algorithm_bar(summary))
         st.plotly_chart(fig, use_container_width=True)
 
     with col2:
         st.markdown("### Proof Type Distribution")
-        proof_data = pd.DataFrame(list(summary['proof_distribution'].items()),
-                                 columns=['Proof Type', 'Count'])
-        fig = px.pie(proof_data, values='Count', names='Proof Type',
-                    title='<b>Proof Type Distribution</b>',
-                    color_discrete_sequence=px.colors.qualitative.Set3)
-
-        fig.update_layout(
-            paper_bgcolor='rgba(255,255,255,0.95)',
-            font=dict(family='Inter, sans-serif')
-        )
+        fig = FIGURE_CACHE.get_or_build('proof_pie', version, lambda: create_proof_pie(summary))
         st.plotly_chart(fig, use_container_width=True)
 
     # Risk distribution
     st.markdown("### Risk Distribution Across Clusters")
-    risk_data = pd.DataFrame(list(summary['risk_distribution'].items()),
-                            columns=['Risk Level', 'Number of Clusters'])
-
-    fig = px.bar(risk_data, x='Risk Level', y='Number of Clusters',
-                color='Risk Level',
-                color_discrete_map={'Low': '#28a745', 'Medium': '#ffc107', 'High': '#dc3545'},
-                title='<b>Cluster Risk Distribution</b>')
-
-    fig.update_layout(
-        paper_bgcolor='rgba(255,255,255,0.95)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(family='Inter, sans-serif')
-    )
+    fig = FIGURE_CACHE.get_or_build('risk_bar', version, lambda: create_risk_bar(summary))
     st.plotly_chart(fig, use_container_width=True)
 
 
@@ -1141,6 +1299,85 @@ def display_generate_report(analyzer):
         """)
 
 
+def display_about():
+    """About page"""
+    st.markdown('<h1 class="hero-header">About This Platform</h1>', unsafe_allow_html=True)
+    st.markdown("""
+    This platform was built by a Senior AI Product Manager with 20 years of experience
+    in building and scaling data-driven products.
+
+    ### What Makes This Different
+
+    Most crypto analytics tools overwhelm you with data. This platform uses machine learning
+    to find patterns and Gen AI to explain them in plain English. No PhD required.
+
+    ### Technical Approach
+
+    We use K-means clustering with PCA to group 500+ cryptocurrencies by their fundamental
+    characteristics. Then AI generates insights that actually matter for investment decisions.
+
+    ### Who Is This For
+
+    - Retail investors who want smarter analysis
+    - Portfolio managers looking for efficiency
+    - Researchers studying market patterns
+    - Anyone tired of information overload
+    """)
+
+
+def display_documentation():
+    """Documentation page"""
+    st.markdown('<h1 class="hero-header">Documentation</h1>', unsafe_allow_html=True)
+    st.markdown("""
+    ### Quick Links
+
+    - [Complete Technical Documentation](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/README_ENHANCED.md)
+    - [Portfolio Showcase Guide](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/PORTFOLIO_SHOWCASE.md)
+    - [AI PM Methodology](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/AI_PM_APPROACH.md)
+    - [GitHub Repository](https://github.com/rahul99gangu/Cryptocurrencies)
+
+    ### How to Use
+
+    1. **Overview**: See market trends and cluster distribution
+    2. **Cluster Explorer**: Deep dive into specific cryptocurrency groups
+    3. **Visualizations**: Interactive 3D plots and charts
+    4. **Market Analysis**: Distribution and risk metrics
+    5. **Generate Report**: Export comprehensive analysis
+    """)
+
+
+def display_contact():
+    """Contact page"""
+    st.markdown('<h1 class="hero-header">Contact</h1>', unsafe_allow_html=True)
+    st.markdown("""
+    ### Get In Touch
+
+    For questions, feedback, or collaboration:
+
+    - **GitHub**: [rahul99gangu/Cryptocurrencies](https://github.com/rahul99gangu/Cryptocurrencies)
+    - **Issues**: [Report a bug](https://github.com/rahul99gangu/Cryptocurrencies/issues)
+
+    ### Built With
+
+    Python • Streamlit • Scikit-learn • Plotly • Gen AI
+    """)
+
+
+# Page name -> (render function, data products the page needs).
+# Pages that need nothing render without loading data or fitting models.
+PAGES = {
+    "Overview": (display_modern_overview, ('data', 'analyzer')),
+    "Executive Dashboard": (display_modern_executive_dashboard, ()),
+    "Cluster Explorer": (display_cluster_explorer, ('data', 'analyzer')),
+    "Visualizations": (display_visualizations, ('data', 'coin_index', 'version')),
+    "Market Analysis": (display_market_analysis, ('data', 'analyzer', 'version')),
+    "Generate Report": (display_generate_report, ('analyzer',)),
+    "About": (display_about, ()),
+    "Documentation": (display_documentation, ()),
+    "Contact": (display_contact, ())
+}
+
+
 def main():
     """Main application"""
 
@@ -1154,6 +1391,18 @@ def main():
         </div>
         """, unsafe_allow_html=True)
 
+        # Stored daily snapshots, offered only when the snapshot store has any
+        snapshot = None
+        dates = snapshot_dates(SNAPSHOT_DIR)
+        if dates:
+            st.markdown("**Data Source**")
+            snapshot = st.selectbox(
+                "Select dataset:",
+                options=[None] + dates,
+                format_func=lambda date: "Bundled dataset" if date is None else f"Snapshot {date}",
+                label_visibility="collapsed"
+            )
+
         page_category = st.radio(
             "Navigation",
             ["Executive View", "Technical Analysis", "Resources"],
@@ -1194,88 +1443,46 @@ def main():
         </div>
         """, unsafe_allow_html=True)
 
-    # Load data with loading indicator
+    render, needs = PAGES.get(page, (None, ()))
+
+    products = DataProducts(
+        dataset=lambda p: load_dataset(snapshot),
+        data=lambda p: p['dataset'][0],
+        version=lambda p: p['dataset'][1],
+        analyzer=lambda p: get_shared_analyzer(p['data'], p['version']),
+        coin_index=lambda p: p['analyzer'].coin_index
+    )
+
+    # Load only the data products this page declared
     try:
         with st.spinner("Loading market data..."):
-            data = load_sample_data()
-            analyzer = CryptoAIAnalyzer(data)
+            page_products = products.resolve(needs)
     except Exception as e:
         st.error(f"Error loading data: {e}")
         st.info("Please ensure all required files are present.")
         st.stop()
         return
 
-    # Display compact header
-    display_compact_header(data)
-
-    # Page routing
-    if page == "Overview":
-        display_modern_overview(data, analyzer)
-    elif page == "Executive Dashboard":
-        display_modern_executive_dashboard()
-    elif page == "Cluster Explorer":
-        display_cluster_explorer(data, analyzer)
-    elif page == "Visualizations":
-        display_visualizations(data)
-    elif page == "Market Analysis":
-        display_market_analysis(data, analyzer)
-    elif page == "Generate Report":
-        display_generate_report(analyzer)
-    elif page == "About":
-        st.markdown('<h1 class="hero-header">About This Platform</h1>', unsafe_allow_html=True)
-        st.markdown("""
-        This platform was built by a Senior AI Product Manager with 20 years of experience
-        in building and scaling data-driven products.
-
-        ### What Makes This Different
-
-        Most crypto analytics tools overwhelm you with data. This platform uses machine learning
-        to find patterns and Gen AI to explain them in plain English. No PhD required.
-
-        ### Technical Approach
-
-        We use K-means clustering with PCA to group 500+ cryptocurrencies by their fundamental
-        characteristics. Then AI generates insights that actually matter for investment decisions.
-
-        ### Who Is This For
-
-        - Retail investors who want smarter analysis
-        - Portfolio managers looking for efficiency
-        - Researchers studying market patterns
-        - Anyone tired of information overload
-        """)
-    elif page == "Documentation":
-        st.markdown('<h1 class="hero-header">Documentation</h1>', unsafe_allow_html=True)
-        st.markdown("""
-        ### Quick Links
-
-        - [Complete Technical Documentation](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/README_ENHANCED.md)
-        - [Portfolio Showcase Guide](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/PORTFOLIO_SHOWCASE.md)
-        - [AI PM Methodology](https://github.com/rahul99gangu/Cryptocurrencies/blob/main/AI_PM_APPROACH.md)
-        - [GitHub Repository](https://github.com/rahul99gangu/Cryptocurrencies)
-
-        ### How to Use
-
-        1. **Overview**: See market trends and cluster distribution
-        2. **Cluster Explorer**: Deep dive into specific cryptocurrency groups
-        3. **Visualizations**: Interactive 3D plots and charts
-        4. **Market Analysis**: Distribution and risk metrics
-        5. **Generate Report**: Export comprehensive analysis
-        """)
-    elif page == "Contact":
-        st.markdown('<h1 class="hero-header">Contact</h1>', unsafe_allow_html=True)
-        st.markdown("""
-        ### Get In Touch
+    with st.sidebar:
+        build_stats = analyzer_construction_stats()
+        st.caption(
+            f"Analyzer builds this process: {build_stats['count']} "
+            f"(last {build_stats['last_seconds'] * 1000:.0f} ms)"
+        )
 
-        For questions, feedback, or collaboration:
+    if needs:
+        data = products['data']
 
-        - **GitHub**: [rahul99gangu/Cryptocurrencies](https://github.com/rahul99gangu/Cryptocurrencies)
-        - **Issues**: [Report a bug](https://github.com/rahul99gangu/Cryptocurrencies/issues)
+        # Display compact header
+        display_compact_header(data)
 
-        ### Built With
+    # Page routing
+    if render is not None:
+        with PAGE_PROFILER.profile('page', page):
+            render(**page_products)
 
-        Python • Streamlit • Scikit-learn • Plotly • Gen AI
-        """)
+    with st.sidebar:
+        display_diagnostics_panel()
 
     # Footer
     st.markdown("<br><br>", unsafe_allow_html=True)
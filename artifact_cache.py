@@ -0,0 +1,131 @@
+"""
+Pipeline Artifact Cache
+
+Pickled pipeline results (clustered datasets, analyzers) keyed by the
+artifact name and the inputs they were computed from. Set
+CRYPTO_ARTIFACT_DIR to enable it; warmup.py fills it before the app
+starts, so new server processes load finished artifacts instead of
+re-running the CSV load, scikit-learn import and model fit.
+
+Without a cache directory every lookup misses and artifacts are simply
+rebuilt, which keeps the apps working unchanged.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+# Bump when a pipeline change makes previously stored artifacts invalid
+ARTIFACT_VERSION = 7
+
+
+def file_fingerprint(path: str) -> str:
+    """
+    Content hash of an input file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest identifying the file contents
+    """
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+class ArtifactCache:
+    """
+    Disk cache of pickled pipeline artifacts.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the artifact cache.
+
+        Args:
+            cache_dir: Directory holding the artifacts (None disables the cache)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.hits = 0
+        self.misses = 0
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether artifacts are persisted."""
+        return self.cache_dir is not None
+
+    @staticmethod
+    def make_key(name: str, inputs: Optional[Dict[str, Any]] = None) -> str:
+        """Build a cache key from the artifact name and the inputs it depends on."""
+        payload = json.dumps({'version': ARTIFACT_VERSION, 'inputs': inputs or {}},
+                             sort_keys=True, default=str)
+        digest = hashlib.sha1(payload.encode()).hexdigest()[:16]
+        return f"{name}-{digest}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a stored artifact, or None if it is missing or unreadable."""
+        if self.cache_dir is None:
+            return None
+
+        path = self.cache_dir / f"{key}.pkl"
+        try:
+            with open(path, 'rb') as f:
+                artifact = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return artifact
+
+    def put(self, key: str, artifact: Any) -> None:
+        """Store an artifact (no-op when the cache is disabled)."""
+        if self.cache_dir is None:
+            return
+
+        path = self.cache_dir / f"{key}.pkl"
+        # Unique temp file per write: app sessions are threads of one process
+        with tempfile.NamedTemporaryFile(dir=self.cache_dir, prefix=path.name, suffix='.tmp',
+                                         delete=False) as f:
+            pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f.name, path)
+
+    def get_or_build(self, name: str, inputs: Optional[Dict[str, Any]], builder: Callable) -> Any:
+        """
+        Return a stored artifact, building and storing it on a miss.
+
+        Args:
+            name: Artifact name, e.g. 'clustered'
+            inputs: Values the artifact depends on (file fingerprints, parameters)
+            builder: Zero-argument callable producing the artifact
+
+        Returns:
+            The artifact
+        """
+        key = self.make_key(name, inputs)
+        artifact = self.get(key)
+
+        if artifact is None:
+            artifact = builder()
+            self.put(key, artifact)
+
+        return artifact
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the cache directory."""
+        return {'cache_dir': str(self.cache_dir) if self.cache_dir else None,
+                'hits': self.hits, 'misses': self.misses}
+
+
+# Process-wide artifact cache, enabled by CRYPTO_ARTIFACT_DIR
+ARTIFACT_CACHE = ArtifactCache(os.environ.get('CRYPTO_ARTIFACT_DIR'))
@@ -0,0 +1,273 @@
+"""
+Pipeline Benchmark Suite
+
+Times every stage of the clustering and analysis pipeline on synthetic
+coin universes and writes the results as JSON, so runs from different
+commits can be compared:
+
+    python benchmark.py --sizes 1000 10000 --output bench_new.json
+    python benchmark.py --compare bench_old.json bench_new.json
+
+By default synthetic coins have uniform algorithm/proof choices and
+exponential supply and mined amounts, as the apps' original fallback data did.
+Pass --realistic to use synthetic_data.CoinGenerator instead (heavy-tailed
+supplies, Zipf-distributed categories).
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from crypto_ai_insights import CryptoAIAnalyzer
+from crypto_pipeline import ClusteringModel, clean_coin_data
+from synthetic_data import CoinGenerator
+
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+# Stages mirror the apps' build: clean_coin_data, ClusteringModel.fit_basis
+# (encode, scale, PCA) and fit_clusters with the apps' random_state
+STAGES = ['csv_load', 'cleaning', 'fit_basis', 'fit_clusters', 'analyzer_init',
+          'profile_generation', 'report_export', 'prompt_generation']
+
+RANDOM_STATE = 42
+
+COMPARISON_COLUMNS = ['n_coins', 'stage', 'baseline_s', 'current_s', 'ratio', 'regression']
+
+
+def make_coin_universe(n_coins: int, seed: int = 42, realistic: bool = False) -> pd.DataFrame:
+    """
+    Generate raw coin data with uniform categories and exponential supplies.
+
+    Args:
+        n_coins: Number of coins
+        seed: Random seed
+        realistic: Use CoinGenerator's heavy-tailed, Zipf-distributed data instead
+
+    Returns:
+        DataFrame in the crypto_data.csv layout, indexed by ticker
+    """
+    if realistic:
+        return CoinGenerator(seed=seed).generate(n_coins)
+
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'CoinName': [f'Coin_{i}' for i in range(n_coins)],
+        'Algorithm': rng.choice(['SHA-256', 'Beacon Chain', 'Proof-of-History', 'Scrypt'], n_coins),
+        'IsTrading': True,
+        'ProofType': rng.choice(['PoW', 'PoS', 'PoH', 'DPoS'], n_coins),
+        'TotalCoinsMined': rng.exponential(1e7, n_coins),
+        'TotalCoinSupply': rng.exponential(1e8, n_coins)
+    }, index=pd.Index([f'C{i}' for i in range(n_coins)], name='Ticker'))
+
+
+def _timed(timings: Dict[str, List[float]], stage: str, func: Callable):
+    """Run func, record its wall time under stage and return its result."""
+    start = time.perf_counter()
+    result = func()
+    timings.setdefault(stage, []).append(time.perf_counter() - start)
+    return result
+
+
+def run_pipeline_once(csv_path: str, work_dir: str, n_clusters: int = 4,
+                      random_state: int = RANDOM_STATE) -> Dict[str, List[float]]:
+    """
+    Run every pipeline stage once on a CSV and time each stage.
+
+    Clustering goes through ClusteringModel exactly as the apps'
+    cluster_coin_data does, so the timings cover the production code path.
+
+    Args:
+        csv_path: Raw coin CSV
+        work_dir: Directory for exported reports
+        n_clusters: Number of KMeans clusters
+        random_state: Seed for PCA and KMeans (the apps use 42)
+
+    Returns:
+        Dictionary mapping stage name to a one-element list of seconds
+    """
+    timings: Dict[str, List[float]] = {}
+    model = ClusteringModel(n_clusters=n_clusters, random_state=random_state)
+
+    raw = _timed(timings, 'csv_load', lambda: pd.read_csv(csv_path, index_col=0))
+    cleaned = _timed(timings, 'cleaning', lambda: clean_coin_data(raw))
+    points = _timed(timings, 'fit_basis', lambda: model.fit_basis(cleaned))
+    labels = _timed(timings, 'fit_clusters', lambda: model.fit_clusters(points))
+    clustered = model.label_frame(cleaned, points, labels)
+
+    analyzer = _timed(timings, 'analyzer_init', lambda: CryptoAIAnalyzer(clustered))
+    cluster_ids = sorted(analyzer.cluster_stats)
+
+    _timed(timings, 'profile_generation',
+           lambda: [analyzer.generate_cluster_profile(cid) for cid in cluster_ids])
+    _timed(timings, 'report_export',
+           lambda: analyzer.export_analysis_report(os.path.join(work_dir, 'report.md')))
+    _timed(timings, 'prompt_generation',
+           lambda: [analyzer.generate_llm_prompt_for_insights(cid) for cid in cluster_ids])
+
+    return timings
+
+
+def benchmark_size(n_coins: int, repeat: int = 3, seed: int = 42, realistic: bool = False) -> Dict:
+    """
+    Benchmark the full pipeline on one synthetic universe size.
+
+    Args:
+        n_coins: Number of coins
+        repeat: Number of timed runs (the best and median are reported)
+        seed: Random seed for the synthetic data
+        realistic: Benchmark on CoinGenerator data instead of fallback-style data
+
+    Returns:
+        Dictionary with per-stage best/median seconds and the total
+    """
+    with tempfile.TemporaryDirectory() as work_dir:
+        csv_path = os.path.join(work_dir, 'coins.csv')
+        make_coin_universe(n_coins, seed, realistic).to_csv(csv_path)
+
+        timings: Dict[str, List[float]] = {}
+        for _ in range(repeat):
+            for stage, seconds in run_pipeline_once(csv_path, work_dir).items():
+                timings.setdefault(stage, []).extend(seconds)
+
+    stages = {
+        stage: {'best': min(timings[stage]), 'median': float(np.median(timings[stage]))}
+        for stage in STAGES
+    }
+    return {
+        'n_coins': n_coins,
+        'repeat': repeat,
+        'stages': stages,
+        'total_best': sum(s['best'] for s in stages.values())
+    }
+
+
+def environment_info() -> Dict:
+    """Describe the commit and library versions a benchmark ran against."""
+    import sklearn
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ''
+
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit or None,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'scikit-learn': sklearn.__version__
+    }
+
+
+def run_benchmarks(sizes: List[int], repeat: int = 3, seed: int = 42, realistic: bool = False) -> Dict:
+    """
+    Benchmark every size and collect the results with environment metadata.
+
+    Args:
+        sizes: Universe sizes to benchmark
+        repeat: Timed runs per size
+        seed: Random seed
+        realistic: Benchmark on CoinGenerator data
+
+    Returns:
+        JSON-ready benchmark results
+    """
+    results = []
+    for n_coins in sizes:
+        print(f"Benchmarking {n_coins:,} coins...", file=sys.stderr)
+        result = benchmark_size(n_coins, repeat, seed, realistic)
+        print(f"  total {result['total_best']:.3f}s", file=sys.stderr)
+        results.append(result)
+
+    return {'environment': environment_info(), 'data': 'realistic' if realistic else 'fallback',
+            'results': results}
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float = 0.10) -> pd.DataFrame:
+    """
+    Compare two benchmark files stage by stage.
+
+    Args:
+        baseline: Results from an earlier run
+        current: Results from the run under test
+        threshold: Relative slowdown of the best time flagged as a regression
+
+    Returns:
+        DataFrame with baseline/current seconds, ratio and regression flag
+        (empty, with the same columns, if the runs share no size and stage)
+    """
+    baseline_by_size = {r['n_coins']: r for r in baseline['results']}
+    rows = []
+
+    for result in current['results']:
+        before = baseline_by_size.get(result['n_coins'])
+        if before is None:
+            continue
+        for stage, seconds in result['stages'].items():
+            if stage not in before['stages']:
+                continue
+            old = before['stages'][stage]['best']
+            new = seconds['best']
+            ratio = new / old if old > 0 else float('nan')
+            rows.append({
+                'n_coins': result['n_coins'],
+                'stage': stage,
+                'baseline_s': old,
+                'current_s': new,
+                'ratio': ratio,
+                'regression': ratio > 1 + threshold
+            })
+
+    return pd.DataFrame(rows, columns=COMPARISON_COLUMNS)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the clustering and analysis pipeline")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--realistic', action='store_true',
+                        help="Use heavy-tailed synthetic_data coins instead of fallback-style coins")
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'),
+                        help="Compare two result files instead of running benchmarks")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Relative slowdown reported as a regression")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            baseline = json.load(f)
+        with open(args.compare[1]) as f:
+            current = json.load(f)
+        comparison = compare_results(baseline, current, args.threshold)
+        if comparison.empty:
+            print("No coin count and stage appear in both result files; nothing to compare")
+            return 0
+        print(comparison.to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+        return 1 if comparison['regression'].any() else 0
+
+    results = run_benchmarks(args.sizes, args.repeat, args.seed, args.realistic)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,389 @@
+"""
+Cluster Drift Tracking
+
+KMeans numbers its clusters arbitrarily, so cluster 2 today has no relation
+to cluster 2 yesterday. This module keeps labels stable between snapshots
+and reports what moved:
+
+- Refits are aligned to the previous labels with the Hungarian algorithm
+  on centroid distance.
+- Incremental updates reuse the frozen model and only project, assign and
+  re-average the coins that were added, removed or changed.
+
+track_snapshots() replays a snapshot store through a tracker; the apps
+load stored snapshots this way, so a coin keeps its cluster number from
+one day to the next. With a state directory the tracker is saved after
+every date, and later calls resume from the nearest saved date instead
+of replaying history: a new day costs one incremental update.
+"""
+
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from crypto_pipeline import CATEGORY_FEATURES, NUMERIC_FEATURES, PCA_COLUMNS, ClusteringModel, clean_coin_data
+
+
+def cluster_centroids(points: np.ndarray, labels: np.ndarray) -> Dict[int, np.ndarray]:
+    """
+    Average points per cluster label.
+
+    Args:
+        points: Coordinates, shape (n_coins, n_dims)
+        labels: Cluster label per coin
+
+    Returns:
+        Dictionary mapping label to centroid
+    """
+    return {int(label): points[labels == label].mean(axis=0) for label in np.unique(labels)}
+
+
+def align_labels(previous: Dict[int, np.ndarray], current: Dict[int, np.ndarray]) -> Dict[int, int]:
+    """
+    Match current clusters to previous ones by minimum total centroid distance.
+
+    Both centroid sets must live in the same coordinate space. Current
+    clusters left unmatched (when k grows) get new labels after the largest
+    previous label.
+
+    Args:
+        previous: Previous label -> centroid
+        current: Current label -> centroid
+
+    Returns:
+        Mapping from current label to aligned label
+    """
+    from scipy.optimize import linear_sum_assignment
+
+    prev_labels = sorted(previous)
+    curr_labels = sorted(current)
+    if not prev_labels:
+        return {label: label for label in curr_labels}
+
+    prev_matrix = np.array([previous[label] for label in prev_labels])
+    curr_matrix = np.array([current[label] for label in curr_labels])
+    cost = np.linalg.norm(curr_matrix[:, None, :] - prev_matrix[None, :, :], axis=2)
+
+    rows, cols = linear_sum_assignment(cost)
+    mapping = {curr_labels[r]: prev_labels[c] for r, c in zip(rows, cols)}
+
+    next_label = max(prev_labels) + 1
+    for label in curr_labels:
+        if label not in mapping:
+            mapping[label] = next_label
+            next_label += 1
+
+    return mapping
+
+
+def changed_coins(previous: pd.DataFrame, current: pd.DataFrame) -> Dict[str, pd.Index]:
+    """
+    Find coins added, removed or modified between two cleaned snapshots.
+
+    Args:
+        previous: Previous cleaned coin DataFrame indexed by ticker
+        current: Current cleaned coin DataFrame indexed by ticker
+
+    Returns:
+        Dictionary with 'added', 'removed' and 'modified' ticker indexes
+    """
+    columns = NUMERIC_FEATURES + CATEGORY_FEATURES
+    common = previous.index.intersection(current.index)
+
+    before = previous.loc[common, columns]
+    after = current.loc[common, columns]
+    differs = ~((before == after) | (before.isna() & after.isna())).all(axis=1)
+
+    return {
+        'added': current.index.difference(previous.index),
+        'removed': previous.index.difference(current.index),
+        'modified': common[differs.to_numpy()]
+    }
+
+
+def drift_report(previous_labels: pd.Series, current_labels: pd.Series,
+                 previous_centroids: Dict[int, np.ndarray],
+                 current_centroids: Dict[int, np.ndarray]) -> Dict:
+    """
+    Summarize cluster drift between two aligned labelings.
+
+    Args:
+        previous_labels: Previous cluster label per ticker
+        current_labels: Current (aligned) cluster label per ticker
+        previous_centroids: Previous centroids in the current coordinate space
+        current_centroids: Current centroids
+
+    Returns:
+        JSON-ready dictionary with moved, added and removed coins, centroid
+        movement and size changes per cluster
+    """
+    common = previous_labels.index.intersection(current_labels.index)
+    before = previous_labels.loc[common]
+    after = current_labels.loc[common]
+    moved = common[(before != after).to_numpy()]
+
+    prev_sizes = previous_labels.value_counts()
+    curr_sizes = current_labels.value_counts()
+    clusters = sorted(set(prev_sizes.index) | set(curr_sizes.index))
+
+    centroid_shift = {}
+    for cluster in clusters:
+        if cluster in previous_centroids and cluster in current_centroids:
+            shift = np.linalg.norm(current_centroids[cluster] - previous_centroids[cluster])
+            centroid_shift[int(cluster)] = round(float(shift), 6)
+
+    return {
+        'moved_coins': [
+            {'coin': str(ticker), 'from': int(before[ticker]), 'to': int(after[ticker])}
+            for ticker in moved
+        ],
+        'added_coins': [str(t) for t in current_labels.index.difference(previous_labels.index)],
+        'removed_coins': [str(t) for t in previous_labels.index.difference(current_labels.index)],
+        'centroid_shift': centroid_shift,
+        'size_change': {
+            int(cluster): {
+                'previous': int(prev_sizes.get(cluster, 0)),
+                'current': int(curr_sizes.get(cluster, 0)),
+                'change': int(curr_sizes.get(cluster, 0) - prev_sizes.get(cluster, 0))
+            }
+            for cluster in clusters
+        }
+    }
+
+
+class DriftTracker:
+    """
+    Keeps cluster labels stable across daily snapshots.
+
+    Holds the frozen model, each coin's PCA coordinates and label, and
+    per-cluster coordinate sums so centroids can be updated incrementally.
+    """
+
+    def __init__(self, n_clusters: int = 4, random_state: int = 42):
+        """
+        Initialize an empty tracker.
+
+        Args:
+            n_clusters: Number of KMeans clusters
+            random_state: Seed for KMeans
+        """
+        self.n_clusters = n_clusters
+        self.random_state = random_state
+        self.model: Optional[ClusteringModel] = None
+        self.data: Optional[pd.DataFrame] = None
+        self.coords: Optional[pd.DataFrame] = None
+        self.labels: Optional[pd.Series] = None
+        # Drift report of the most recent update
+        self.report: Dict = {}
+        self._sums: Dict[int, np.ndarray] = {}
+        self._counts: Dict[int, int] = {}
+
+    @property
+    def centroids(self) -> Dict[int, np.ndarray]:
+        """Current centroids (running means) in the model's PCA space."""
+        return {label: self._sums[label] / self._counts[label]
+                for label in self._sums if self._counts[label] > 0}
+
+    def _reset_sums(self) -> None:
+        points = self.coords.to_numpy()
+        labels = self.labels.to_numpy()
+        self._sums = {}
+        self._counts = {}
+        for label in np.unique(labels):
+            mask = labels == label
+            self._sums[int(label)] = points[mask].sum(axis=0)
+            self._counts[int(label)] = int(mask.sum())
+
+    def _clustered_frame(self) -> pd.DataFrame:
+        return self.model.label_frame(self.data, self.coords.loc[self.data.index].to_numpy(),
+                                      self.labels.loc[self.data.index].to_numpy())
+
+    def start(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fit the first snapshot.
+
+        Args:
+            data: Cleaned coin DataFrame indexed by ticker
+
+        Returns:
+            Clustered DataFrame
+        """
+        self.model = ClusteringModel(n_clusters=self.n_clusters, random_state=self.random_state)
+        clustered = self.model.fit_transform_frame(data)
+
+        self.data = data
+        self.coords = clustered[PCA_COLUMNS[:self.model.n_components]]
+        self.labels = clustered['Class'].astype(int)
+        self._reset_sums()
+
+        return self._clustered_frame()
+
+    def update(self, data: pd.DataFrame, refit: bool = False) -> Tuple[pd.DataFrame, Dict]:
+        """
+        Cluster a new snapshot with labels aligned to the previous one.
+
+        Args:
+            data: Cleaned coin DataFrame indexed by ticker
+            refit: Refit the whole pipeline instead of updating incrementally
+
+        Returns:
+            Tuple of (clustered DataFrame, drift report)
+        """
+        if self.model is None:
+            clustered = self.start(data)
+            report = drift_report(pd.Series(dtype=int), pd.Series(dtype=int), {}, {})
+        elif refit:
+            clustered, report = self._refit(data)
+        else:
+            clustered, report = self._incremental(data)
+
+        self.report = report
+        return clustered, report
+
+    def clustered(self) -> pd.DataFrame:
+        """Clustered DataFrame of the latest snapshot (e.g. after load())."""
+        return self._clustered_frame()
+
+    def _incremental(self, data: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
+        """Project and assign only added or modified coins with the frozen model."""
+        changes = changed_coins(self.data, data)
+        previous_labels = self.labels.copy()
+        previous_centroids = self.centroids
+
+        # Remove the old contribution of removed and modified coins
+        outgoing = changes['removed'].append(changes['modified'])
+        points = self.coords.loc[outgoing].to_numpy()
+        for label, point in zip(self.labels.loc[outgoing].to_numpy(), points):
+            self._sums[int(label)] = self._sums[int(label)] - point
+            self._counts[int(label)] -= 1
+
+        incoming = changes['added'].append(changes['modified'])
+        if len(incoming) > 0:
+            new_points = self.model.project(data.loc[incoming])
+            centroid_labels = np.array(sorted(previous_centroids))
+            centroid_matrix = np.array([previous_centroids[label] for label in centroid_labels])
+            distance = np.linalg.norm(new_points[:, None, :] - centroid_matrix[None, :, :], axis=2)
+            new_labels = centroid_labels[distance.argmin(axis=1)]
+
+            for label, point in zip(new_labels, new_points):
+                self._sums[int(label)] = self._sums[int(label)] + point
+                self._counts[int(label)] += 1
+        else:
+            new_points = np.empty((0, self.coords.shape[1]))
+            new_labels = np.empty(0, dtype=int)
+
+        keep = self.labels.index.difference(outgoing)
+        self.coords = pd.concat([
+            self.coords.loc[keep],
+            pd.DataFrame(new_points, index=incoming, columns=self.coords.columns)
+        ])
+        self.labels = pd.concat([self.labels.loc[keep], pd.Series(new_labels, index=incoming, dtype=int)])
+        self.data = data
+
+        report = drift_report(previous_labels, self.labels, previous_centroids, self.centroids)
+        return self._clustered_frame(), report
+
+    def _refit(self, data: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
+        """Refit the pipeline, warm-started and aligned to the previous labels."""
+        previous_labels = self.labels.copy()
+
+        # Fit the new PCA space first and express the previous clusters in it
+        # via the coins both snapshots share, then warm-start KMeans from them
+        model = ClusteringModel(n_clusters=self.n_clusters, random_state=self.random_state)
+        points = model.fit_basis(data)
+        common = data.index.intersection(previous_labels.index)
+        positions = data.index.get_indexer(common)
+        previous_centroids = cluster_centroids(points[positions], previous_labels.loc[common].to_numpy())
+
+        init = None
+        if len(previous_centroids) == self.n_clusters:
+            init = np.array([previous_centroids[label] for label in sorted(previous_centroids)])
+        raw_labels = model.fit_clusters(points, init_centroids=init)
+
+        mapping = align_labels(previous_centroids, cluster_centroids(points, raw_labels))
+        clustered = model.label_frame(data, points, pd.Series(raw_labels).map(mapping).to_numpy())
+
+        self.model = model
+        self.data = data
+        self.coords = clustered[PCA_COLUMNS[:model.n_components]]
+        self.labels = clustered['Class'].astype(int)
+        self._reset_sums()
+
+        report = drift_report(previous_labels, self.labels, previous_centroids, self.centroids)
+        return clustered, report
+
+    def save(self, path: str) -> None:
+        """Persist the tracker state (model, coordinates, labels, last report) to disk atomically."""
+        path = Path(path)
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name, suffix='.tmp',
+                                         delete=False) as f:
+            pickle.dump(self, f)
+        os.replace(f.name, path)
+
+    @staticmethod
+    def load(path: str) -> 'DriftTracker':
+        """Load a tracker saved with save()."""
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+
+def track_snapshots(store, until: Optional[str] = None, n_clusters: int = 4,
+                    random_state: int = 42, state_dir: Optional[str] = None) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Cluster stored snapshots in date order with labels kept stable.
+
+    The first snapshot is fitted and every later one is updated
+    incrementally, so cluster numbers mean the same thing on every date.
+    With `state_dir`, the tracker is saved there after each date and the
+    replay starts from the latest saved date at or before `until`; when
+    `until` itself is saved, no snapshot is decoded at all.
+
+    Args:
+        store: snapshot_store.SnapshotStore
+        until: Last snapshot date to replay (defaults to the latest)
+        n_clusters: Number of KMeans clusters
+        random_state: Seed for KMeans
+        state_dir: Directory for per-date tracker states (one per n_clusters
+                   and random_state); None replays from the first snapshot
+
+    Returns:
+        Tuple of (clustered DataFrame for `until`, drift report against the
+        snapshot before it)
+
+    Raises:
+        KeyError: If `until` is not a stored snapshot date
+    """
+    dates = store.dates()
+    if until is None and dates:
+        until = dates[-1]
+    if until not in dates:
+        raise KeyError(f"No snapshot for {until}")
+    position = dates.index(until)
+
+    tracker = None
+    start = 0
+    if state_dir is not None:
+        state_dir = Path(state_dir)
+        state_dir.mkdir(parents=True, exist_ok=True)
+        for index in range(position, -1, -1):
+            path = state_dir / f"date={dates[index]}.pkl"
+            if path.exists():
+                tracker = DriftTracker.load(str(path))
+                start = index + 1
+                break
+
+    if tracker is None:
+        tracker = DriftTracker(n_clusters=n_clusters, random_state=random_state)
+    elif start > position:
+        return tracker.clustered(), tracker.report
+
+    for date, snapshot in store.iter_snapshots(start=dates[start], end=until):
+        clustered, report = tracker.update(clean_coin_data(snapshot))
+        if state_dir is not None:
+            tracker.save(str(state_dir / f"date={date}.pkl"))
+    return clustered, report
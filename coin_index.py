@@ -0,0 +1,209 @@
+"""
+Coin Lookup Index
+
+Exact-match hash index over a clustered dataset. Tickers (the CSV index
+column) and coin names map to row positions, and every position to its
+cluster, so "is Bitcoin in cluster 2?" or "which row is ETH?" is a hash
+lookup instead of a scan over a coin list or column.
+
+Tickers are unique, so the index wraps the dataset's own ticker index and
+pandas builds its hash table on the first lookup. Coin names are not
+unique (forks share names), and a non-unique pandas index scans every row
+per lookup, so names get a name -> positions dictionary instead, built
+once on the first name lookup. CryptoAIAnalyzer exposes the index as
+`coin_index`, and ClusterCoins uses it to stand in for per-cluster coin
+lists.
+"""
+
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+
+_NO_POSITIONS = np.empty(0, dtype=np.intp)
+
+
+class CoinIndex:
+    """
+    Ticker/name -> row position -> cluster lookup for one dataset.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Build the index.
+
+        Args:
+            data: Clustered DataFrame indexed by ticker with CoinName and Class columns
+        """
+        self.clusters = data['Class'].to_numpy()
+
+        # Generated sample data has a plain RangeIndex, which is not a ticker
+        if isinstance(data.index, pd.RangeIndex):
+            self._tickers = None
+        elif pd.api.types.is_numeric_dtype(data.index):
+            self._tickers = data.index.astype(str)
+        else:
+            self._tickers = data.index
+
+        # Several coins can share a name (e.g. forks), so name lookups return every row
+        self._names = data['CoinName']
+        self._name_positions: Optional[Dict[Hashable, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.clusters)
+
+    def __contains__(self, key: object) -> bool:
+        return bool(self.positions(key))
+
+    def _ticker_positions(self, ticker: Hashable) -> List[int]:
+        if self._tickers is None:
+            return []
+        indexer = self._tickers.get_indexer_for([str(ticker)])
+        # Tickers are unique in the source files; keep the first row if not
+        return indexer[indexer >= 0][:1].tolist()
+
+    def _positions_of_name(self, name: Hashable) -> np.ndarray:
+        if self._name_positions is None:
+            self._name_positions = self._names.groupby(self._names, sort=False).indices
+        return self._name_positions.get(str(name), _NO_POSITIONS)
+
+    def has_ticker(self, ticker: Hashable) -> bool:
+        """Check whether a ticker is in the dataset."""
+        return bool(self._ticker_positions(ticker))
+
+    def positions(self, key: Hashable) -> List[int]:
+        """
+        Row positions matching a ticker or coin name exactly.
+
+        Args:
+            key: Ticker (checked first) or coin name
+
+        Returns:
+            List of positions (empty if unknown)
+        """
+        positions = self._ticker_positions(key)
+        if positions:
+            return positions
+        return self._positions_of_name(key).tolist()
+
+    def position(self, key: Hashable) -> Optional[int]:
+        """Row position of a ticker or coin name (the first one for shared names), or None."""
+        positions = self.positions(key)
+        return positions[0] if positions else None
+
+    def cluster_of(self, key: Hashable) -> Optional[Hashable]:
+        """Cluster of a ticker or coin name, or None if it is not in the dataset."""
+        position = self.position(key)
+        return None if position is None else self.clusters[position].item()
+
+    def in_cluster(self, name: str, cluster_id: Hashable) -> bool:
+        """Check whether a coin name occurs in a cluster."""
+        return cluster_id in self.clusters_with([name])
+
+    def clusters_with(self, names: Iterable[str]) -> Set[Hashable]:
+        """
+        Clusters containing at least one of the given coin names.
+
+        Args:
+            names: Coin names
+
+        Returns:
+            Set of cluster IDs
+        """
+        positions = [self._positions_of_name(name) for name in names]
+        if not positions:
+            return set()
+        return set(self.clusters[np.concatenate(positions)].tolist())
+
+    def cluster_positions(self, cluster_id: Hashable) -> np.ndarray:
+        """Row positions of every coin in a cluster (computed on demand, not stored)."""
+        return np.flatnonzero(self.clusters == cluster_id)
+
+    def rows(self, data: pd.DataFrame, key: Hashable) -> pd.DataFrame:
+        """
+        Rows of `data` (the indexed dataset) matching a ticker or name exactly.
+
+        Args:
+            data: The DataFrame this index was built from
+            key: Ticker or coin name
+
+        Returns:
+            Matching rows (empty if unknown)
+        """
+        return data.iloc[np.asarray(self.positions(key), dtype=np.intp)]
+
+
+class ClusterCoins:
+    """
+    Lazy, list-like view of the coin names in one cluster.
+
+    Holds the cluster ID and references to the dataset and its CoinIndex.
+    Membership tests go through the index. The cluster's row positions are
+    found on first access and kept; names are read from the dataset when
+    iterated, sliced or paged, and are not kept.
+    """
+
+    def __init__(self, data: pd.DataFrame, coin_index: CoinIndex, cluster_id: Hashable, size: int):
+        """
+        Args:
+            data: The clustered dataset
+            coin_index: CoinIndex built from data
+            cluster_id: Cluster the view covers
+            size: Number of coins in the cluster
+        """
+        self.data = data
+        self.coin_index = coin_index
+        self.cluster_id = cluster_id
+        self.size = size
+        self._positions: Optional[np.ndarray] = None
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Row positions of the cluster's coins, computed once per view."""
+        if self._positions is None:
+            self._positions = self.coin_index.cluster_positions(self.cluster_id)
+        return self._positions
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, name: object) -> bool:
+        return self.coin_index.in_cluster(name, self.cluster_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tolist())
+
+    def __getitem__(self, item):
+        positions = self.positions[item]
+        if np.ndim(positions) == 0:
+            return self.data['CoinName'].iat[int(positions)]
+        return self.data['CoinName'].iloc[positions].tolist()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ClusterCoins):
+            return self.tolist() == other.tolist()
+        if isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ClusterCoins(cluster={self.cluster_id!r}, size={self.size})"
+
+    def page(self, number: int, page_size: int = 100) -> List[str]:
+        """
+        One page of coin names, in dataset order.
+
+        Args:
+            number: Zero-based page number
+            page_size: Names per page
+
+        Returns:
+            List of at most page_size names
+        """
+        start = number * page_size
+        return self[start:start + page_size]
+
+    def tolist(self) -> List[str]:
+        """Materialize every coin name in the cluster."""
+        return self[:]
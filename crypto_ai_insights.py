@@ -9,12 +9,94 @@ Author: AI Product Manager
 Version: 2.0.0
 """
 
-import pandas as pd
-import numpy as np
-from typing import Dict, List, Tuple, Optional
+from __future__ import annotations
+
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
+import importlib
+import sys
+from typing import Dict, List, Tuple, Optional, TYPE_CHECKING
 import json
+import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime
 
+from artifact_cache import ARTIFACT_CACHE
+from instrumentation import instrumented
+from profile_records import ClusterProfile, InvestmentInsights, NotableCoin, RiskAssessment
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from insight_rules import RuleEngine
+
+# pandas is not imported at module load: analyzers receive DataFrames that
+# are already built, and the helpers that create DataFrames import it on
+# first use. This keeps `import crypto_ai_insights` cheap for CLI jobs and
+# cold-starting containers. See import_time_breakdown().
+_DEFERRED_IMPORT_SECONDS: Dict[str, float] = {}
+
+
+def _lazy_import(name: str):
+    """Import a heavy dependency on first use and record how long it took."""
+    module = sys.modules.get(name)
+    if module is None:
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        _DEFERRED_IMPORT_SECONDS[name] = time.perf_counter() - start
+    return module
+
+logger = logging.getLogger(__name__)
+
+
+# Portfolio allocation bands by risk score: (max score, min weight, max weight, label)
+ALLOCATION_BANDS = [
+    (3.5, 0.20, 0.40, 'Core Holdings'),
+    (6.5, 0.10, 0.20, 'Moderate Position'),
+    (10.0, 0.00, 0.05, 'Speculative Only')
+]
+
+
+def allocation_bounds(risk_score: float) -> Tuple[float, float, str]:
+    """
+    Numeric allocation band for a risk score.
+
+    Args:
+        risk_score: Cluster risk score on the 1-10 scale
+
+    Returns:
+        Tuple of (min weight, max weight, label) with weights as fractions
+    """
+    for max_score, low, high, label in ALLOCATION_BANDS:
+        if risk_score <= max_score:
+            return low, high, label
+    _, low, high, label = ALLOCATION_BANDS[-1]
+    return low, high, label
+
+
+# Established coins recognised by the cluster rules: coin name -> tier.
+# 'major' coins give a cluster its "Established Major" name, 'major' and
+# 'proven' coins count as an opportunity, and every tier lowers the risk
+# score. Pass a larger mapping to CryptoAIAnalyzer to whitelist more assets.
+ESTABLISHED_COINS: Dict[str, str] = {
+    'Bitcoin': 'major',
+    'Ethereum': 'major',
+    'Litecoin': 'proven',
+    'Dash': 'established',
+    'Monero': 'established'
+}
+
+# Tiers each rule reads from the per-cluster established-coin table.
+# Pass a different mapping to CryptoAIAnalyzer to regroup tiers; every tier
+# in the coin registry must be read by at least one rule.
+ESTABLISHED_TIERS: Dict[str, Tuple[str, ...]] = {
+    'characteristics': ('major',),
+    'opportunities': ('major', 'proven'),
+    'risk': ('major', 'proven', 'established')
+}
+
 
 class CryptoAIAnalyzer:
     """
@@ -22,7 +104,12 @@ class CryptoAIAnalyzer:
     machine learning with generative AI for actionable insights.
     """
 
-    def __init__(self, clustered_data: pd.DataFrame):
+    @instrumented('analyzer.init')
+    def __init__(self, clustered_data: pd.DataFrame,
+                 established_coins: Optional[Dict[str, str]] = None,
+                 established_tiers: Optional[Dict[str, Tuple[str, ...]]] = None,
+                 rule_engine: Optional[RuleEngine] = None,
+                 approximate: bool = False):
         """
         Initialize the AI analyzer with clustered cryptocurrency data.
 
@@ -30,17 +117,61 @@ class CryptoAIAnalyzer:
             clustered_data: DataFrame with clustering results including
                           CoinName, Algorithm, ProofType, TotalCoinsMined,
                           TotalCoinSupply, PC components, and Class labels
+            established_coins: Coin name -> tier registry used by the cluster
+                               rules (defaults to ESTABLISHED_COINS)
+            established_tiers: Rule -> tiers it reads (defaults to
+                               ESTABLISHED_TIERS); must cover the
+                               'characteristics', 'opportunities' and 'risk'
+                               rules
+            rule_engine: insight_rules.RuleEngine for cluster naming and
+                         insights (defaults to the compiled CLUSTER_RULES)
+            approximate: Compute cluster statistics in bounded memory with
+                         streaming sketches and sampled coin lists (see
+                         streaming_stats for the error bounds)
+
+        Raises:
+            ValueError: If a rule is missing from established_tiers or a
+                        registry tier is read by no rule
         """
+        from coin_index import CoinIndex
+        from insight_rules import DEFAULT_RULE_ENGINE
+
         self.data = clustered_data
+        self.established_coins = ESTABLISHED_COINS if established_coins is None else established_coins
+        self.established_tiers = ESTABLISHED_TIERS if established_tiers is None else established_tiers
+
+        missing_rules = set(ESTABLISHED_TIERS) - set(self.established_tiers)
+        if missing_rules:
+            raise ValueError(f"established_tiers has no entry for rules: {sorted(missing_rules)}")
+        read_tiers = {tier for tiers in self.established_tiers.values() for tier in tiers}
+        unread_tiers = set(self.established_coins.values()) - read_tiers
+        if unread_tiers:
+            raise ValueError(f"Established coin tiers not read by any rule: {sorted(unread_tiers)}")
+
+        self.approximate = approximate
+        self.coin_index = CoinIndex(clustered_data)
         self.cluster_stats = self._calculate_cluster_statistics()
+        self.established_counts = self._count_established_coins()
+        self.rule_engine = DEFAULT_RULE_ENGINE if rule_engine is None else rule_engine
+        self._insights = None
 
     def _calculate_cluster_statistics(self) -> Dict:
         """
         Calculate statistical metrics for each cluster.
 
+        Coin names are not copied: 'coins' is a ClusterCoins view that
+        answers membership through the coin index and reads names from the
+        dataset only when iterated or paged.
+
         Returns:
             Dictionary with cluster statistics
         """
+        from coin_index import ClusterCoins
+
+        if self.approximate:
+            from streaming_stats import approximate_cluster_statistics
+            return approximate_cluster_statistics(self.data)
+
         stats = {}
 
         for cluster_id in self.data['Class'].unique():
@@ -52,14 +183,43 @@ class CryptoAIAnalyzer:
                 'avg_mined': cluster_data['TotalCoinsMined'].mean(),
                 'top_algorithms': cluster_data['Algorithm'].value_counts().head(3).to_dict(),
                 'top_proofs': cluster_data['ProofType'].value_counts().head(3).to_dict(),
-                'coins': cluster_data['CoinName'].tolist(),
+                'coins': ClusterCoins(self.data, self.coin_index, cluster_id, len(cluster_data)),
                 'supply_std': cluster_data['TotalCoinSupply'].std(),
                 'mined_std': cluster_data['TotalCoinsMined'].std()
             }
 
         return stats
 
-    def generate_cluster_profile(self, cluster_id: int) -> Dict:
+    def _count_established_coins(self) -> Dict:
+        """
+        Count established coins per cluster and tier.
+
+        One isin over the whole frame finds the registered coins, so the
+        cost does not grow with the number of clusters and the registry
+        can hold thousands of names.
+
+        Returns:
+            Dictionary mapping cluster ID to {tier: number of coins}
+        """
+        tiers = sorted(set(self.established_coins.values()))
+        counts = {cluster_id: dict.fromkeys(tiers, 0) for cluster_id in self.cluster_stats}
+
+        names = self.data['CoinName']
+        mask = names.isin(self.established_coins.keys())
+        if mask.any():
+            matched = self.data.loc[mask, ['Class']].assign(tier=names[mask].map(self.established_coins))
+            for (cluster_id, tier), count in matched.groupby(['Class', 'tier']).size().items():
+                counts[cluster_id][tier] = int(count)
+
+        return counts
+
+    def _has_established(self, cluster_id: int, rule: str) -> bool:
+        """Check whether a cluster holds a coin from the tiers a rule reads."""
+        counts = self.established_counts[cluster_id]
+        return any(counts.get(tier, 0) for tier in self.established_tiers[rule])
+
+    @instrumented('analyzer.generate_cluster_profile')
+    def generate_cluster_profile(self, cluster_id: int) -> ClusterProfile:
         """
         Generate a comprehensive profile for a specific cluster.
 
@@ -67,7 +227,8 @@ class CryptoAIAnalyzer:
             cluster_id: The cluster ID to analyze
 
         Returns:
-            Dictionary containing cluster profile information
+            ClusterProfile record (read like the former profile dictionary,
+            or serialize with to_dict()/to_json())
         """
         if cluster_id not in self.cluster_stats:
             raise ValueError(f"Cluster {cluster_id} not found")
@@ -79,31 +240,27 @@ class CryptoAIAnalyzer:
         characteristics = self._identify_cluster_characteristics(cluster_id)
 
         # Calculate risk metrics
-        risk_score = self._calculate_risk_score(cluster_data)
+        risk_score = self._calculate_risk_score(cluster_data, cluster_id)
 
         # Find notable coins
         notable_coins = self._find_notable_coins(cluster_data)
 
-        profile = {
-            'cluster_id': cluster_id,
-            'name': characteristics['name'],
-            'description': characteristics['description'],
-            'size': stats['size'],
-            'percentage': f"{(stats['size'] / len(self.data)) * 100:.1f}%",
-            'key_features': characteristics['features'],
-            'dominant_algorithm': list(stats['top_algorithms'].keys())[0],
-            'dominant_proof': list(stats['top_proofs'].keys())[0],
-            'risk_assessment': risk_score,
-            'notable_coins': notable_coins,
-            'investment_insights': self._generate_investment_insights(cluster_id, risk_score),
-            'statistics': {
-                'avg_supply': f"{stats['avg_supply']:,.0f}",
-                'avg_mined': f"{stats['avg_mined']:,.0f}",
-                'supply_volatility': 'High' if stats['supply_std'] > stats['avg_supply'] else 'Low'
-            }
-        }
-
-        return profile
+        return ClusterProfile(
+            cluster_id=cluster_id,
+            name=characteristics['name'],
+            description=characteristics['description'],
+            size=stats['size'],
+            total_coins=len(self.data),
+            key_features=characteristics['features'],
+            dominant_algorithm=next(iter(stats['top_algorithms'])),
+            dominant_proof=next(iter(stats['top_proofs'])),
+            risk_assessment=risk_score,
+            notable_coins=notable_coins,
+            investment_insights=self._generate_investment_insights(cluster_id, risk_score),
+            avg_supply=stats['avg_supply'],
+            avg_mined=stats['avg_mined'],
+            supply_std=stats['supply_std']
+        )
 
     def _identify_cluster_characteristics(self, cluster_id: int) -> Dict:
         """
@@ -115,83 +272,67 @@ class CryptoAIAnalyzer:
         Returns:
             Dictionary with cluster name, description, and key features
         """
-        stats = self.cluster_stats[cluster_id]
-        cluster_data = self.data[self.data['Class'] == cluster_id]
-
-        # Analyze dominant algorithms and proof types
-        top_algo = list(stats['top_algorithms'].keys())[0]
-        top_proof = list(stats['top_proofs'].keys())[0]
-
-        # Check for notable coins
-        has_btc = 'Bitcoin' in stats['coins']
-        has_eth = 'Ethereum' in stats['coins']
-
-        # Determine supply characteristics
-        high_supply = stats['avg_supply'] > 1e9
-        low_supply = stats['avg_supply'] < 1e7
-
-        # Generate characteristics based on patterns
-        if has_btc or has_eth:
-            name = "Established Major Cryptocurrencies"
-            description = "Industry-leading cryptocurrencies with high market adoption and proven track records"
-            features = [
-                "Market Leaders",
-                "High Liquidity",
-                "Strong Community",
-                "Proven Technology"
-            ]
-        elif high_supply:
-            name = "High-Supply Altcoins"
-            description = "Cryptocurrencies with large total supply, often targeting mass adoption"
-            features = [
-                "Large Supply Base",
-                f"Dominant: {top_algo}",
-                "Mass Market Focus",
-                "Lower Individual Token Value"
-            ]
-        elif low_supply and top_proof == 'PoS':
-            name = "Scarcity-Focused PoS Coins"
-            description = "Proof-of-Stake coins with limited supply, emphasizing scarcity and staking rewards"
-            features = [
-                "Limited Supply",
-                "Staking Mechanisms",
-                "Energy Efficient",
-                "Deflationary Pressure"
-            ]
-        elif 'Scrypt' in top_algo:
-            name = "Scrypt-Based Mining Coins"
-            description = "Cryptocurrencies using Scrypt algorithm, often Litecoin-inspired"
-            features = [
-                "Scrypt Algorithm",
-                "GPU-Friendly Mining",
-                "Fast Transactions",
-                "Alternative to SHA-256"
-            ]
-        else:
-            name = f"{top_algo} Cluster"
-            description = f"Cryptocurrencies primarily using {top_algo} algorithm with {top_proof} consensus"
-            features = [
-                f"Algorithm: {top_algo}",
-                f"Consensus: {top_proof}",
-                "Niche Market Position",
-                "Specialized Use Cases"
-            ]
-
+        characteristics = self._rule_results()[cluster_id]['characteristics']
         return {
-            'name': name,
-            'description': description,
-            'features': features
+            'name': characteristics['name'],
+            'description': characteristics['description'],
+            'features': list(characteristics['features'])
         }
 
-    def _calculate_risk_score(self, cluster_data: pd.DataFrame) -> Dict:
+    def _statistics_table(self):
+        """
+        Build the per-cluster table the insight rules are evaluated over.
+
+        Returns:
+            DataFrame indexed by cluster ID (columns listed in insight_rules)
+        """
+        pd = _lazy_import('pandas')
+
+        risk_scores = self.get_risk_scores()
+        rows = {}
+        for cluster_id, stats in self.cluster_stats.items():
+            avg_supply, supply_std = stats['avg_supply'], stats['supply_std']
+            if avg_supply > 0:
+                dispersion = supply_std / avg_supply
+            else:
+                dispersion = float('inf') if supply_std > 0 else 0.0
+
+            row = {
+                'size': stats['size'],
+                'avg_supply': avg_supply,
+                'supply_dispersion': dispersion,
+                'top_algorithm': next(iter(stats['top_algorithms'])),
+                'top_proof': next(iter(stats['top_proofs'])),
+                'top_algorithms': tuple(stats['top_algorithms']),
+                'risk_score': risk_scores[cluster_id]['score']
+            }
+            for rule in self.established_tiers:
+                row[f'established_{rule}'] = self._has_established(cluster_id, rule)
+            rows[cluster_id] = row
+
+        return pd.DataFrame.from_dict(rows, orient='index')
+
+    def _rule_results(self) -> Dict:
+        """
+        Evaluate the insight rules for all clusters once and keep the result.
+
+        Returns:
+            Dictionary mapping cluster ID to its rendered rule output
+        """
+        if self._insights is None:
+            self._insights = self.rule_engine.evaluate(self._statistics_table())
+        return self._insights
+
+    def _calculate_risk_score(self, cluster_data: pd.DataFrame, cluster_id: int) -> RiskAssessment:
         """
         Calculate risk assessment for a cluster.
 
         Args:
             cluster_data: DataFrame containing cluster cryptocurrency data
+            cluster_id: The cluster the data belongs to
 
         Returns:
-            Dictionary with risk score and assessment
+            RiskAssessment with the score and the factors behind it
         """
         risk_factors = []
         risk_score = 5.0  # Start at medium risk (scale 1-10)
@@ -211,8 +352,7 @@ class CryptoAIAnalyzer:
             risk_factors.append("Good diversification within cluster")
 
         # Factor 3: Presence of established coins
-        established_coins = ['Bitcoin', 'Ethereum', 'Litecoin', 'Dash', 'Monero']
-        if any(coin in cluster_data['CoinName'].values for coin in established_coins):
+        if self._has_established(cluster_id, 'risk'):
             risk_score -= 2.0
             risk_factors.append("Contains established, proven cryptocurrencies")
 
@@ -228,28 +368,10 @@ class CryptoAIAnalyzer:
             risk_score += 1.0
             risk_factors.append("High percentage of unlimited supply coins")
 
-        # Cap risk score between 1 and 10
-        risk_score = max(1, min(10, risk_score))
-
-        # Determine risk level
-        if risk_score <= 3.5:
-            risk_level = "Low"
-            risk_color = "🟢"
-        elif risk_score <= 6.5:
-            risk_level = "Medium"
-            risk_color = "🟡"
-        else:
-            risk_level = "High"
-            risk_color = "🔴"
-
-        return {
-            'score': round(risk_score, 1),
-            'level': risk_level,
-            'color': risk_color,
-            'factors': risk_factors
-        }
+        # Cap risk score between 1 and 10; the level and color follow from it
+        return RiskAssessment(max(1, min(10, risk_score)), risk_factors)
 
-    def _find_notable_coins(self, cluster_data: pd.DataFrame, top_n: int = 5) -> List[Dict]:
+    def _find_notable_coins(self, cluster_data: pd.DataFrame, top_n: int = 5) -> List[NotableCoin]:
         """
         Identify the most notable coins in a cluster.
 
@@ -258,61 +380,43 @@ class CryptoAIAnalyzer:
             top_n: Number of notable coins to return
 
         Returns:
-            List of notable coin dictionaries
+            List of NotableCoin records
         """
-        notable = []
-
         # Sort by supply and mining metrics
         cluster_data_sorted = cluster_data.copy()
         cluster_data_sorted['score'] = (
             cluster_data_sorted['TotalCoinsMined'] / (cluster_data_sorted['TotalCoinSupply'] + 1)
         )
 
-        for idx, row in cluster_data_sorted.nlargest(top_n, 'score').iterrows():
-            notable.append({
-                'name': row['CoinName'],
-                'algorithm': row['Algorithm'],
-                'proof_type': row['ProofType'],
-                'mined': f"{row['TotalCoinsMined']:,.0f}",
-                'supply': f"{row['TotalCoinSupply']:,.0f}",
-                'completion': f"{(row['TotalCoinsMined'] / (row['TotalCoinSupply'] + 1)) * 100:.1f}%"
-            })
+        top = cluster_data_sorted.nlargest(top_n, 'score')
+        return [
+            NotableCoin(name, algorithm, proof_type, mined, supply)
+            for name, algorithm, proof_type, mined, supply in zip(
+                top['CoinName'], top['Algorithm'], top['ProofType'],
+                top['TotalCoinsMined'].tolist(), top['TotalCoinSupply'].tolist()
+            )
+        ]
 
-        return notable
-
-    def _generate_investment_insights(self, cluster_id: int, risk_score: Dict) -> Dict:
+    def _generate_investment_insights(self, cluster_id: int, risk_score: RiskAssessment) -> InvestmentInsights:
         """
         Generate AI-powered investment insights for a cluster.
 
         Args:
             cluster_id: The cluster ID
-            risk_score: Risk assessment dictionary
+            risk_score: Risk assessment of the cluster
 
         Returns:
-            Dictionary with investment insights
+            InvestmentInsights record
         """
-        stats = self.cluster_stats[cluster_id]
-
-        insights = {
-            'recommended_allocation': self._recommend_allocation(risk_score['score']),
-            'investment_strategy': self._suggest_strategy(cluster_id, risk_score),
-            'key_considerations': self._identify_considerations(cluster_id),
-            'potential_opportunities': self._identify_opportunities(cluster_id),
-            'warnings': self._identify_warnings(cluster_id, risk_score)
-        }
-
-        return insights
-
-    def _recommend_allocation(self, risk_score: float) -> str:
-        """Recommend portfolio allocation percentage based on risk."""
-        if risk_score <= 3.5:
-            return "20-40% (Core Holdings)"
-        elif risk_score <= 6.5:
-            return "10-20% (Moderate Position)"
-        else:
-            return "0-5% (Speculative Only)"
+        return InvestmentInsights(
+            allocation=allocation_bounds(risk_score['score']),
+            investment_strategy=self._suggest_strategy(cluster_id, risk_score),
+            key_considerations=self._identify_considerations(cluster_id),
+            potential_opportunities=self._identify_opportunities(cluster_id),
+            warnings=self._identify_warnings(cluster_id)
+        )
 
-    def _suggest_strategy(self, cluster_id: int, risk_score: Dict) -> str:
+    def _suggest_strategy(self, cluster_id: int, risk_score: RiskAssessment) -> str:
         """Suggest investment strategy based on cluster characteristics."""
         stats = self.cluster_stats[cluster_id]
 
@@ -325,70 +429,17 @@ class CryptoAIAnalyzer:
 
     def _identify_considerations(self, cluster_id: int) -> List[str]:
         """Identify key investment considerations."""
-        stats = self.cluster_stats[cluster_id]
-        considerations = []
-
-        # Algorithm considerations
-        top_algo = list(stats['top_algorithms'].keys())[0]
-        if top_algo == 'SHA-256':
-            considerations.append("SHA-256 coins compete directly with Bitcoin for mining resources")
-        elif top_algo == 'Scrypt':
-            considerations.append("Scrypt algorithm offers faster block times but different security model")
-
-        # Proof type considerations
-        top_proof = list(stats['top_proofs'].keys())[0]
-        if 'PoS' in top_proof:
-            considerations.append("Proof-of-Stake enables passive income through staking")
-        elif top_proof == 'PoW':
-            considerations.append("Proof-of-Work provides battle-tested security but higher energy costs")
-
-        # Supply considerations
-        if stats['avg_supply'] == 0:
-            considerations.append("Unlimited supply may lead to inflationary pressure")
-
-        return considerations
+        return list(self._rule_results()[cluster_id]['considerations'])
 
     def _identify_opportunities(self, cluster_id: int) -> List[str]:
         """Identify potential opportunities in the cluster."""
-        stats = self.cluster_stats[cluster_id]
-        opportunities = []
+        return list(self._rule_results()[cluster_id]['opportunities'])
 
-        # Check for established coins
-        established = ['Bitcoin', 'Ethereum', 'Litecoin']
-        if any(coin in stats['coins'] for coin in established):
-            opportunities.append("Exposure to industry-leading cryptocurrencies with proven adoption")
-
-        # Check for diversity
-        if stats['size'] > 30:
-            opportunities.append("Large cluster provides good diversification within similar assets")
-
-        # Algorithm-specific opportunities
-        if 'Equihash' in stats['top_algorithms']:
-            opportunities.append("Privacy-focused cryptocurrencies with growing demand")
-
-        if 'Ethash' in stats['top_algorithms']:
-            opportunities.append("Smart contract platforms with DeFi and NFT ecosystems")
-
-        return opportunities if opportunities else ["Research individual projects for unique value propositions"]
-
-    def _identify_warnings(self, cluster_id: int, risk_score: Dict) -> List[str]:
+    def _identify_warnings(self, cluster_id: int) -> List[str]:
         """Identify warnings and risks."""
-        warnings = []
-
-        if risk_score['score'] > 7:
-            warnings.append("⚠️ HIGH RISK: Significant potential for losses")
-
-        stats = self.cluster_stats[cluster_id]
-
-        if stats['size'] < 10:
-            warnings.append("⚠️ Small cluster may indicate niche or outdated technologies")
-
-        # Check for high volatility
-        if stats['supply_std'] > stats['avg_supply'] * 2:
-            warnings.append("⚠️ High volatility in supply metrics across cluster")
-
-        return warnings if warnings else ["✓ No major red flags identified"]
+        return list(self._rule_results()[cluster_id]['warnings'])
 
+    @instrumented('analyzer.generate_market_summary')
     def generate_market_summary(self) -> Dict:
         """
         Generate an overall market summary across all clusters.
@@ -430,17 +481,29 @@ class CryptoAIAnalyzer:
         """Get proof type distribution across all cryptocurrencies."""
         return self.data['ProofType'].value_counts().head(5).to_dict()
 
+    @instrumented('analyzer.get_risk_scores')
+    def get_risk_scores(self) -> Dict:
+        """
+        Calculate the risk assessment of every cluster.
+
+        Returns:
+            Dictionary mapping cluster ID to its RiskAssessment
+        """
+        return {
+            cluster_id: self._calculate_risk_score(self.data[self.data['Class'] == cluster_id], cluster_id)
+            for cluster_id in sorted(self.cluster_stats.keys())
+        }
+
     def _get_risk_distribution(self) -> Dict:
         """Calculate risk distribution across clusters."""
         risk_levels = {'Low': 0, 'Medium': 0, 'High': 0}
 
-        for cluster_id in self.cluster_stats.keys():
-            cluster_data = self.data[self.data['Class'] == cluster_id]
-            risk = self._calculate_risk_score(cluster_data)
+        for risk in self.get_risk_scores().values():
             risk_levels[risk['level']] += 1
 
         return risk_levels
 
+    @instrumented('analyzer.export_analysis_report')
     def export_analysis_report(self, filename: str = None) -> str:
         """
         Export a comprehensive analysis report in Markdown format.
@@ -544,6 +607,7 @@ class CryptoAIAnalyzer:
 
         return ''.join(report)
 
+    @instrumented('analyzer.generate_llm_prompt_for_insights')
     def generate_llm_prompt_for_insights(self, cluster_id: int) -> str:
         """
         Generate a structured prompt for LLM-based insight generation.
@@ -612,13 +676,91 @@ def load_clustered_data(file_path: str = None, dataframe: pd.DataFrame = None) -
     if dataframe is not None:
         data = dataframe
     elif file_path is not None:
-        data = pd.read_csv(file_path)
+        data = _lazy_import('pandas').read_csv(file_path)
     else:
         raise ValueError("Must provide either file_path or dataframe")
 
     return CryptoAIAnalyzer(data)
 
 
+# Process-wide analyzers shared by every app session, keyed by dataset version
+_SHARED_ANALYZERS: 'OrderedDict[str, CryptoAIAnalyzer]' = OrderedDict()
+_SHARED_ANALYZERS_LOCK = threading.Lock()
+# One build lock per dataset version being constructed, so building one
+# dataset's analyzer does not block sessions using another dataset
+_BUILD_LOCKS: Dict[str, threading.Lock] = {}
+_SHARED_ANALYZERS_MAX = 8
+_construction_stats = {'count': 0, 'total_seconds': 0.0, 'last_seconds': 0.0}
+
+
+def get_shared_analyzer(data: pd.DataFrame, dataset_version: str) -> CryptoAIAnalyzer:
+    """
+    Return the shared analyzer for a dataset version, building it once.
+
+    The analyzer is treated as read-only after construction, so a single
+    instance can serve concurrent sessions. Construction is serialized by a
+    per-version lock so simultaneous first requests for the same dataset do
+    not build duplicates, while other datasets stay available. When the
+    artifact cache is enabled, an analyzer stored by an earlier process
+    (e.g. warmup.py) is loaded instead of being rebuilt.
+
+    Args:
+        data: Clustered DataFrame used if the analyzer has to be built
+        dataset_version: Identifier of the dataset (e.g. a content fingerprint)
+
+    Returns:
+        Shared CryptoAIAnalyzer instance
+    """
+    with _SHARED_ANALYZERS_LOCK:
+        analyzer = _SHARED_ANALYZERS.get(dataset_version)
+        if analyzer is not None:
+            _SHARED_ANALYZERS.move_to_end(dataset_version)
+            return analyzer
+        build_lock = _BUILD_LOCKS.setdefault(dataset_version, threading.Lock())
+
+    with build_lock:
+        # Another session may have finished building while we waited
+        with _SHARED_ANALYZERS_LOCK:
+            analyzer = _SHARED_ANALYZERS.get(dataset_version)
+        if analyzer is not None:
+            return analyzer
+
+        start = time.perf_counter()
+        analyzer = ARTIFACT_CACHE.get_or_build('analyzer', {'dataset': dataset_version,
+                                                            'established': ESTABLISHED_COINS,
+                                                            'tiers': ESTABLISHED_TIERS},
+                                               lambda: CryptoAIAnalyzer(data))
+        elapsed = time.perf_counter() - start
+
+        with _SHARED_ANALYZERS_LOCK:
+            _construction_stats['count'] += 1
+            _construction_stats['total_seconds'] += elapsed
+            _construction_stats['last_seconds'] = elapsed
+            logger.info("Built analyzer for dataset %s in %.3fs (%d total builds)",
+                        dataset_version, elapsed, _construction_stats['count'])
+
+            _SHARED_ANALYZERS[dataset_version] = analyzer
+            while len(_SHARED_ANALYZERS) > _SHARED_ANALYZERS_MAX:
+                _SHARED_ANALYZERS.popitem(last=False)
+            _BUILD_LOCKS.pop(dataset_version, None)
+
+        return analyzer
+
+
+def analyzer_construction_stats() -> Dict:
+    """
+    Report how often shared analyzers have been built and how long it took.
+
+    Returns:
+        Dictionary with construction count, total/last seconds and cached versions
+    """
+    with _SHARED_ANALYZERS_LOCK:
+        return {
+            **_construction_stats,
+            'cached_versions': list(_SHARED_ANALYZERS.keys())
+        }
+
+
 def compare_clusters(analyzer: CryptoAIAnalyzer, cluster_ids: List[int]) -> pd.DataFrame:
     """
     Generate a comparison table for multiple clusters.
@@ -645,7 +787,27 @@ def compare_clusters(analyzer: CryptoAIAnalyzer, cluster_ids: List[int]) -> pd.D
             'Allocation': profile['investment_insights']['recommended_allocation']
         })
 
-    return pd.DataFrame(comparison_data)
+    return _lazy_import('pandas').DataFrame(comparison_data)
+
+
+def import_time_breakdown() -> Dict:
+    """
+    Report where this module's import time went.
+
+    Returns:
+        Dictionary with the module's own import seconds, seconds spent on
+        deferred imports triggered so far (pandas), and which heavy
+        libraries are currently loaded in the process
+    """
+    return {
+        'module_seconds': _MODULE_IMPORT_SECONDS,
+        'deferred_imports': dict(_DEFERRED_IMPORT_SECONDS),
+        'loaded': {name: name in sys.modules
+                   for name in ('pandas', 'numpy', 'sklearn', 'plotly', 'streamlit')}
+    }
+
+
+_MODULE_IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED
 
 
 if __name__ == "__main__":
@@ -667,3 +829,6 @@ if __name__ == "__main__":
     print("```")
     print("\n" + "=" * 50)
     print("Ready to enhance your cryptocurrency analysis with AI! 🎯")
+
+    if '--import-times' in sys.argv:
+        print(f"\nImport time breakdown: {json.dumps(import_time_breakdown(), indent=2)}")
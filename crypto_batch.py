@@ -0,0 +1,243 @@
+"""
+Headless Batch Pipeline
+
+Runs load -> clean -> encode -> scale -> PCA -> KMeans -> CryptoAIAnalyzer
+-> report export for one or many coin files without a browser:
+
+    python crypto_batch.py crypto_data.csv snapshots/*.csv --output-dir reports --workers 4
+
+Each input gets its own output folder, named after the file (inputs that
+share a name get -2, -3, ... suffixes in input order), with the clustered CSV (the layout
+export_clustered_data produces for the apps), a Markdown report and a JSON
+analysis. A batch_summary.json in the output directory lists every input
+with its status, cluster sizes and stage timings.
+
+Inputs are processed by a pool of worker processes. Each worker handles a
+single file and then exits, so memory is returned to the OS after every
+dataset and peak usage is bounded by the largest single input. scikit-learn
+is imported only inside the workers when a model is fitted, and Streamlit
+is never imported.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+def _json_default(value):
+    """Convert NumPy scalars and arrays for json.dump."""
+    if hasattr(value, 'item'):
+        return value.item()
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def read_coin_file(path: str):
+    """
+    Read a raw coin file in the crypto_data.csv layout.
+
+    Args:
+        path: CSV or Parquet file indexed by ticker
+
+    Returns:
+        Raw coin DataFrame
+    """
+    import pandas as pd
+
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, index_col=0)
+
+
+def run_pipeline(path: str, output_dir: str, n_clusters: int = 4,
+                 tradable_only: bool = True, approximate: bool = False,
+                 name: Optional[str] = None) -> Dict:
+    """
+    Run the full pipeline for one input file and write its outputs.
+
+    Args:
+        path: Raw coin file
+        output_dir: Directory that receives a sub-folder for this input
+        n_clusters: Number of KMeans clusters
+        tradable_only: Apply the 2018 dataset filters when cleaning
+        approximate: Use bounded-memory approximate cluster statistics
+        name: Output sub-folder name (defaults to the file name without extension)
+
+    Returns:
+        Summary dictionary for the batch manifest
+    """
+    from crypto_ai_insights import CryptoAIAnalyzer
+    from crypto_pipeline import clean_coin_data, cluster_coin_data
+    from instrumentation import RECORDER, process_peak_rss_mb, stage
+
+    RECORDER.clear()
+    start = time.perf_counter()
+    target = Path(output_dir) / (name or Path(path).stem)
+
+    with stage('load.file'):
+        raw = read_coin_file(path)
+    cleaned = clean_coin_data(raw, tradable_only=tradable_only)
+    del raw
+
+    clustered, _ = cluster_coin_data(cleaned, n_clusters=n_clusters, random_state=42)
+    del cleaned
+    analyzer = CryptoAIAnalyzer(clustered, approximate=approximate)
+
+    target.mkdir(parents=True, exist_ok=True)
+    with stage('export.clustered_csv'):
+        clustered.to_csv(target / 'clustered_crypto_data.csv')
+    analyzer.export_analysis_report(str(target / 'analysis_report.md'))
+
+    with stage('export.json'):
+        analysis = {
+            'source': path,
+            'market_summary': analyzer.generate_market_summary(),
+            'clusters': [analyzer.generate_cluster_profile(cid).to_dict() for cid in sorted(analyzer.cluster_stats)]
+        }
+        with open(target / 'analysis.json', 'w') as f:
+            json.dump(analysis, f, indent=2, default=_json_default)
+
+    return {
+        'input': path,
+        'status': 'ok',
+        'output_dir': str(target),
+        'coins': len(clustered),
+        'cluster_sizes': {str(k): int(v) for k, v in clustered['Class'].value_counts().sort_index().items()},
+        'seconds': time.perf_counter() - start,
+        'stages': {row['stage']: round(row['total_wall_s'], 6) for row in RECORDER.summary()},
+        'process_peak_rss_mb': process_peak_rss_mb()
+    }
+
+
+def _run_safely(args: tuple) -> Dict:
+    """Run one pipeline and turn failures into a summary row (runs in a worker)."""
+    path = args[0]
+    try:
+        return run_pipeline(*args)
+    except Exception as e:
+        return {'input': path, 'status': 'error', 'error': f"{type(e).__name__}: {e}"}
+
+
+def expand_inputs(inputs: List[str]) -> List[str]:
+    """Expand directories to the CSV/Parquet files they contain."""
+    files = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            files.extend(sorted(str(p) for p in path.iterdir() if p.suffix in ('.csv', '.parquet')))
+        else:
+            files.append(str(path))
+    return files
+
+
+def output_names(files: List[str]) -> List[str]:
+    """
+    Output folder name for each input, unique within the batch.
+
+    Folders are named after the file without its extension; inputs sharing
+    that name (a/d.csv and b/d.csv, or x.csv next to x.parquet) would write
+    into the same folder, so later ones get -2, -3, ... suffixes.
+
+    Args:
+        files: Input files in batch order
+
+    Returns:
+        Folder names in the same order
+    """
+    names = []
+    taken = set()
+    for path in files:
+        stem = name = Path(path).stem
+        counter = 1
+        while name in taken:
+            counter += 1
+            name = f"{stem}-{counter}"
+        taken.add(name)
+        names.append(name)
+    return names
+
+
+def run_batch(inputs: List[str], output_dir: str, n_clusters: int = 4,
+              tradable_only: bool = True, workers: Optional[int] = None,
+              approximate: bool = False) -> Dict:
+    """
+    Run the pipeline for every input, in parallel when more than one worker is used.
+
+    Args:
+        inputs: Input files or directories
+        output_dir: Output directory
+        n_clusters: Number of KMeans clusters
+        tradable_only: Apply the 2018 dataset filters when cleaning
+        workers: Worker processes (defaults to min(CPU count, inputs); 1 runs in-process)
+        approximate: Use bounded-memory approximate cluster statistics
+
+    Returns:
+        Batch manifest, also written to output_dir/batch_summary.json
+    """
+    files = expand_inputs(inputs)
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    tasks = [(path, output_dir, n_clusters, tradable_only, approximate, name)
+             for path, name in zip(files, output_names(files))]
+
+    workers = workers or min(os.cpu_count() or 1, max(len(tasks), 1))
+    start = time.perf_counter()
+
+    if workers == 1:
+        results = [_run_safely(task) for task in tasks]
+    else:
+        # Fresh (spawned) worker per file keeps memory from accumulating across datasets
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 max_tasks_per_child=1) as executor:
+            results = list(executor.map(_run_safely, tasks))
+
+    manifest = {
+        'output_dir': output_dir,
+        'workers': workers,
+        'n_clusters': n_clusters,
+        'seconds': time.perf_counter() - start,
+        'succeeded': sum(r['status'] == 'ok' for r in results),
+        'failed': sum(r['status'] != 'ok' for r in results),
+        'results': results
+    }
+    with open(Path(output_dir) / 'batch_summary.json', 'w') as f:
+        json.dump(manifest, f, indent=2, default=_json_default)
+
+    return manifest
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Cluster coin files and export analysis reports")
+    parser.add_argument('inputs', nargs='+', help="Raw coin CSV/Parquet files or directories")
+    parser.add_argument('--output-dir', default='batch_output')
+    parser.add_argument('--clusters', type=int, default=4)
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (1 = in-process)")
+    parser.add_argument('--keep-untradable', action='store_true',
+                        help="Skip the IsTrading/complete-data filters (2025 dataset layout)")
+    parser.add_argument('--approximate', action='store_true',
+                        help="Bounded-memory cluster statistics for very large inputs")
+    args = parser.parse_args(argv)
+
+    manifest = run_batch(args.inputs, args.output_dir, args.clusters,
+                         tradable_only=not args.keep_untradable, workers=args.workers,
+                         approximate=args.approximate)
+
+    for result in manifest['results']:
+        if result['status'] == 'ok':
+            print(f"✅ {result['input']}: {result['coins']} coins in {result['seconds']:.2f}s -> {result['output_dir']}")
+        else:
+            print(f"❌ {result['input']}: {result['error']}")
+    print(f"\n{manifest['succeeded']} succeeded, {manifest['failed']} failed in {manifest['seconds']:.2f}s")
+
+    return 1 if manifest['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,314 @@
+"""
+Cryptocurrency Clustering Pipeline
+
+The clean -> encode -> scale -> PCA -> KMeans chain used by the Streamlit
+apps, packaged as a reusable model object. A fitted ClusteringModel keeps
+its encoder vocabulary, scaler, PCA components and centroids frozen, so
+new coins can be projected and assigned without refitting.
+
+Scaling and PCA are both linear, so a fitted model also compiles them into
+one affine map: a matrix for the numeric columns plus a per-category
+lookup table of PCA offsets. assign_coins() uses it to place new coins with
+a few array lookups and one small matrix product.
+
+scikit-learn is imported when a model is fitted, not at module import.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from instrumentation import stage
+
+
+NUMERIC_FEATURES = ['TotalCoinsMined', 'TotalCoinSupply']
+CATEGORY_FEATURES = ['Algorithm', 'ProofType']
+PCA_COLUMNS = ['PC 1', 'PC 2', 'PC 3']
+
+
+def clean_coin_data(df: pd.DataFrame, tradable_only: bool = True) -> pd.DataFrame:
+    """
+    Prepare raw coin data for clustering.
+
+    Coerces supply columns to numbers (crypto_data.csv stores some as text),
+    optionally keeps only trading coins with mined supply, and drops the
+    IsTrading column.
+
+    Args:
+        df: Raw coin DataFrame indexed by ticker
+        tradable_only: Apply the 2018 dataset filters (trading, complete, mined > 0)
+
+    Returns:
+        Cleaned DataFrame
+    """
+    with stage('pipeline.clean', rows=len(df)):
+        df = df.copy()
+        for column in NUMERIC_FEATURES:
+            df[column] = pd.to_numeric(df[column], errors='coerce')
+
+        if tradable_only:
+            if 'IsTrading' in df.columns:
+                df = df[df['IsTrading'] == True]
+            df = df.dropna()
+            df = df[df['TotalCoinsMined'] > 0]
+
+        if 'IsTrading' in df.columns:
+            df = df.drop('IsTrading', axis=1)
+
+    return df
+
+
+def encode_features(df: pd.DataFrame, feature_names: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Build the clustering feature matrix: numeric supply columns plus one-hot categories.
+
+    Args:
+        df: Cleaned coin DataFrame
+        feature_names: Frozen column order from a fitted model; unseen
+                       categories get all-zero indicator columns
+
+    Returns:
+        Feature DataFrame
+    """
+    X = df[NUMERIC_FEATURES].copy()
+    X_encoded = pd.get_dummies(df[CATEGORY_FEATURES])
+    X_combined = pd.concat([X, X_encoded], axis=1)
+
+    if feature_names is not None:
+        X_combined = X_combined.reindex(columns=feature_names, fill_value=0)
+
+    return X_combined
+
+
+class ClusteringModel:
+    """
+    Frozen encoder, scaler, PCA and KMeans fitted on one coin dataset.
+    """
+
+    def __init__(self, n_clusters: int = 4, n_components: int = 3, random_state: int = 42):
+        """
+        Initialize an unfitted model.
+
+        Args:
+            n_clusters: Number of KMeans clusters
+            n_components: Number of principal components
+            random_state: Seed for PCA and KMeans
+        """
+        self.n_clusters = n_clusters
+        self.n_components = n_components
+        self.random_state = random_state
+        self.feature_names_: Optional[List[str]] = None
+        self.scaler_ = None
+        self.pca_ = None
+        self.kmeans_ = None
+        self._affine = None
+
+    def fit(self, df: pd.DataFrame, init_centroids: Optional[np.ndarray] = None) -> 'ClusteringModel':
+        """
+        Fit the pipeline on cleaned coin data.
+
+        Args:
+            df: Cleaned coin DataFrame
+            init_centroids: Optional starting centroids in PCA space (warm start)
+
+        Returns:
+            The fitted model
+        """
+        self._fit(df, init_centroids)
+        return self
+
+    def _fit(self, df: pd.DataFrame, init_centroids: Optional[np.ndarray]) -> np.ndarray:
+        """Fit every stage and return the training data's PCA coordinates."""
+        pca_result = self.fit_basis(df)
+        self.fit_clusters(pca_result, init_centroids)
+        return pca_result
+
+    def fit_basis(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Fit the encoder, scaler and PCA stages only.
+
+        Use with fit_clusters() to inspect or transform data in the new PCA
+        space (e.g. to derive warm-start centroids) before clustering.
+
+        Args:
+            df: Cleaned coin DataFrame
+
+        Returns:
+            PCA coordinates of df, shape (n_coins, n_components)
+        """
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.decomposition import PCA
+
+        rows = len(df)
+        with stage('pipeline.encode', rows=rows):
+            X_combined = encode_features(df)
+        self.feature_names_ = list(X_combined.columns)
+
+        with stage('pipeline.scale', rows=rows):
+            self.scaler_ = StandardScaler()
+            X_scaled = self.scaler_.fit_transform(X_combined)
+
+        with stage('pipeline.pca', rows=rows):
+            self.pca_ = PCA(n_components=self.n_components, random_state=self.random_state)
+            pca_result = self.pca_.fit_transform(X_scaled)
+        self._affine = None
+
+        return pca_result
+
+    def fit_clusters(self, pca_result: np.ndarray,
+                     init_centroids: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Fit KMeans on coordinates from fit_basis().
+
+        Args:
+            pca_result: PCA coordinates of the training data
+            init_centroids: Optional starting centroids in PCA space (warm start)
+
+        Returns:
+            Cluster label per row
+        """
+        from sklearn.cluster import KMeans
+
+        with stage('pipeline.kmeans', rows=len(pca_result)):
+            if init_centroids is not None:
+                self.kmeans_ = KMeans(n_clusters=len(init_centroids), init=init_centroids, n_init=1,
+                                      random_state=self.random_state)
+            else:
+                self.kmeans_ = KMeans(n_clusters=self.n_clusters, random_state=self.random_state)
+            self.kmeans_.fit(pca_result)
+        self._affine = None
+
+        return self.kmeans_.labels_
+
+    @property
+    def centroids(self) -> np.ndarray:
+        """Cluster centroids in PCA space."""
+        return self.kmeans_.cluster_centers_
+
+    def transform(self, df: pd.DataFrame) -> np.ndarray:
+        """Project cleaned coin data into the frozen PCA space."""
+        X_combined = encode_features(df, self.feature_names_)
+        return self.pca_.transform(self.scaler_.transform(X_combined))
+
+    def _compile(self) -> Dict:
+        """Fold the scaler and PCA into numeric weights and per-category offset tables."""
+        if self._affine is None:
+            components = self.pca_.components_
+            weights = components / self.scaler_.scale_
+            offset = -(self.scaler_.mean_ / self.scaler_.scale_ + self.pca_.mean_) @ components.T
+
+            columns = {name: i for i, name in enumerate(self.feature_names_)}
+            numeric = weights[:, [columns[name] for name in NUMERIC_FEATURES]].T
+
+            categories = {}
+            for feature in CATEGORY_FEATURES:
+                prefix = f"{feature}_"
+                names = [name for name in self.feature_names_ if name.startswith(prefix)]
+                # The trailing zero row is selected by get_indexer's -1 for unseen values
+                table = np.vstack([weights[:, [columns[name] for name in names]].T,
+                                   np.zeros(len(components))])
+                categories[feature] = (pd.Index([name[len(prefix):] for name in names]), table)
+
+            self._affine = {'numeric': numeric, 'offset': offset, 'categories': categories}
+
+        return self._affine
+
+    def project(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Project coins into the frozen PCA space with the compiled affine map.
+
+        Equivalent to transform() but skips one-hot encoding and the
+        scikit-learn calls. Unseen categories contribute nothing, exactly as
+        an all-zero indicator column would.
+
+        Args:
+            df: Coin DataFrame with the numeric and category feature columns
+
+        Returns:
+            PCA coordinates, shape (n_coins, n_components)
+        """
+        affine = self._compile()
+        numeric = np.column_stack([pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=float)
+                                   for column in NUMERIC_FEATURES])
+        result = numeric @ affine['numeric'] + affine['offset']
+
+        for feature, (vocabulary, table) in affine['categories'].items():
+            result += table[vocabulary.get_indexer(df[feature].astype(str))]
+
+        return result
+
+    def assign_coins(self, new_rows: pd.DataFrame) -> pd.DataFrame:
+        """
+        Place new coins into the existing clusters without refitting.
+
+        Rows may be raw or cleaned, but every coin needs finite numeric
+        features: a missing or non-numeric supply has no position in PCA
+        space, so it is rejected rather than given an arbitrary cluster.
+        Run clean_coin_data first to drop such rows.
+
+        Args:
+            new_rows: Coin DataFrame indexed by ticker (raw or cleaned)
+
+        Returns:
+            DataFrame with PC columns and Class for each coin
+
+        Raises:
+            ValueError: If any coin has a missing, non-numeric or infinite
+                        TotalCoinsMined or TotalCoinSupply
+        """
+        points = self.project(new_rows)
+        invalid = ~np.isfinite(points).all(axis=1)
+        if invalid.any():
+            tickers = new_rows.index[invalid]
+            raise ValueError(f"{len(tickers)} coins have non-finite {' or '.join(NUMERIC_FEATURES)}: "
+                             f"{', '.join(map(str, tickers[:10]))}")
+        centroids = self.kmeans_.cluster_centers_
+        distance = ((points[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2)
+
+        result = pd.DataFrame(points, index=new_rows.index, columns=PCA_COLUMNS[:self.n_components])
+        result['Class'] = distance.argmin(axis=1)
+        return result
+
+    def predict(self, df: pd.DataFrame) -> np.ndarray:
+        """Assign cleaned coin data to the nearest frozen centroid."""
+        return self.kmeans_.predict(self.transform(df))
+
+    def fit_transform_frame(self, df: pd.DataFrame,
+                            init_centroids: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Fit the model and return the clustered DataFrame used by the apps.
+
+        Args:
+            df: Cleaned coin DataFrame
+            init_centroids: Optional starting centroids in PCA space
+
+        Returns:
+            Copy of df with PC columns and Class labels added
+        """
+        pca_result = self._fit(df, init_centroids)
+        return self.label_frame(df, pca_result, self.kmeans_.labels_)
+
+    def label_frame(self, df: pd.DataFrame, pca_result: np.ndarray, labels: np.ndarray) -> pd.DataFrame:
+        """Attach PCA coordinates and cluster labels to a copy of df."""
+        result_df = df.copy()
+        for i, column in enumerate(PCA_COLUMNS[:self.n_components]):
+            result_df[column] = pca_result[:, i]
+        result_df['Class'] = labels
+        return result_df
+
+
+def cluster_coin_data(df: pd.DataFrame, n_clusters: int = 4,
+                      random_state: int = 42) -> Tuple[pd.DataFrame, ClusteringModel]:
+    """
+    Run the full clustering chain on cleaned coin data.
+
+    Args:
+        df: Cleaned coin DataFrame
+        n_clusters: Number of KMeans clusters
+        random_state: Seed for PCA and KMeans
+
+    Returns:
+        Tuple of (clustered DataFrame, fitted ClusteringModel)
+    """
+    model = ClusteringModel(n_clusters=n_clusters, random_state=random_state)
+    return model.fit_transform_frame(df), model
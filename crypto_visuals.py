@@ -0,0 +1,221 @@
+"""
+Chart Helpers for the Streamlit Apps
+
+Shared data-shaping helpers used by the Plotly figures in the dashboards.
+Keeps large coin universes renderable in the browser by reducing what is
+sent to the client without changing the picture the user sees.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+
+PCA_COLUMNS = ['PC 1', 'PC 2', 'PC 3']
+
+# Default number of points sent to the browser for the 3D PCA scatter
+DEFAULT_POINT_BUDGET = 5000
+
+
+def filter_to_bounds(data: pd.DataFrame,
+                     bounds: Optional[Dict[str, Tuple[float, float]]] = None) -> pd.DataFrame:
+    """
+    Restrict the PCA cloud to a zoomed region.
+
+    Args:
+        data: Clustered DataFrame with PC columns
+        bounds: Mapping of column name to (min, max), e.g. {'PC 1': (-1, 2)}
+
+    Returns:
+        Rows falling inside every requested range
+    """
+    if not bounds:
+        return data
+
+    mask = np.ones(len(data), dtype=bool)
+    for column, (low, high) in bounds.items():
+        values = data[column].to_numpy()
+        mask &= (values >= low) & (values <= high)
+
+    return data[mask]
+
+
+def _centroid_distance(data: pd.DataFrame) -> np.ndarray:
+    """Distance of every point to its own cluster centroid in PCA space."""
+    coords = data[PCA_COLUMNS].to_numpy(dtype=float)
+    centroids = data.groupby('Class')[PCA_COLUMNS].transform('mean').to_numpy(dtype=float)
+    return np.linalg.norm(coords - centroids, axis=1)
+
+
+def _stratified_sample(data: pd.DataFrame, budget: int, random_state: int) -> pd.DataFrame:
+    """Sample each cluster in proportion to its size, keeping every cluster visible within the budget."""
+    if len(data) <= budget:
+        return data
+
+    sizes = data['Class'].value_counts()
+    quotas = np.maximum(1, np.floor(sizes * budget / len(data))).astype(int)
+
+    # The one-point minimum per cluster can push the total over the budget:
+    # take the excess back from the largest quotas, or keep one point of the
+    # largest clusters only when there are more clusters than points
+    excess = int(quotas.sum()) - budget
+    if excess > 0 and len(quotas) >= budget:
+        quotas[:] = 0
+        quotas.iloc[:budget] = 1
+    else:
+        for _ in range(excess):
+            quotas[quotas.idxmax()] -= 1
+
+    # Random rank within each cluster; keep the first `quota` of each
+    rng = np.random.default_rng(random_state)
+    order = rng.permutation(len(data))
+    shuffled_class = data['Class'].iloc[order]
+    rank = shuffled_class.groupby(shuffled_class).cumcount().to_numpy()
+    keep = rank < shuffled_class.map(quotas).to_numpy()
+
+    return data.iloc[np.sort(order[keep])]
+
+
+def _voxel_sample(data: pd.DataFrame, budget: int, random_state: int) -> pd.DataFrame:
+    """
+    Collapse each occupied voxel of the PCA cube to one representative per cluster.
+
+    The representative keeps its own coordinates and hover fields; a
+    'PointCount' column records how many coins it stands for.
+    """
+    coords = data[PCA_COLUMNS].to_numpy(dtype=float)
+    low = coords.min(axis=0)
+    span = np.where(np.ptp(coords, axis=0) > 0, np.ptp(coords, axis=0), 1.0)
+
+    resolution = max(1, int(np.ceil(budget ** (1 / 3))))
+    cells = np.minimum((coords - low) / span * resolution, resolution - 1).astype(np.int64)
+    voxel = (cells[:, 0] * resolution + cells[:, 1]) * resolution + cells[:, 2]
+
+    keys = pd.DataFrame({'Class': data['Class'].to_numpy(), 'voxel': voxel})
+    counts = keys.groupby(['Class', 'voxel'], sort=False)['voxel'].transform('size').to_numpy()
+    first = ~keys.duplicated().to_numpy()
+
+    representatives = data.iloc[np.flatnonzero(first)].copy()
+    representatives['PointCount'] = counts[first]
+
+    return _stratified_sample(representatives, budget, random_state)
+
+
+def downsample_pca_points(data: pd.DataFrame,
+                          max_points: int = DEFAULT_POINT_BUDGET,
+                          method: str = 'stratified',
+                          keep_coins: Optional[List[str]] = None,
+                          outlier_quantile: float = 0.99,
+                          bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+                          random_state: int = 42) -> pd.DataFrame:
+    """
+    Reduce the 3D PCA cloud to a point budget for rendering.
+
+    Outliers (the farthest points from each cluster centroid) and any
+    explicitly selected coins are always kept on top of the sample. Passing
+    `bounds` zooms into a region first, so the same budget buys more detail.
+
+    Args:
+        data: Clustered DataFrame with PC columns, Class and CoinName
+        max_points: Target number of points to send to the browser
+        method: 'stratified' (per-cluster sampling) or 'voxel' (grid aggregation)
+        keep_coins: Coin names that must always be rendered
+        outlier_quantile: Per-cluster distance quantile above which points are kept
+        bounds: Optional zoom region, see filter_to_bounds
+        random_state: Seed for reproducible sampling across reruns
+
+    Returns:
+        DataFrame subset (voxel mode adds a PointCount column)
+    """
+    if method not in ('stratified', 'voxel'):
+        raise ValueError(f"Unknown downsampling method: {method}")
+
+    view = filter_to_bounds(data, bounds)
+    if len(view) <= max_points:
+        return view
+
+    forced = np.zeros(len(view), dtype=bool)
+    if keep_coins:
+        forced |= view['CoinName'].isin(keep_coins).to_numpy()
+
+    distance = _centroid_distance(view)
+    threshold = pd.Series(distance).groupby(view['Class'].to_numpy()).transform(
+        lambda d: d.quantile(outlier_quantile)
+    ).to_numpy()
+    outliers = distance > threshold
+
+    # Cap outliers so they never crowd out the sampled body of the cloud
+    outlier_cap = max(1, max_points // 10)
+    if outliers.sum() > outlier_cap:
+        ranked = np.where(outliers, distance, -np.inf)
+        outliers = np.zeros(len(view), dtype=bool)
+        outliers[np.argpartition(ranked, -outlier_cap)[-outlier_cap:]] = True
+    forced |= outliers
+
+    remaining_budget = max(0, max_points - int(forced.sum()))
+    rest = view[~forced]
+
+    if method == 'voxel':
+        sampled = _voxel_sample(rest, remaining_budget, random_state)
+    else:
+        sampled = _stratified_sample(rest, remaining_budget, random_state)
+
+    kept = view[forced]
+    if 'PointCount' in sampled.columns:
+        kept = kept.assign(PointCount=1)
+
+    return pd.concat([kept, sampled])
+
+
+# Above this many points the supply scatter switches to WebGL traces
+WEBGL_THRESHOLD = 2000
+
+
+def hexbin(x: np.ndarray, y: np.ndarray, gridsize: int = 40) -> Dict[str, np.ndarray]:
+    """
+    Bin points into a hexagonal grid.
+
+    Uses the two offset rectangular lattices that make up a hex grid and
+    assigns each point to the nearer centre, so the whole pass is vectorized.
+
+    Args:
+        x: Horizontal coordinates (already transformed if plotting on log axes)
+        y: Vertical coordinates
+        gridsize: Number of hexagons across the x range
+
+    Returns:
+        Dictionary with 'cell' (cell position for every point), 'x' and 'y'
+        (cell centres) and 'count' (points per cell)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    nx = gridsize
+    ny = max(1, int(nx / np.sqrt(3)))
+    x_min, y_min = x.min(), y.min()
+    step_x = (x.max() - x_min) / nx or 1.0
+    step_y = (y.max() - y_min) / ny or 1.0
+
+    gx = (x - x_min) / step_x
+    gy = (y - y_min) / step_y
+
+    ix1, iy1 = np.round(gx), np.round(gy)
+    ix2, iy2 = np.floor(gx), np.floor(gy)
+    d1 = (gx - ix1) ** 2 + 3.0 * (gy - iy1) ** 2
+    d2 = (gx - ix2 - 0.5) ** 2 + 3.0 * (gy - iy2 - 0.5) ** 2
+    on_first = d1 < d2
+
+    centre_x = np.where(on_first, ix1, ix2 + 0.5)
+    centre_y = np.where(on_first, iy1, iy2 + 0.5)
+
+    # Doubling makes both lattices integral so each cell gets an exact scalar key
+    rows = 2 * ny + 2
+    keys = (centre_x * 2).astype(np.int64) * rows + (centre_y * 2).astype(np.int64)
+    unique_keys, cell, counts = np.unique(keys, return_inverse=True, return_counts=True)
+
+    return {
+        'cell': cell.ravel(),
+        'x': (unique_keys // rows) / 2.0 * step_x + x_min,
+        'y': (unique_keys % rows) / 2.0 * step_y + y_min,
+        'count': counts
+    }
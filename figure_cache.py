@@ -0,0 +1,159 @@
+"""
+Plotly Figure Cache
+
+Plotly figures keyed by dataset fingerprint and figure parameters.
+Built figures are held in an in-process LRU (shared by every Streamlit
+session) and optionally mirrored to disk as JSON, so reruns and page
+switches reuse the figure instead of rebuilding it from the DataFrame.
+Cached figures are shared between sessions and must be treated as
+read-only.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from instrumentation import PAGE_PROFILER
+
+
+def dataset_fingerprint(data: pd.DataFrame) -> str:
+    """
+    Compute a stable content hash for a DataFrame.
+
+    Hashing reads every value, so compute it once where the data is loaded
+    (inside the cached loader) and pass the result along; st.cache_data
+    hands out a fresh copy of the frame on every rerun.
+
+    Args:
+        data: DataFrame to fingerprint
+
+    Returns:
+        Hex digest identifying the dataset version
+    """
+    digest = hashlib.sha1()
+    digest.update(','.join(map(str, data.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+class FigureCache:
+    """
+    Thread-safe LRU cache of Plotly figures with an optional JSON disk tier.
+    """
+
+    def __init__(self, max_entries: int = 64, cache_dir: Optional[str] = None):
+        """
+        Initialize the figure cache.
+
+        Args:
+            max_entries: Number of figures kept in memory before evicting the oldest
+            cache_dir: Optional directory for persisting figures as JSON across processes
+        """
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._entries: 'OrderedDict[str, go.Figure]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(name: str, fingerprint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build a cache key from figure name, dataset fingerprint and parameters."""
+        payload = json.dumps(params or {}, sort_keys=True, default=str)
+        digest = hashlib.sha1(payload.encode()).hexdigest()[:16]
+        return f"{name}-{fingerprint}-{digest}"
+
+    def get(self, key: str) -> Optional[go.Figure]:
+        """Return a cached figure, checking memory first and then disk."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        if self.cache_dir is not None:
+            path = self.cache_dir / f"{key}.json"
+            if path.exists():
+                # Decoded once; later hits are served from memory
+                figure = pio.from_json(path.read_text())
+                self._store(key, figure)
+                with self._lock:
+                    self.hits += 1
+                return figure
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, figure: go.Figure) -> None:
+        """Store a figure in memory and, if configured, as JSON on disk."""
+        self._store(key, figure)
+
+        if self.cache_dir is not None:
+            path = self.cache_dir / f"{key}.json"
+            # Unique temp file per write: sessions are threads of one process
+            with tempfile.NamedTemporaryFile('w', dir=self.cache_dir, prefix=path.name,
+                                             suffix='.tmp', delete=False) as f:
+                f.write(figure.to_json())
+            os.replace(f.name, path)
+
+    def _store(self, key: str, figure: go.Figure) -> None:
+        with self._lock:
+            self._entries[key] = figure
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_build(self, name: str, fingerprint: str, builder: Callable,
+                     params: Optional[Dict[str, Any]] = None):
+        """
+        Return a cached figure, building and caching it on a miss.
+
+        Args:
+            name: Figure name, e.g. 'scatter_3d'
+            fingerprint: dataset_fingerprint of the data the figure is built from
+            builder: Zero-argument callable returning a Plotly figure
+            params: Figure parameters that change its appearance
+
+        Returns:
+            Plotly Figure (shared with other callers; do not modify it)
+        """
+        with PAGE_PROFILER.profile('figure', name):
+            key = self.make_key(name, fingerprint, params)
+            figure = self.get(key)
+
+            if figure is None:
+                figure = builder()
+                self.put(key, figure)
+
+            return figure
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (disk entries are left in place)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+# Process-wide cache shared by all app sessions.
+# Set CRYPTO_FIGURE_CACHE_DIR to also persist figures on disk.
+FIGURE_CACHE = FigureCache(
+    max_entries=int(os.environ.get('CRYPTO_FIGURE_CACHE_SIZE', 64)),
+    cache_dir=os.environ.get('CRYPTO_FIGURE_CACHE_DIR')
+)
@@ -0,0 +1,226 @@
+"""
+Cluster Insight Rules
+
+Declarative rules behind cluster naming and the investment considerations,
+opportunities and warnings in CryptoAIAnalyzer profiles. Each rule is a
+list of (column, operator, value) conditions over the per-cluster
+statistics table, ANDed together, plus the text it produces:
+
+    {'section': 'warnings', 'when': [('size', '<', 10)],
+     'text': "⚠️ Small cluster may indicate niche or outdated technologies"}
+
+Rules sharing a `group` within a section form an if/elif chain: only the
+first matching rule of the group applies. Text may reference table columns,
+e.g. "Dominant: {top_algorithm}".
+
+RuleEngine compiles the conditions once and evaluates each rule as one
+vectorized comparison over all clusters, so adding rules costs one array
+operation each rather than another pass per cluster and profile.
+"""
+
+import operator
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Statistics table columns the rules can read (one row per cluster):
+#   size, avg_supply, supply_dispersion (supply std / mean),
+#   top_algorithm, top_proof, top_algorithms (tuple of the top 3),
+#   established_<rule> (bool, see ESTABLISHED_TIERS), risk_score
+CLUSTER_RULES: List[Dict[str, Any]] = [
+    # Cluster name, description and key features (first match wins)
+    {'section': 'characteristics', 'group': 'profile',
+     'when': [('established_characteristics', '==', True)],
+     'name': "Established Major Cryptocurrencies",
+     'description': "Industry-leading cryptocurrencies with high market adoption and proven track records",
+     'features': ["Market Leaders", "High Liquidity", "Strong Community", "Proven Technology"]},
+    {'section': 'characteristics', 'group': 'profile',
+     'when': [('avg_supply', '>', 1e9)],
+     'name': "High-Supply Altcoins",
+     'description': "Cryptocurrencies with large total supply, often targeting mass adoption",
+     'features': ["Large Supply Base", "Dominant: {top_algorithm}", "Mass Market Focus",
+                  "Lower Individual Token Value"]},
+    {'section': 'characteristics', 'group': 'profile',
+     'when': [('avg_supply', '<', 1e7), ('top_proof', '==', 'PoS')],
+     'name': "Scarcity-Focused PoS Coins",
+     'description': "Proof-of-Stake coins with limited supply, emphasizing scarcity and staking rewards",
+     'features': ["Limited Supply", "Staking Mechanisms", "Energy Efficient", "Deflationary Pressure"]},
+    {'section': 'characteristics', 'group': 'profile',
+     'when': [('top_algorithm', 'contains', 'Scrypt')],
+     'name': "Scrypt-Based Mining Coins",
+     'description': "Cryptocurrencies using Scrypt algorithm, often Litecoin-inspired",
+     'features': ["Scrypt Algorithm", "GPU-Friendly Mining", "Fast Transactions", "Alternative to SHA-256"]},
+    {'section': 'characteristics', 'group': 'profile',
+     'when': [],
+     'name': "{top_algorithm} Cluster",
+     'description': "Cryptocurrencies primarily using {top_algorithm} algorithm with {top_proof} consensus",
+     'features': ["Algorithm: {top_algorithm}", "Consensus: {top_proof}", "Niche Market Position",
+                  "Specialized Use Cases"]},
+
+    # Key considerations
+    {'section': 'considerations', 'group': 'algorithm',
+     'when': [('top_algorithm', '==', 'SHA-256')],
+     'text': "SHA-256 coins compete directly with Bitcoin for mining resources"},
+    {'section': 'considerations', 'group': 'algorithm',
+     'when': [('top_algorithm', '==', 'Scrypt')],
+     'text': "Scrypt algorithm offers faster block times but different security model"},
+    {'section': 'considerations', 'group': 'proof',
+     'when': [('top_proof', 'contains', 'PoS')],
+     'text': "Proof-of-Stake enables passive income through staking"},
+    {'section': 'considerations', 'group': 'proof',
+     'when': [('top_proof', '==', 'PoW')],
+     'text': "Proof-of-Work provides battle-tested security but higher energy costs"},
+    {'section': 'considerations',
+     'when': [('avg_supply', '==', 0)],
+     'text': "Unlimited supply may lead to inflationary pressure"},
+
+    # Opportunities
+    {'section': 'opportunities',
+     'when': [('established_opportunities', '==', True)],
+     'text': "Exposure to industry-leading cryptocurrencies with proven adoption"},
+    {'section': 'opportunities',
+     'when': [('size', '>', 30)],
+     'text': "Large cluster provides good diversification within similar assets"},
+    {'section': 'opportunities',
+     'when': [('top_algorithms', 'includes', 'Equihash')],
+     'text': "Privacy-focused cryptocurrencies with growing demand"},
+    {'section': 'opportunities',
+     'when': [('top_algorithms', 'includes', 'Ethash')],
+     'text': "Smart contract platforms with DeFi and NFT ecosystems"},
+
+    # Warnings
+    {'section': 'warnings',
+     'when': [('risk_score', '>', 7)],
+     'text': "⚠️ HIGH RISK: Significant potential for losses"},
+    {'section': 'warnings',
+     'when': [('size', '<', 10)],
+     'text': "⚠️ Small cluster may indicate niche or outdated technologies"},
+    {'section': 'warnings',
+     'when': [('supply_dispersion', '>', 2)],
+     'text': "⚠️ High volatility in supply metrics across cluster"}
+]
+
+# Text used when no rule of a list section matches
+SECTION_DEFAULTS = {
+    'considerations': [],
+    'opportunities': ["Research individual projects for unique value propositions"],
+    'warnings': ["✓ No major red flags identified"]
+}
+
+
+def _contains(column: pd.Series, value: str) -> np.ndarray:
+    return column.astype(str).str.contains(value, regex=False).to_numpy()
+
+
+def _includes(column: pd.Series, value: Any) -> np.ndarray:
+    return np.fromiter((value in items for items in column), dtype=bool, count=len(column))
+
+
+OPERATORS: Dict[str, Callable[[pd.Series, Any], Any]] = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    'contains': _contains,   # substring of a text column
+    'includes': _includes    # member of a tuple column
+}
+
+
+class RuleEngine:
+    """
+    Compiled rule table evaluated over the per-cluster statistics table.
+    """
+
+    def __init__(self, rules: Optional[List[Dict[str, Any]]] = None):
+        """
+        Compile the rules.
+
+        Args:
+            rules: Rule dictionaries (defaults to CLUSTER_RULES)
+
+        Raises:
+            ValueError: If a rule uses an unknown operator
+        """
+        self.rules = CLUSTER_RULES if rules is None else rules
+        self._conditions = []
+
+        for rule in self.rules:
+            compiled = []
+            for column, op, value in rule['when']:
+                if op not in OPERATORS:
+                    raise ValueError(f"Unknown rule operator {op!r} in {rule}")
+                compiled.append((column, OPERATORS[op], value))
+            self._conditions.append(compiled)
+
+    def match(self, table: pd.DataFrame) -> np.ndarray:
+        """
+        Evaluate every rule for every cluster.
+
+        Args:
+            table: Statistics table with one row per cluster
+
+        Returns:
+            Boolean matrix of shape (rules, clusters)
+        """
+        matches = np.ones((len(self.rules), len(table)), dtype=bool)
+        for i, conditions in enumerate(self._conditions):
+            for column, compare, value in conditions:
+                matches[i] &= np.asarray(compare(table[column], value), dtype=bool)
+        return matches
+
+    def evaluate(self, table: pd.DataFrame) -> Dict[Any, Dict[str, Any]]:
+        """
+        Apply the rules and render their text for every cluster.
+
+        Args:
+            table: Statistics table indexed by cluster ID
+
+        Returns:
+            Dictionary mapping cluster ID to {'characteristics': dict,
+            'considerations': [...], 'opportunities': [...], 'warnings': [...]}
+        """
+        matches = self.match(table)
+        rows = table.to_dict(orient='index')
+        results = {}
+
+        for position, cluster_id in enumerate(table.index):
+            row = rows[cluster_id]
+            result: Dict[str, Any] = {'characteristics': None}
+            result.update({section: [] for section in SECTION_DEFAULTS})
+            decided_groups = set()
+
+            for rule, matched in zip(self.rules, matches[:, position]):
+                if not matched:
+                    continue
+
+                section = rule['section']
+                group = rule.get('group')
+                if group is not None:
+                    if (section, group) in decided_groups:
+                        continue
+                    decided_groups.add((section, group))
+
+                if section == 'characteristics':
+                    result['characteristics'] = {
+                        'name': rule['name'].format(**row),
+                        'description': rule['description'].format(**row),
+                        'features': [feature.format(**row) for feature in rule['features']]
+                    }
+                else:
+                    result[section].append(rule['text'].format(**row))
+
+            for section, default in SECTION_DEFAULTS.items():
+                if not result[section]:
+                    result[section] = list(default)
+
+            results[cluster_id] = result
+
+        return results
+
+
+# Compiled once at import and shared by every analyzer
+DEFAULT_RULE_ENGINE = RuleEngine()
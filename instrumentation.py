@@ -0,0 +1,460 @@
+"""
+Pipeline Instrumentation
+
+Records wall time, CPU time and memory for named pipeline stages
+(CSV parsing, encoding, scaling, PCA, KMeans) and CryptoAIAnalyzer
+methods. Measurements go to a process-wide, bounded recorder that the apps
+show in an optional diagnostics panel and that can be exported as JSON.
+
+    with stage('pipeline.pca'):
+        ...
+
+    @instrumented('analyzer.generate_cluster_profile')
+    def generate_cluster_profile(self, cluster_id): ...
+
+CPU time is process CPU time, so it includes BLAS worker threads (and any
+other session working at the same moment). Peak RSS is a process-lifetime
+high-water mark, not a per-stage figure, so it is reported once per export
+(process_peak_rss_mb()) rather than on each event. Per-stage peak Python
+allocations are recorded only while tracemalloc is running
+(enable_memory_tracking() or CRYPTO_TRACE_MEMORY=1), because tracing slows
+allocation-heavy code. The tracemalloc peak is process-global and every
+stage resets it, so these peaks are only accurate while one thread runs
+stages at a time (a CLI run, warmup, a single Streamlit session); with
+concurrent sessions a stage's peak can be cut short by another thread's
+reset. Each event is also logged as JSON at DEBUG level on this module's
+logger.
+
+PAGE_PROFILER is an opt-in companion for the Streamlit apps: with
+CRYPTO_PROFILE_PAGES=1 it times every page render and figure build into
+per-name latency histograms. When CRYPTO_PROFILE_DIR is also set, each page
+render runs under cProfile and the dumps of the slowest renders per page are
+kept in that directory (open them with snakeviz or pstats).
+
+Uses only the standard library, so it is cheap to import everywhere;
+display_diagnostics_panel() imports pandas and Streamlit when called.
+"""
+
+import cProfile
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+logger = logging.getLogger(__name__)
+
+MAX_EVENTS = 2000
+
+# Upper bounds (ms) of the page latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+
+def process_peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux and bytes on macOS
+    return peak / (1024 * 1024) if os.uname().sysname == 'Darwin' else peak / 1024
+
+
+class StageRecorder:
+    """
+    Thread-safe, bounded store of stage measurements.
+    """
+
+    def __init__(self, max_events: int = MAX_EVENTS):
+        """
+        Initialize the recorder.
+
+        Args:
+            max_events: Number of most recent events kept
+        """
+        self._events = deque(maxlen=max_events)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _peak_stack(self) -> List[int]:
+        stack = getattr(self._local, 'peaks', None)
+        if stack is None:
+            stack = self._local.peaks = []
+        return stack
+
+    @contextmanager
+    def stage(self, name: str, **details) -> Iterator[None]:
+        """
+        Measure a block of code as one stage.
+
+        With tracemalloc running, the event's peak_alloc_mb is the stage's
+        peak Python allocation; it is only reliable when no other thread is
+        inside a stage at the same time (see the module docstring).
+
+        Args:
+            name: Stage name, e.g. 'pipeline.kmeans'
+            **details: Extra JSON-serializable fields stored with the event (e.g. rows)
+        """
+        tracing = tracemalloc.is_tracing()
+        peaks = self._peak_stack()
+        if tracing:
+            # Nested stages reset the tracemalloc peak, so each level keeps its own running maximum
+            if peaks:
+                peaks[-1] = max(peaks[-1], tracemalloc.get_traced_memory()[1])
+            start_traced = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            peaks.append(0)
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            event = {
+                'stage': name,
+                'timestamp': time.time(),
+                'wall_s': time.perf_counter() - wall_start,
+                'cpu_s': time.process_time() - cpu_start,
+                'thread': threading.current_thread().name
+            }
+            if tracing:
+                peak = max(peaks.pop(), tracemalloc.get_traced_memory()[1])
+                event['peak_alloc_mb'] = max(peak - start_traced, 0) / (1024 * 1024)
+                if peaks:
+                    peaks[-1] = max(peaks[-1], peak)
+            if error:
+                event['error'] = error
+            event.update(details)
+            self.record(event)
+
+    def record(self, event: Dict) -> None:
+        """Store one event and log it as JSON."""
+        with self._lock:
+            self._events.append(event)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(json.dumps(event, default=str))
+
+    def events(self, prefix: Optional[str] = None) -> List[Dict]:
+        """
+        Return recorded events, oldest first.
+
+        Args:
+            prefix: Only return stages whose name starts with this prefix
+
+        Returns:
+            List of event dictionaries
+        """
+        with self._lock:
+            events = list(self._events)
+        if prefix:
+            events = [e for e in events if e['stage'].startswith(prefix)]
+        return events
+
+    def summary(self, prefix: Optional[str] = None) -> List[Dict]:
+        """
+        Aggregate events per stage.
+
+        Args:
+            prefix: Only summarize stages whose name starts with this prefix
+
+        Returns:
+            One dictionary per stage with call count, total/mean/max wall
+            time, total CPU time, the last call's wall time and max peak
+            allocation, sorted by total wall time (slowest first)
+        """
+        stages: Dict[str, Dict] = {}
+        for event in self.events(prefix):
+            row = stages.setdefault(event['stage'], {
+                'stage': event['stage'], 'calls': 0, 'total_wall_s': 0.0, 'max_wall_s': 0.0,
+                'total_cpu_s': 0.0, 'last_wall_s': 0.0, 'peak_alloc_mb': None
+            })
+            row['calls'] += 1
+            row['total_wall_s'] += event['wall_s']
+            row['max_wall_s'] = max(row['max_wall_s'], event['wall_s'])
+            row['total_cpu_s'] += event['cpu_s']
+            row['last_wall_s'] = event['wall_s']
+            if event.get('peak_alloc_mb') is not None:
+                row['peak_alloc_mb'] = max(row['peak_alloc_mb'] or 0.0, event['peak_alloc_mb'])
+
+        rows = list(stages.values())
+        for row in rows:
+            row['mean_wall_s'] = row['total_wall_s'] / row['calls']
+        return sorted(rows, key=lambda r: r['total_wall_s'], reverse=True)
+
+    def to_json(self) -> str:
+        """Export the process peak RSS, the summary and raw events as a JSON document."""
+        return json.dumps({'process_peak_rss_mb': process_peak_rss_mb(), 'summary': self.summary(),
+                           'events': self.events()}, default=str, indent=2)
+
+    def export_json(self, path: str) -> None:
+        """Write to_json() output to a file."""
+        with open(path, 'w') as f:
+            f.write(self.to_json())
+
+    def clear(self) -> None:
+        """Drop all recorded events."""
+        with self._lock:
+            self._events.clear()
+
+
+RECORDER = StageRecorder()
+
+
+def stage(name: str, **details):
+    """Measure a block of code as a stage on the process-wide recorder."""
+    return RECORDER.stage(name, **details)
+
+
+def instrumented(name: Optional[str] = None) -> Callable:
+    """
+    Decorator that records each call of a function as a stage.
+
+    Args:
+        name: Stage name (defaults to the function's qualified name)
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        stage_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with RECORDER.stage(stage_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class PageProfiler:
+    """
+    Opt-in latency histograms and cProfile dumps for page renders and figure builds.
+    """
+
+    def __init__(self, enabled: bool = False, profile_dir: Optional[str] = None,
+                 keep_slowest: int = 3, window: int = 500):
+        """
+        Initialize the profiler.
+
+        Args:
+            enabled: Record timings (when False, profile() is a no-op)
+            profile_dir: Directory for cProfile dumps of page renders (None disables cProfile)
+            keep_slowest: Dumps kept per page (the slowest renders win)
+            window: Recent latencies kept per name for percentiles
+        """
+        self.enabled = enabled
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+        self.keep_slowest = keep_slowest
+        self.window = window
+        self._stats: Dict[tuple, Dict] = {}
+        self._dumps: Dict[str, List[tuple]] = {}
+        self._lock = threading.Lock()
+
+    def _stats_for(self, kind: str, name: str) -> Dict:
+        key = (kind, name)
+        if key not in self._stats:
+            self._stats[key] = {
+                'count': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                'buckets': [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                'recent': deque(maxlen=self.window)
+            }
+        return self._stats[key]
+
+    @contextmanager
+    def profile(self, kind: str, name: str) -> Iterator[None]:
+        """
+        Time a page render ('page') or figure build ('figure').
+
+        Page renders also run under cProfile when a profile directory is set.
+        cProfile cannot nest, so a render that starts while another profile
+        is active (e.g. a concurrent session) is only timed.
+
+        Args:
+            kind: 'page' or 'figure'
+            name: Page title or figure name
+        """
+        if not self.enabled:
+            yield
+            return
+
+        profiler = None
+        if kind == 'page' and self.profile_dir is not None:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                profiler = None
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if profiler is not None:
+                profiler.disable()
+            self._record(kind, name, elapsed_ms, profiler)
+
+    def _record(self, kind: str, name: str, elapsed_ms: float,
+                profiler: Optional[cProfile.Profile]) -> None:
+        bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if elapsed_ms <= bound),
+                      len(LATENCY_BUCKETS_MS))
+        with self._lock:
+            stats = self._stats_for(kind, name)
+            stats['count'] += 1
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+            stats['buckets'][bucket] += 1
+            stats['recent'].append(elapsed_ms)
+
+            if profiler is None:
+                return
+            dumps = self._dumps.setdefault(name, [])
+            if len(dumps) >= self.keep_slowest and elapsed_ms <= dumps[0][0]:
+                return
+
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            safe_name = ''.join(c if c.isalnum() else '_' for c in name).strip('_') or 'page'
+            path = self.profile_dir / f"{safe_name}_{int(time.time() * 1000)}_{elapsed_ms:.0f}ms.prof"
+            profiler.dump_stats(str(path))
+
+            dumps.append((elapsed_ms, path))
+            dumps.sort(key=lambda item: item[0])
+            while len(dumps) > self.keep_slowest:
+                _, evicted = dumps.pop(0)
+                evicted.unlink(missing_ok=True)
+
+    def histogram(self, kind: str, name: str) -> List[Dict]:
+        """
+        Latency histogram for one page or figure.
+
+        Returns:
+            List of {'bucket': label, 'count': n} in bucket order
+        """
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        with self._lock:
+            stats = self._stats.get((kind, name))
+            counts = list(stats['buckets']) if stats else [0] * len(labels)
+        return [{'bucket': label, 'count': count} for label, count in zip(labels, counts)]
+
+    def slowest(self, kind: str = 'page', limit: int = 10) -> List[Dict]:
+        """
+        Pages (or figures) ordered by 95th percentile latency.
+
+        Args:
+            kind: 'page' or 'figure'
+            limit: Maximum rows returned
+
+        Returns:
+            Rows with name, renders, mean/p50/p95/max ms and kept profile dumps
+        """
+        rows = []
+        with self._lock:
+            for (row_kind, name), stats in self._stats.items():
+                if row_kind != kind:
+                    continue
+                recent = sorted(stats['recent'])
+                rows.append({
+                    'name': name,
+                    'renders': stats['count'],
+                    'mean_ms': stats['total_ms'] / stats['count'],
+                    'p50_ms': recent[len(recent) // 2],
+                    'p95_ms': recent[min(len(recent) - 1, int(len(recent) * 0.95))],
+                    'max_ms': stats['max_ms'],
+                    'profiles': [str(path) for _, path in self._dumps.get(name, [])] if kind == 'page' else []
+                })
+        rows.sort(key=lambda r: r['p95_ms'], reverse=True)
+        return rows[:limit]
+
+    def reset(self) -> None:
+        """Drop all recorded latencies (profile dumps stay on disk)."""
+        with self._lock:
+            self._stats.clear()
+            self._dumps.clear()
+
+
+PAGE_PROFILER = PageProfiler(
+    enabled=os.environ.get('CRYPTO_PROFILE_PAGES') == '1',
+    profile_dir=os.environ.get('CRYPTO_PROFILE_DIR')
+)
+
+
+def enable_memory_tracking() -> None:
+    """Start tracemalloc so stages also record peak Python allocations."""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def disable_memory_tracking() -> None:
+    """Stop tracemalloc."""
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def display_diagnostics_panel() -> None:
+    """
+    Streamlit sidebar panel with per-stage timing and memory, plus the
+    slowest pages and figures when PAGE_PROFILER is enabled.
+
+    Shown when the "Show diagnostics" checkbox is ticked (on by default with
+    CRYPTO_DIAGNOSTICS=1). Call it inside the app's sidebar.
+    """
+    import pandas as pd
+    import streamlit as st
+
+    if not st.checkbox("Show diagnostics", value=os.environ.get('CRYPTO_DIAGNOSTICS') == '1'):
+        return
+
+    peak_rss = process_peak_rss_mb()
+    if peak_rss is not None:
+        st.caption(f"Process peak RSS: {peak_rss:,.0f} MB")
+
+    summary = pd.DataFrame(RECORDER.summary())
+    if summary.empty:
+        st.caption("No pipeline stages recorded yet")
+    else:
+        columns = ['stage', 'calls', 'last_wall_s', 'total_wall_s', 'total_cpu_s', 'peak_alloc_mb']
+        st.dataframe(summary[columns].round(4), use_container_width=True, hide_index=True)
+        st.download_button(
+            "Download diagnostics JSON",
+            RECORDER.to_json(),
+            file_name="pipeline_diagnostics.json",
+            mime="application/json"
+        )
+
+    if PAGE_PROFILER.enabled:
+        st.markdown("**Slowest pages**")
+        slowest = pd.DataFrame(PAGE_PROFILER.slowest('page'))
+        if slowest.empty:
+            st.caption("No page renders profiled yet")
+        else:
+            slowest['profiles'] = slowest['profiles'].map(len)
+            st.dataframe(slowest.round(1), use_container_width=True, hide_index=True)
+            histogram = pd.DataFrame(PAGE_PROFILER.histogram('page', slowest['name'].iloc[0]))
+            st.caption(f"Render latency histogram: {slowest['name'].iloc[0]}")
+            st.bar_chart(histogram.set_index('bucket'))
+
+        figures = pd.DataFrame(PAGE_PROFILER.slowest('figure'))
+        if not figures.empty:
+            st.markdown("**Slowest figures**")
+            st.dataframe(figures.drop(columns='profiles').round(1), use_container_width=True, hide_index=True)
+
+
+if os.environ.get('CRYPTO_TRACE_MEMORY') == '1':
+    enable_memory_tracking()
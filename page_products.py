@@ -0,0 +1,55 @@
+"""
+Lazy Data Products for Streamlit Pages
+
+Each page declares the data products it needs (e.g. 'data', 'analyzer');
+products are computed on first access and memoized for the rest of the
+rerun. Pages that declare nothing never load CSVs or fit models.
+"""
+
+from typing import Any, Callable, Dict, Iterable
+
+
+class DataProducts:
+    """
+    Named, lazily computed values for one app rerun.
+
+    Providers receive this object, so one product can depend on another:
+
+        products = DataProducts(
+            data=lambda p: load_data(),
+            analyzer=lambda p: CryptoAIAnalyzer(p['data'])
+        )
+    """
+
+    def __init__(self, **providers: Callable[['DataProducts'], Any]):
+        """
+        Initialize with one provider callable per product name.
+
+        Args:
+            **providers: Mapping of product name to provider callable
+        """
+        self._providers = providers
+        self._values: Dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._values:
+            if name not in self._providers:
+                raise KeyError(f"Unknown data product: {name}")
+            self._values[name] = self._providers[name](self)
+        return self._values[name]
+
+    def is_computed(self, name: str) -> bool:
+        """Check whether a product has already been computed."""
+        return name in self._values
+
+    def resolve(self, names: Iterable[str]) -> Dict[str, Any]:
+        """
+        Compute the requested products.
+
+        Args:
+            names: Product names a page declared
+
+        Returns:
+            Dictionary of product name to value, suitable as keyword arguments
+        """
+        return {name: self[name] for name in names}
@@ -0,0 +1,223 @@
+"""
+Parallel Multi-Dataset Analysis
+
+Runs the load_clustered_data -> CryptoAIAnalyzer -> export_analysis_report
+chain for many clustered datasets at once and combines the per-dataset
+summaries into one table:
+
+    results = analyze_datasets({'2018': clustered_2018, '2025': clustered_2025},
+                               subsets_by='ProofType', output_dir='reports')
+
+Datasets are distributed across a process pool. In-memory DataFrames are
+not pickled to the workers: each one is copied once into a shared memory
+block (numeric columns as raw arrays, text columns as dictionary codes) and
+workers attach to it by name. Subsets such as per-exchange or per-proof-type
+slices are described by a (column, value) filter, so every subset of a
+dataset reads the same shared block. Clustered CSV paths are read by the
+workers themselves. Only small summary dictionaries travel back.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+class SharedFrame:
+    """
+    A DataFrame copied into one shared memory block.
+
+    The picklable `spec` describes the block layout; attach(spec) rebuilds
+    the DataFrame in another process without the data being pickled.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Copy a DataFrame into shared memory.
+
+        Args:
+            data: DataFrame with numeric, boolean and text columns
+        """
+        arrays = []
+        columns = []
+
+        for name, values in [('__index__', data.index)] + list(data.items()):
+            if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+                array = np.ascontiguousarray(np.asarray(values))
+                categories = None
+            else:
+                codes, uniques = pd.factorize(pd.Series(values), use_na_sentinel=True)
+                array = codes.astype(np.int32)
+                categories = [None if pd.isna(u) else str(u) for u in uniques]
+            arrays.append(array)
+            columns.append({'name': name, 'dtype': array.dtype.str, 'categories': categories})
+
+        offsets = []
+        size = 0
+        for array in arrays:
+            size = -(-size // 8) * 8  # keep every column 8-byte aligned
+            offsets.append(size)
+            size += array.nbytes
+
+        self.shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for array, offset, column in zip(arrays, offsets, columns):
+            target = np.ndarray(array.shape, dtype=array.dtype, buffer=self.shm.buf, offset=offset)
+            target[:] = array
+            column['offset'] = offset
+
+        self.spec = {'shm_name': self.shm.name, 'rows': len(data), 'columns': columns}
+
+    @staticmethod
+    def attach(spec: Dict) -> pd.DataFrame:
+        """
+        Rebuild the DataFrame from a spec created in another process.
+
+        Args:
+            spec: SharedFrame.spec
+
+        Returns:
+            DataFrame with the original columns and index
+        """
+        shm = shared_memory.SharedMemory(name=spec['shm_name'])
+        try:
+            values = {}
+            for column in spec['columns']:
+                array = np.ndarray((spec['rows'],), dtype=np.dtype(column['dtype']),
+                                   buffer=shm.buf, offset=column['offset'])
+                if column['categories'] is not None:
+                    # Decode to plain object columns so value_counts behaves as with CSV input
+                    vocabulary = np.asarray(column['categories'] + [None], dtype=object)
+                    values[column['name']] = vocabulary[array]
+                else:
+                    values[column['name']] = array.copy()
+        finally:
+            shm.close()
+
+        index = values.pop('__index__')
+        return pd.DataFrame(values, index=pd.Index(index))
+
+    def close(self) -> None:
+        """Release and destroy the shared block (call once in the owning process)."""
+        self.shm.close()
+        self.shm.unlink()
+
+
+# Frames attached by this worker process, keyed by shared memory name
+_ATTACHED: Dict[str, pd.DataFrame] = {}
+
+
+def _analysis_summary(name: str, data: pd.DataFrame, output_dir: Optional[str]) -> Dict:
+    """Analyze one dataset and return its summary row."""
+    from crypto_ai_insights import load_clustered_data
+
+    start = time.perf_counter()
+    analyzer = load_clustered_data(dataframe=data)
+    risk_scores = analyzer.get_risk_scores()
+    sizes = data['Class'].value_counts()
+
+    report_path = None
+    if output_dir:
+        safe_name = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in name)
+        report_path = str(Path(output_dir) / f"{safe_name}_report.md")
+        analyzer.export_analysis_report(report_path)
+
+    risk_levels = [risk['level'] for risk in risk_scores.values()]
+    return {
+        'dataset': name,
+        'status': 'ok',
+        'coins': len(data),
+        'clusters': len(analyzer.cluster_stats),
+        'largest_cluster_share': float(sizes.max() / len(data)),
+        'mean_risk_score': float(np.mean([risk['score'] for risk in risk_scores.values()])),
+        'high_risk_clusters': risk_levels.count('High'),
+        'low_risk_clusters': risk_levels.count('Low'),
+        'top_algorithm': str(data['Algorithm'].mode().iloc[0]),
+        'report': report_path,
+        'seconds': time.perf_counter() - start
+    }
+
+
+def _run_task(task: Dict) -> Dict:
+    """Resolve a task's data (shared block or CSV path) and analyze it (runs in a worker)."""
+    try:
+        if 'spec' in task:
+            shm_name = task['spec']['shm_name']
+            if shm_name not in _ATTACHED:
+                _ATTACHED[shm_name] = SharedFrame.attach(task['spec'])
+            data = _ATTACHED[shm_name]
+        else:
+            data = pd.read_csv(task['path'], index_col=0)
+
+        if task.get('filter') is not None:
+            column, value = task['filter']
+            data = data[data[column] == value]
+            if data.empty:
+                raise ValueError(f"No rows where {column} == {value}")
+
+        return _analysis_summary(task['name'], data, task.get('output_dir'))
+    except Exception as e:
+        return {'dataset': task['name'], 'status': 'error', 'error': f"{type(e).__name__}: {e}"}
+
+
+def analyze_datasets(datasets: Dict[str, Union[pd.DataFrame, str]],
+                     subsets_by: Optional[str] = None,
+                     min_subset_size: int = 20,
+                     output_dir: Optional[str] = None,
+                     workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Analyze many clustered datasets (and optionally their subsets) in parallel.
+
+    Args:
+        datasets: Name -> clustered DataFrame or clustered CSV path
+        subsets_by: Also analyze each in-memory dataset split by this column
+                    (e.g. 'Exchange' or 'ProofType')
+        min_subset_size: Skip subsets with fewer coins
+        output_dir: Write one Markdown report per dataset/subset and the
+                    combined summary (combined_summary.csv) here
+        workers: Worker processes (defaults to CPU count; 1 runs in-process)
+
+    Returns:
+        DataFrame with one summary row per dataset and subset
+    """
+    if output_dir:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    shared: List[SharedFrame] = []
+    tasks = []
+    try:
+        for name, source in datasets.items():
+            if isinstance(source, pd.DataFrame):
+                frame = SharedFrame(source)
+                shared.append(frame)
+                tasks.append({'name': name, 'spec': frame.spec, 'output_dir': output_dir})
+
+                if subsets_by is not None:
+                    counts = source[subsets_by].value_counts()
+                    for value in counts[counts >= min_subset_size].index:
+                        tasks.append({'name': f"{name}/{subsets_by}={value}", 'spec': frame.spec,
+                                      'filter': (subsets_by, value), 'output_dir': output_dir})
+            else:
+                tasks.append({'name': name, 'path': str(source), 'output_dir': output_dir})
+
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(tasks) <= 1:
+            results = [_run_task(task) for task in tasks]
+        else:
+            # Large chunks keep tasks for the same dataset on a worker that already attached it
+            chunksize = max(1, len(tasks) // (workers * 2))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_run_task, tasks, chunksize=chunksize))
+    finally:
+        for frame in shared:
+            frame.close()
+        _ATTACHED.clear()
+
+    summary = pd.DataFrame(results)
+    if output_dir:
+        summary.to_csv(Path(output_dir) / 'combined_summary.csv', index=False)
+    return summary
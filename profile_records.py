@@ -0,0 +1,302 @@
+"""
+Cluster Profile Records
+
+Compact, typed records returned by CryptoAIAnalyzer.generate_cluster_profile
+and get_risk_scores. Each class uses __slots__ and keeps raw numbers
+(supplies, shares, risk scores, allocation bounds); display strings such as
+"1,234,567" or "12.5%" are produced only when a value is read.
+
+Records are read-only Mappings over their rendered values, so they read
+like the dictionaries they replace and work wherever a Mapping does
+(`dict(profile)`, `pd.DataFrame(profile['notable_coins'])`):
+
+    profile['risk_assessment']['level']     # rendered value, as before
+    profile.risk_assessment.score           # raw number
+
+and `to_dict()` / `to_json()` return the rendered layout in one pass for
+JSON responses and exports. json.dumps only accepts real dictionaries, so
+callers serializing structures that contain records pass
+`default=json_default`.
+"""
+
+import json
+from collections.abc import Mapping
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+
+def _plain(value: Any) -> Any:
+    """Render a field value: records and lists of records become dictionaries."""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [item.to_dict() if isinstance(item, Record) else item for item in value]
+    return value
+
+
+def json_default(value: Any) -> Any:
+    """
+    `default` hook for json.dumps: records become dictionaries and NumPy
+    scalars (e.g. cluster IDs) plain numbers.
+    """
+    if isinstance(value, Record):
+        return value.to_dict()
+    if hasattr(value, 'item'):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class Record(Mapping):
+    """
+    Read-only mapping view over a slotted record.
+
+    Subclasses list their rendered keys in FIELDS, each with a function
+    producing the value from the record's raw attributes. keys(), items(),
+    values(), get() and equality come from Mapping, so a record equals any
+    mapping with the same rendered values. Like dictionaries, records are
+    unhashable (Mapping sets __hash__ to None).
+    """
+
+    __slots__ = ()
+    FIELDS: Dict[str, Callable[[Any], Any]] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            render = self.FIELDS[key]
+        except KeyError:
+            raise KeyError(key) from None
+        return render(self)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Rendered values as plain dictionaries and lists, ready for json."""
+        return {key: _plain(render(self)) for key, render in self.FIELDS.items()}
+
+    def to_json(self, **kwargs) -> str:
+        """
+        Serialize the rendered record.
+
+        Args:
+            **kwargs: Passed to json.dumps (e.g. indent)
+
+        Returns:
+            JSON string
+        """
+        return json.dumps(self.to_dict(), default=json_default, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __getstate__(self) -> Tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+
+# Risk levels by score: (max score, level, color)
+RISK_LEVELS = [
+    (3.5, 'Low', '🟢'),
+    (6.5, 'Medium', '🟡'),
+    (10.0, 'High', '🔴')
+]
+
+
+class RiskAssessment(Record):
+    """
+    Risk score of a cluster (1-10) and the factors behind it.
+    """
+
+    __slots__ = ('score', 'factors')
+
+    def __init__(self, score: float, factors: List[str]):
+        """
+        Args:
+            score: Risk score, already capped to 1-10
+            factors: Human-readable risk factors
+        """
+        self.score = score
+        self.factors = factors
+
+    @property
+    def band(self) -> Tuple[str, str]:
+        """(level, color) for the score."""
+        for max_score, level, color in RISK_LEVELS:
+            if self.score <= max_score:
+                return level, color
+        return RISK_LEVELS[-1][1:]
+
+    @property
+    def level(self) -> str:
+        return self.band[0]
+
+    @property
+    def color(self) -> str:
+        return self.band[1]
+
+    FIELDS = {
+        'score': lambda r: round(r.score, 1),
+        'level': attrgetter('level'),
+        'color': attrgetter('color'),
+        'factors': attrgetter('factors')
+    }
+
+
+class NotableCoin(Record):
+    """
+    One of the coins closest to full issuance in a cluster.
+    """
+
+    __slots__ = ('name', 'algorithm', 'proof_type', 'mined', 'supply')
+
+    def __init__(self, name: str, algorithm: str, proof_type: str, mined: float, supply: float):
+        """
+        Args:
+            name: Coin name
+            algorithm: Mining algorithm
+            proof_type: Consensus mechanism
+            mined: Total coins mined
+            supply: Total coin supply (0 for unlimited)
+        """
+        self.name = name
+        self.algorithm = algorithm
+        self.proof_type = proof_type
+        self.mined = mined
+        self.supply = supply
+
+    @property
+    def completion(self) -> float:
+        """Fraction of the supply mined (the +1 keeps unlimited supplies finite)."""
+        return self.mined / (self.supply + 1)
+
+    FIELDS = {
+        'name': attrgetter('name'),
+        'algorithm': attrgetter('algorithm'),
+        'proof_type': attrgetter('proof_type'),
+        'mined': lambda c: f"{c.mined:,.0f}",
+        'supply': lambda c: f"{c.supply:,.0f}",
+        'completion': lambda c: f"{c.completion * 100:.1f}%"
+    }
+
+
+class InvestmentInsights(Record):
+    """
+    Allocation band, strategy and rule-driven notes for a cluster.
+    """
+
+    __slots__ = ('allocation_low', 'allocation_high', 'allocation_label', 'investment_strategy',
+                 'key_considerations', 'potential_opportunities', 'warnings')
+
+    def __init__(self, allocation: Tuple[float, float, str], investment_strategy: str,
+                 key_considerations: List[str], potential_opportunities: List[str],
+                 warnings: List[str]):
+        """
+        Args:
+            allocation: (min weight, max weight, label) as from allocation_bounds
+            investment_strategy: Suggested strategy
+            key_considerations: Considerations from the insight rules
+            potential_opportunities: Opportunities from the insight rules
+            warnings: Warnings from the insight rules
+        """
+        self.allocation_low, self.allocation_high, self.allocation_label = allocation
+        self.investment_strategy = investment_strategy
+        self.key_considerations = key_considerations
+        self.potential_opportunities = potential_opportunities
+        self.warnings = warnings
+
+    @property
+    def recommended_allocation(self) -> str:
+        return (f"{self.allocation_low * 100:.0f}-{self.allocation_high * 100:.0f}% "
+                f"({self.allocation_label})")
+
+    FIELDS = {
+        'recommended_allocation': attrgetter('recommended_allocation'),
+        'investment_strategy': attrgetter('investment_strategy'),
+        'key_considerations': attrgetter('key_considerations'),
+        'potential_opportunities': attrgetter('potential_opportunities'),
+        'warnings': attrgetter('warnings')
+    }
+
+
+class ClusterProfile(Record):
+    """
+    Full profile of one cluster.
+    """
+
+    __slots__ = ('cluster_id', 'name', 'description', 'size', 'total_coins', 'key_features',
+                 'dominant_algorithm', 'dominant_proof', 'risk_assessment', 'notable_coins',
+                 'investment_insights', 'avg_supply', 'avg_mined', 'supply_std')
+
+    def __init__(self, cluster_id: Any, name: str, description: str, size: int, total_coins: int,
+                 key_features: List[str], dominant_algorithm: str, dominant_proof: str,
+                 risk_assessment: RiskAssessment, notable_coins: List[NotableCoin],
+                 investment_insights: InvestmentInsights, avg_supply: float, avg_mined: float,
+                 supply_std: float):
+        """
+        Args:
+            cluster_id: Cluster ID
+            name: Cluster name
+            description: Cluster description
+            size: Number of coins in the cluster
+            total_coins: Number of coins in the dataset
+            key_features: Key feature labels
+            dominant_algorithm: Most common algorithm
+            dominant_proof: Most common proof type
+            risk_assessment: Risk record
+            notable_coins: Notable coin records
+            investment_insights: Insight record
+            avg_supply: Mean total supply
+            avg_mined: Mean coins mined
+            supply_std: Standard deviation of total supply
+        """
+        self.cluster_id = cluster_id
+        self.name = name
+        self.description = description
+        self.size = size
+        self.total_coins = total_coins
+        self.key_features = key_features
+        self.dominant_algorithm = dominant_algorithm
+        self.dominant_proof = dominant_proof
+        self.risk_assessment = risk_assessment
+        self.notable_coins = notable_coins
+        self.investment_insights = investment_insights
+        self.avg_supply = avg_supply
+        self.avg_mined = avg_mined
+        self.supply_std = supply_std
+
+    @property
+    def share(self) -> float:
+        """Fraction of the dataset in this cluster."""
+        return self.size / self.total_coins
+
+    @property
+    def statistics(self) -> Dict[str, str]:
+        return {
+            'avg_supply': f"{self.avg_supply:,.0f}",
+            'avg_mined': f"{self.avg_mined:,.0f}",
+            'supply_volatility': 'High' if self.supply_std > self.avg_supply else 'Low'
+        }
+
+    FIELDS = {
+        'cluster_id': attrgetter('cluster_id'),
+        'name': attrgetter('name'),
+        'description': attrgetter('description'),
+        'size': attrgetter('size'),
+        'percentage': lambda p: f"{p.share * 100:.1f}%",
+        'key_features': attrgetter('key_features'),
+        'dominant_algorithm': attrgetter('dominant_algorithm'),
+        'dominant_proof': attrgetter('dominant_proof'),
+        'risk_assessment': attrgetter('risk_assessment'),
+        'notable_coins': attrgetter('notable_coins'),
+        'investment_insights': attrgetter('investment_insights'),
+        'statistics': attrgetter('statistics')
+    }
@@ -9,6 +9,8 @@ import plotly.express as px
 from datetime import datetime, timedelta
 import numpy as np
 
+from roi_simulation import simulate_portfolio_paths
+
 
 def create_business_metrics_dashboard():
     """
@@ -111,16 +113,20 @@ def create_business_metrics_dashboard():
     return metrics
 
 
-def create_roi_calculator():
+def create_roi_calculator(simulate=False, n_paths=20000, seed=42):
     """
     ROI calculator for investment decisions
     Shows business acumen
+
+    With simulate=True each scenario also gets Monte Carlo outcomes
+    (P5/P50/P95 final value and probability of loss) over its time horizon.
     """
     roi_data = {
         'scenarios': {
             'Conservative': {
                 'initial_investment': 10000,
                 'expected_return': 15,  # %
+                'volatility': 10,  # % annualized
                 'time_horizon': 12,  # months
                 'risk_level': 'Low',
                 'recommended_allocation': '20-40%'
@@ -128,6 +134,7 @@ def create_roi_calculator():
             'Moderate': {
                 'initial_investment': 10000,
                 'expected_return': 35,
+                'volatility': 25,
                 'time_horizon': 12,
                 'risk_level': 'Medium',
                 'recommended_allocation': '10-20%'
@@ -135,6 +142,7 @@ def create_roi_calculator():
             'Aggressive': {
                 'initial_investment': 10000,
                 'expected_return': 75,
+                'volatility': 50,
                 'time_horizon': 12,
                 'risk_level': 'High',
                 'recommended_allocation': '0-5%'
@@ -142,6 +150,23 @@ def create_roi_calculator():
         }
     }
 
+    if simulate:
+        for scenario in roi_data['scenarios'].values():
+            paths = simulate_portfolio_paths(
+                scenario['initial_investment'],
+                scenario['expected_return'],
+                scenario['volatility'],
+                scenario['time_horizon'],
+                n_paths=n_paths,
+                seed=seed
+            )
+            scenario['simulated_outcomes'] = {
+                'p5': float(paths['p5'][-1]),
+                'p50': float(paths['p50'][-1]),
+                'p95': float(paths['p95'][-1]),
+                'prob_loss': paths['prob_loss']
+            }
+
     return roi_data
 
 
@@ -0,0 +1,396 @@
+"""
+Coin Supply Snapshot Store
+
+Append-only, columnar store for daily snapshots of the coin dataset
+(the schema of crypto_data.csv / crypto_data_2025.csv). Each snapshot is a
+date partition holding one compressed NumPy file per column:
+
+    <root>/manifest.json
+    <root>/dictionaries.json
+    <root>/date=2025-10-31/coin_id.npz
+    <root>/date=2025-10-31/TotalCoinSupply.npz
+    ...
+    <root>/tracker/k4-seed42/date=2025-10-31.pkl   (see load_clustered_snapshot)
+
+Text columns are dictionary-encoded against store-wide vocabularies.
+Numeric columns are delta-encoded against the previous snapshot by XOR-ing
+the float64 bit patterns of each coin's values. Unchanged values become
+zero words that compress to almost nothing, and decoding is bit-exact.
+A full keyframe is written every `keyframe_interval` snapshots to bound
+the decode chain. Reads load only the requested partitions and columns.
+
+The manifest is the source of truth: a partition directory exists before
+its manifest entry only if a writer crashed in between, and the next
+append of that date replaces it.
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# Column name -> storage kind for the coin dataset schema
+SCHEMA = {
+    'CoinName': 'category',
+    'Algorithm': 'category',
+    'IsTrading': 'bool',
+    'ProofType': 'category',
+    'TotalCoinsMined': 'float',
+    'TotalCoinSupply': 'float'
+}
+
+SUPPLY_COLUMNS = ('TotalCoinsMined', 'TotalCoinSupply')
+
+
+class SnapshotStore:
+    """
+    Date-partitioned columnar store of coin snapshots.
+    """
+
+    def __init__(self, root: str, keyframe_interval: int = 7):
+        """
+        Open (or create) a snapshot store.
+
+        Args:
+            root: Directory holding the store
+            keyframe_interval: Write a fully materialized partition every N snapshots
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        manifest_path = self.root / 'manifest.json'
+        if manifest_path.exists():
+            self.manifest = json.loads(manifest_path.read_text())
+        else:
+            self.manifest = {'keyframe_interval': keyframe_interval, 'partitions': []}
+
+        dictionaries_path = self.root / 'dictionaries.json'
+        if dictionaries_path.exists():
+            self.dictionaries = json.loads(dictionaries_path.read_text())
+        else:
+            self.dictionaries = {column: [] for column in ['ticker'] + self._category_columns()}
+
+        self._lookup = {column: {value: code for code, value in enumerate(values)}
+                        for column, values in self.dictionaries.items()}
+
+    @staticmethod
+    def _category_columns() -> List[str]:
+        return [column for column, kind in SCHEMA.items() if kind == 'category']
+
+    def dates(self) -> List[str]:
+        """List snapshot dates in ascending order."""
+        return [partition['date'] for partition in self.manifest['partitions']]
+
+    def _partition_dir(self, date: str) -> Path:
+        return self.root / f"date={date}"
+
+    def _write_json(self, name: str, payload: Dict) -> None:
+        path = self.root / name
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_text(json.dumps(payload))
+        os.replace(tmp_path, path)
+
+    def _encode_category(self, column: str, values: pd.Series) -> np.ndarray:
+        """Map values to codes, extending the store-wide dictionary as needed."""
+        lookup = self._lookup[column]
+        vocabulary = self.dictionaries[column]
+        for value in pd.unique(values.astype(str)):
+            if value not in lookup:
+                lookup[value] = len(vocabulary)
+                vocabulary.append(value)
+        return values.astype(str).map(lookup).to_numpy(dtype=np.int32)
+
+    @staticmethod
+    def _dense(coin_ids: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+        """Scatter a partition's float bits into an array indexed by coin ID."""
+        dense = np.zeros(size, dtype=np.uint64)
+        dense[coin_ids] = values
+        return dense
+
+    def append(self, date: str, data: pd.DataFrame) -> None:
+        """
+        Append a snapshot. Dates must be strictly increasing (ISO format).
+
+        Args:
+            date: Snapshot date, e.g. '2025-10-31'
+            data: Coin DataFrame indexed by ticker with the SCHEMA columns
+        """
+        dates = self.dates()
+        if dates and date <= dates[-1]:
+            raise ValueError(f"Snapshot {date} is not after the latest snapshot {dates[-1]}")
+
+        missing = [column for column in SCHEMA if column not in data.columns]
+        if missing:
+            raise ValueError(f"Snapshot is missing columns: {missing}")
+
+        if data.index.has_duplicates:
+            raise ValueError("Snapshot index (ticker) must be unique")
+
+        interval = self.manifest['keyframe_interval']
+        keyframe = len(dates) % interval == 0
+
+        coin_ids = self._encode_category('ticker', pd.Series(data.index.astype(str)))
+        columns = {'coin_id': coin_ids}
+
+        previous = None
+        if not keyframe:
+            previous = self._read_partition(dates[-1], list(SUPPLY_COLUMNS), raw_bits=True)
+
+        for column, kind in SCHEMA.items():
+            if kind == 'category':
+                columns[column] = self._encode_category(column, data[column])
+            elif kind == 'bool':
+                columns[column] = data[column].astype(bool).to_numpy(dtype=np.int8)
+            else:
+                bits = pd.to_numeric(data[column], errors='coerce').to_numpy(dtype=np.float64).view(np.uint64)
+                if previous is not None:
+                    size = len(self.dictionaries['ticker'])
+                    prior = self._dense(previous['coin_id'], previous[column], size)
+                    bits = bits ^ prior[coin_ids]
+                columns[column] = bits
+
+        # Write the partition to a temporary directory, then publish atomically
+        partition_dir = self._partition_dir(date)
+        tmp_dir = partition_dir.with_name(f"{partition_dir.name}.{os.getpid()}.tmp")
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        tmp_dir.mkdir()
+        for column, values in columns.items():
+            np.savez_compressed(tmp_dir / f"{column}.npz", values=values)
+
+        # Dictionaries only grow, so they can be saved before the partition
+        # that needs the new codes is visible
+        self._write_json('dictionaries.json', self.dictionaries)
+
+        # A directory for a date the manifest does not list is left over
+        # from a writer that crashed before recording it
+        if partition_dir.exists():
+            shutil.rmtree(partition_dir)
+        os.replace(tmp_dir, partition_dir)
+
+        self.manifest['partitions'].append({'date': date, 'rows': len(data), 'keyframe': keyframe})
+        self._write_json('manifest.json', self.manifest)
+
+    def import_csv(self, date: str, file_path: str) -> None:
+        """Append a snapshot from a CSV with the crypto_data.csv layout."""
+        self.append(date, pd.read_csv(file_path, index_col=0))
+
+    def _load_column(self, date: str, column: str) -> np.ndarray:
+        with np.load(self._partition_dir(date) / f"{column}.npz") as archive:
+            return archive['values']
+
+    def _read_partition(self, date: str, columns: Sequence[str], raw_bits: bool = False) -> Dict:
+        """
+        Decode selected columns of one partition, replaying deltas from the last keyframe.
+
+        Float columns are returned as uint64 bit patterns when raw_bits is True.
+        """
+        partitions = self.manifest['partitions']
+        position = self.dates().index(date)
+        start = position
+        while not partitions[start]['keyframe']:
+            start -= 1
+
+        float_columns = [c for c in columns if SCHEMA.get(c) == 'float']
+        size = len(self.dictionaries['ticker'])
+        decoded = None
+
+        for partition in partitions[start:position + 1]:
+            decoded = self._decode_step(partition, float_columns, decoded, size)
+
+        result = {'coin_id': decoded['coin_id']}
+        for column in columns:
+            if SCHEMA.get(column) == 'float':
+                result[column] = decoded[column] if raw_bits else decoded[column].view(np.float64)
+            else:
+                result[column] = self._load_column(date, column)
+        return result
+
+    def _decode_step(self, partition: Dict, float_columns: List[str],
+                     previous: Optional[Dict], size: int) -> Dict:
+        """Decode the float columns of one partition given the previous decoded partition."""
+        date = partition['date']
+        coin_ids = self._load_column(date, 'coin_id')
+        step = {'coin_id': coin_ids}
+
+        for column in float_columns:
+            bits = self._load_column(date, column)
+            if not partition['keyframe']:
+                prior = self._dense(previous['coin_id'], previous[column], size)
+                bits = bits ^ prior[coin_ids]
+            step[column] = bits
+
+        return step
+
+    def _to_frame(self, decoded: Dict, columns: Sequence[str]) -> pd.DataFrame:
+        tickers = np.asarray(self.dictionaries['ticker'], dtype=object)
+        frame = {}
+        for column in columns:
+            kind = SCHEMA[column]
+            values = decoded[column]
+            if kind == 'category':
+                frame[column] = np.asarray(self.dictionaries[column], dtype=object)[values]
+            elif kind == 'bool':
+                frame[column] = values.astype(bool)
+            else:
+                frame[column] = values
+        return pd.DataFrame(frame, index=pd.Index(tickers[decoded['coin_id']]))
+
+    def read_snapshot(self, date: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Read one snapshot in the same layout as the source CSVs.
+
+        Args:
+            date: Snapshot date
+            columns: Columns to load (defaults to the full schema)
+
+        Returns:
+            DataFrame indexed by ticker
+        """
+        if date not in self.dates():
+            raise KeyError(f"No snapshot for {date}")
+
+        columns = list(columns or SCHEMA.keys())
+        return self._to_frame(self._read_partition(date, columns), columns)
+
+    def iter_snapshots(self, start: Optional[str] = None, end: Optional[str] = None,
+                       columns: Optional[Sequence[str]] = None) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Yield the snapshots of a date range in order, decoding each partition once.
+
+        Replaying a range through read_snapshot would decode the delta chain
+        from the last keyframe again for every date; this walks it once.
+
+        Args:
+            start: First date (inclusive), defaults to the first snapshot
+            end: Last date (inclusive), defaults to the latest snapshot
+            columns: Columns to load (defaults to the full schema)
+
+        Yields:
+            (date, DataFrame indexed by ticker) pairs
+        """
+        columns = list(columns or SCHEMA.keys())
+        float_columns = [c for c in columns if SCHEMA.get(c) == 'float']
+
+        partitions = self.manifest['partitions']
+        in_range = [i for i, p in enumerate(partitions)
+                    if (start is None or p['date'] >= start) and (end is None or p['date'] <= end)]
+        if not in_range:
+            return
+
+        first = in_range[0]
+        while not partitions[first]['keyframe']:
+            first -= 1
+
+        size = len(self.dictionaries['ticker'])
+        decoded = None
+        for position in range(first, in_range[-1] + 1):
+            partition = partitions[position]
+            decoded = self._decode_step(partition, float_columns, decoded, size)
+            if position < in_range[0]:
+                continue
+
+            step = {'coin_id': decoded['coin_id']}
+            for column in columns:
+                if SCHEMA.get(column) == 'float':
+                    step[column] = decoded[column].view(np.float64)
+                else:
+                    step[column] = self._load_column(partition['date'], column)
+            yield partition['date'], self._to_frame(step, columns)
+
+    def read_range(self, start: Optional[str] = None, end: Optional[str] = None,
+                   coins: Optional[Sequence[str]] = None,
+                   columns: Sequence[str] = SUPPLY_COLUMNS) -> pd.DataFrame:
+        """
+        Read supply/mined history for a date range, decoding each partition once.
+
+        Args:
+            start: First date (inclusive), defaults to the first snapshot
+            end: Last date (inclusive), defaults to the latest snapshot
+            coins: Tickers to keep (defaults to all coins)
+            columns: Float columns to read
+
+        Returns:
+            Long DataFrame with date, ticker and the requested columns
+        """
+        float_columns = [c for c in columns if SCHEMA.get(c) == 'float']
+        if len(float_columns) != len(columns):
+            raise ValueError("read_range only supports numeric columns")
+
+        partitions = self.manifest['partitions']
+        in_range = [i for i, p in enumerate(partitions)
+                    if (start is None or p['date'] >= start) and (end is None or p['date'] <= end)]
+        if not in_range:
+            return pd.DataFrame(columns=['date', 'ticker'] + list(columns))
+
+        # Rewind to the keyframe preceding the range so deltas can be replayed
+        first = in_range[0]
+        while not partitions[first]['keyframe']:
+            first -= 1
+
+        size = len(self.dictionaries['ticker'])
+        wanted = None
+        if coins is not None:
+            wanted = np.zeros(size, dtype=bool)
+            codes = [self._lookup['ticker'][c] for c in coins if c in self._lookup['ticker']]
+            wanted[codes] = True
+
+        tickers = np.asarray(self.dictionaries['ticker'], dtype=object)
+        frames = []
+        decoded = None
+        for position in range(first, in_range[-1] + 1):
+            partition = partitions[position]
+            decoded = self._decode_step(partition, float_columns, decoded, size)
+            if position < in_range[0]:
+                continue
+
+            keep = slice(None) if wanted is None else wanted[decoded['coin_id']]
+            frame = {'date': partition['date'], 'ticker': tickers[decoded['coin_id'][keep]]}
+            for column in float_columns:
+                frame[column] = decoded[column][keep].view(np.float64)
+            frames.append(pd.DataFrame(frame))
+
+        return pd.concat(frames, ignore_index=True)
+
+
+def load_clustered_snapshot(root: str, date: str, n_clusters: int = 4,
+                            random_state: int = 42) -> pd.DataFrame:
+    """
+    Read, clean and cluster one stored snapshot for the apps.
+
+    Labels come from cluster_drift.DriftTracker, so they stay stable across
+    dates instead of being renumbered by every fit. Tracker states are kept
+    under <root>/tracker/, so a date that was loaded before is read from its
+    saved state without decoding any snapshot, and a new date only updates
+    the previous date's state with that snapshot.
+
+    Args:
+        root: Snapshot store directory
+        date: Snapshot date
+        n_clusters: Number of KMeans clusters
+        random_state: Seed for KMeans
+
+    Returns:
+        Clustered DataFrame in the layout of the built-in data sources
+    """
+    from cluster_drift import track_snapshots
+    from instrumentation import stage
+
+    store = SnapshotStore(root)
+    state_dir = store.root / 'tracker' / f"k{n_clusters}-seed{random_state}"
+    with stage('load.snapshot'):
+        clustered, _ = track_snapshots(store, until=date, n_clusters=n_clusters,
+                                       random_state=random_state, state_dir=str(state_dir))
+    return clustered
+
+
+def snapshot_dates(root: str) -> List[str]:
+    """List snapshot dates in a store directory without creating it."""
+    if not (Path(root) / 'manifest.json').exists():
+        return []
+    return SnapshotStore(root).dates()
@@ -0,0 +1,222 @@
+"""
+Streaming Cluster Statistics
+
+Bounded-memory replacement for the exact per-cluster statistics in
+CryptoAIAnalyzer (CryptoAIAnalyzer(data, approximate=True)). The data is
+read in chunks and every cluster keeps:
+
+- RunningMoments for supply and mined amounts: count, mean and M2 merged
+  chunk by chunk with the Welford/Chan update. Means and standard
+  deviations are exact up to floating-point rounding (the update is
+  numerically stable), in O(1) memory.
+- SpaceSaving sketches for algorithms and proof types with `capacity`
+  counters. Every category whose true count in the cluster exceeds
+  n / capacity is guaranteed to be tracked. A reported count
+  overestimates the true count by at most n / capacity (n = cluster
+  size), and the per-item overestimate is kept in `errors`. The top-3
+  lists are therefore exact whenever the top categories are separated
+  by more than that bound.
+- CoinSample, a uniform random sample without replacement of at most
+  `sample_size` coin names (bottom-k sampling on random keys). Clusters
+  no larger than the sample keep every name.
+
+Memory per cluster is O(capacity + sample_size) regardless of cluster
+size.
+"""
+
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class RunningMoments:
+    """
+    Streaming count, mean and variance (Welford, merged per chunk as in Chan et al.).
+    """
+
+    def __init__(self):
+        """Start with no values."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values: np.ndarray) -> None:
+        """
+        Merge a batch of values.
+
+        Args:
+            values: 1-D numeric array
+        """
+        n = len(values)
+        if n == 0:
+            return
+        batch_mean = float(np.mean(values))
+        batch_m2 = float(np.sum((values - batch_mean) ** 2))
+
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += batch_m2 + delta * delta * self.count * n / total
+        self.count = total
+
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1, as pandas), NaN below two values."""
+        if self.count < 2:
+            return float('nan')
+        return (self.m2 / (self.count - 1)) ** 0.5
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitter sketch with a fixed number of counters.
+    """
+
+    def __init__(self, capacity: int = 64):
+        """
+        Args:
+            capacity: Number of counters (the count error is at most total / capacity)
+        """
+        self.capacity = capacity
+        self.counts: Dict[Hashable, int] = {}
+        self.errors: Dict[Hashable, int] = {}
+        self.total = 0
+
+    def update(self, item: Hashable, count: int = 1) -> None:
+        """Add `count` occurrences of an item."""
+        self.total += count
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+        else:
+            # Replace the smallest counter; the new item inherits its count as error
+            victim = min(self.counts, key=self.counts.get)
+            floor = self.counts.pop(victim)
+            del self.errors[victim]
+            self.counts[item] = floor + count
+            self.errors[item] = floor
+
+    def top(self, n: int) -> List[Tuple[Hashable, int]]:
+        """The n items with the highest estimated counts, highest first."""
+        return sorted(self.counts.items(), key=lambda entry: entry[1], reverse=True)[:n]
+
+    @property
+    def error_bound(self) -> float:
+        """Maximum overestimate of any reported count."""
+        return self.total / self.capacity
+
+
+class CoinSample:
+    """
+    Uniform sample without replacement of at most `size` values (bottom-k on random keys).
+    """
+
+    def __init__(self, size: int, rng: np.random.Generator):
+        """
+        Args:
+            size: Maximum number of values kept
+            rng: Random generator for the sampling keys
+        """
+        self.size = size
+        self.rng = rng
+        self.seen = 0
+        self.keys = np.empty(0)
+        self.arrivals = np.empty(0, dtype=np.int64)
+        self.values = np.empty(0, dtype=object)
+
+    def update(self, values: np.ndarray) -> None:
+        """Offer a batch of values to the sample."""
+        n = len(values)
+        keys = np.concatenate([self.keys, self.rng.random(n)])
+        arrivals = np.concatenate([self.arrivals, np.arange(self.seen, self.seen + n)])
+        values = np.concatenate([self.values, np.asarray(values, dtype=object)])
+        self.seen += n
+
+        if len(keys) > self.size:
+            keep = np.argpartition(keys, self.size - 1)[:self.size]
+            keys, arrivals, values = keys[keep], arrivals[keep], values[keep]
+        self.keys, self.arrivals, self.values = keys, arrivals, values
+
+    def items(self) -> List[Any]:
+        """The sampled values in their original order."""
+        return self.values[np.argsort(self.arrivals)].tolist()
+
+
+class ClusterSketch:
+    """
+    Bounded-memory statistics of one cluster.
+    """
+
+    def __init__(self, capacity: int, sample_size: int, rng: np.random.Generator):
+        """
+        Args:
+            capacity: Counters per Space-Saving sketch
+            sample_size: Maximum coin names kept
+            rng: Random generator for the coin sample
+        """
+        self.supply = RunningMoments()
+        self.mined = RunningMoments()
+        self.algorithms = SpaceSaving(capacity)
+        self.proofs = SpaceSaving(capacity)
+        self.coins = CoinSample(sample_size, rng)
+
+    def update(self, group: pd.DataFrame) -> None:
+        """Merge the rows of one chunk that belong to this cluster."""
+        self.supply.update(group['TotalCoinSupply'].to_numpy(dtype=float))
+        self.mined.update(group['TotalCoinsMined'].to_numpy(dtype=float))
+        for item, count in group['Algorithm'].value_counts().items():
+            self.algorithms.update(item, int(count))
+        for item, count in group['ProofType'].value_counts().items():
+            self.proofs.update(item, int(count))
+        self.coins.update(group['CoinName'].to_numpy())
+
+    def summary(self) -> Dict:
+        """Statistics in the layout of CryptoAIAnalyzer.cluster_stats."""
+        return {
+            'size': self.supply.count,
+            'avg_supply': self.supply.mean,
+            'avg_mined': self.mined.mean,
+            'top_algorithms': dict(self.algorithms.top(3)),
+            'top_proofs': dict(self.proofs.top(3)),
+            'coins': self.coins.items(),
+            'supply_std': self.supply.std(),
+            'mined_std': self.mined.std(),
+            'coins_sampled': self.supply.count > self.coins.size,
+            'error_bounds': {
+                'algorithm_count': self.algorithms.error_bound,
+                'proof_count': self.proofs.error_bound
+            }
+        }
+
+
+def approximate_cluster_statistics(data: pd.DataFrame, chunk_size: int = 100_000,
+                                   sketch_capacity: int = 64, sample_size: int = 1000,
+                                   seed: Optional[int] = 42) -> Dict:
+    """
+    Compute per-cluster statistics in one chunked pass with bounded memory.
+
+    Args:
+        data: Clustered DataFrame with Class, CoinName, Algorithm, ProofType,
+              TotalCoinSupply and TotalCoinsMined columns
+        chunk_size: Rows processed per chunk
+        sketch_capacity: Counters per Space-Saving sketch
+        sample_size: Maximum coin names kept per cluster
+        seed: Seed for the coin samples
+
+    Returns:
+        Dictionary mapping cluster ID to its statistics (see ClusterSketch.summary)
+    """
+    rng = np.random.default_rng(seed)
+    sketches: Dict[Hashable, ClusterSketch] = {}
+
+    for start in range(0, len(data), chunk_size):
+        chunk = data.iloc[start:start + chunk_size]
+        for cluster_id, group in chunk.groupby('Class', sort=False):
+            sketch = sketches.get(cluster_id)
+            if sketch is None:
+                sketch = sketches[cluster_id] = ClusterSketch(sketch_capacity, sample_size, rng)
+            sketch.update(group)
+
+    return {cluster_id: sketch.summary() for cluster_id, sketch in sketches.items()}
@@ -0,0 +1,309 @@
+"""
+Synthetic Coin Data Generator
+
+Configurable generator of coins in the crypto_data.csv layout with:
+
+- heavy-tailed supply: log10(TotalCoinSupply) follows a Student-t around
+  a per-cluster centre, so a few coins have astronomically large supplies
+- mined amounts as a Beta-distributed fraction of supply
+- Zipf-distributed Algorithm and ProofType frequencies, each cluster
+  favouring a different part of the vocabulary
+- controllable cluster structure via `n_clusters`, `separation` and
+  `cluster_strength` (0 = no structure, 1 = fully cluster-specific)
+
+Coins are generated in fixed-size chunks, so millions of rows can be
+streamed to CSV or Parquet with bounded memory:
+
+    python synthetic_data.py --coins 5000000 --output coins_5m.csv
+
+Parquet output requires pyarrow. The apps' offline sample data
+(load_fallback_data/load_sample_data) is a small clustered universe from
+`sample_coin_data`, which needs no scikit-learn.
+"""
+
+import argparse
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+
+# Most common real algorithms and proof types (crypto_data.csv), in frequency order
+ALGORITHMS = [
+    'Scrypt', 'X11', 'SHA-256', 'X13', 'PoS', 'CryptoNight', 'Quark', 'Equihash',
+    'NeoScrypt', 'NIST5', 'DPoS', 'Ethash', 'Lyra2REv2', 'Multiple', 'X15', 'Groestl',
+    'Blake2b', 'Lyra2RE', 'SHA-256D', 'QuBit', 'Keccak', 'Scrypt-n', 'Blake', 'Argon2d'
+]
+PROOF_TYPES = ['PoW', 'PoW/PoS', 'PoS', 'DPoS', 'PoS/PoW', 'PoC', 'PoA', 'dPoW', 'PoH', 'LPoS']
+
+# Well-known coins named in the apps' sample data -> latent cluster they are
+# placed in (None = any). Bitcoin and Ethereum are established coins the
+# insight rules recognise.
+SAMPLE_COINS = {
+    'Bitcoin': 0, 'Ethereum': 0, 'Solana': 1,
+    'Fetch.ai': 2, 'SingularityNET': 2, 'Ocean Protocol': 2,
+    'Arbitrum': 3, 'Optimism': 3, 'Polygon': 3,
+    'Cardano': None, 'Avalanche': None, 'Chainlink': None, 'Uniswap': None, 'Render': None,
+    'Akash': None, 'Aave': None, 'Curve': None, 'Maker': None, 'Compound': None, 'Synthetix': None
+}
+
+
+def zipf_weights(size: int, exponent: float) -> np.ndarray:
+    """
+    Normalized Zipf weights: the item of rank r gets weight proportional to r ** -exponent.
+
+    Args:
+        size: Number of items
+        exponent: Zipf exponent (0 = uniform)
+
+    Returns:
+        Probability vector of length size
+    """
+    weights = np.arange(1, size + 1, dtype=float) ** -exponent
+    return weights / weights.sum()
+
+
+def _vocabulary(base: List[str], size: int, prefix: str) -> List[str]:
+    """Extend a base vocabulary with synthetic names up to size entries."""
+    return base[:size] + [f'{prefix}-{i}' for i in range(max(0, size - len(base)))]
+
+
+def _cluster_probabilities(size: int, exponent: float, n_clusters: int, strength: float) -> np.ndarray:
+    """
+    Per-cluster category probabilities.
+
+    Each cluster rotates the Zipf ranking so a different category is its
+    favourite, then mixes it with the global ranking by `strength`.
+    """
+    base = zipf_weights(size, exponent)
+    step = max(1, size // max(n_clusters, 1))
+    rows = [strength * np.roll(base, c * step) + (1 - strength) * base for c in range(n_clusters)]
+    return np.array(rows)
+
+
+class CoinGenerator:
+    """
+    Chunked generator of synthetic coin universes.
+    """
+
+    def __init__(self, n_clusters: int = 4, separation: float = 1.5,
+                 cluster_strength: float = 0.8, zipf_exponent: float = 1.2,
+                 n_algorithms: int = 60, n_proof_types: int = 10,
+                 tail_df: float = 3.0, trading_fraction: float = 0.9,
+                 seed: Optional[int] = 42):
+        """
+        Configure the generator.
+
+        Args:
+            n_clusters: Number of latent clusters
+            separation: Distance between cluster supply centres in log10 units
+            cluster_strength: How strongly clusters prefer their own categories (0-1)
+            zipf_exponent: Zipf exponent for category frequencies
+            n_algorithms: Algorithm vocabulary size
+            n_proof_types: Proof type vocabulary size
+            tail_df: Student-t degrees of freedom for log supply (lower = heavier tail)
+            trading_fraction: Share of coins with IsTrading = True
+            seed: Random seed (None draws fresh entropy)
+        """
+        self.n_clusters = n_clusters
+        self.tail_df = tail_df
+        self.trading_fraction = trading_fraction
+        self.seed = seed
+        self._entropy = np.random.SeedSequence(seed).entropy
+
+        self.algorithms = np.array(_vocabulary(ALGORITHMS, n_algorithms, 'Algo'), dtype=object)
+        self.proof_types = np.array(_vocabulary(PROOF_TYPES, n_proof_types, 'Proof'), dtype=object)
+        self.algorithm_probs = _cluster_probabilities(len(self.algorithms), zipf_exponent,
+                                                      n_clusters, cluster_strength)
+        self.proof_probs = _cluster_probabilities(len(self.proof_types), zipf_exponent,
+                                                  n_clusters, cluster_strength)
+
+        # Cluster sizes are uneven (Zipf with exponent 1); supply centres are
+        # spread around 10^8 coins, the median of the real dataset
+        self.cluster_weights = zipf_weights(n_clusters, 1.0)
+        offsets = np.arange(n_clusters) - (n_clusters - 1) / 2
+        self.log_supply_centres = 8.0 + separation * offsets
+        self.completion_shape = np.linspace(0.5, 4.0, n_clusters)
+
+    def _sample_categories(self, rng: np.random.Generator, labels: np.ndarray,
+                           probs: np.ndarray, vocabulary: np.ndarray) -> np.ndarray:
+        codes = np.empty(len(labels), dtype=np.int64)
+        for cluster in range(self.n_clusters):
+            mask = labels == cluster
+            codes[mask] = rng.choice(len(vocabulary), size=int(mask.sum()), p=probs[cluster])
+        return vocabulary[codes]
+
+    def chunks(self, n_coins: int, chunk_size: int = 100_000,
+               include_labels: bool = False) -> Iterator[pd.DataFrame]:
+        """
+        Yield the universe as DataFrames of at most chunk_size coins.
+
+        Args:
+            n_coins: Total number of coins
+            chunk_size: Coins per chunk
+            include_labels: Add the latent cluster as a 'TrueCluster' column
+
+        Yields:
+            DataFrames in the crypto_data.csv layout, indexed by ticker
+        """
+        width = len(str(max(n_coins - 1, 0)))
+
+        for chunk_index, start in enumerate(range(0, n_coins, chunk_size)):
+            size = min(chunk_size, n_coins - start)
+            # Each chunk has its own reproducible stream derived from the seed
+            rng = np.random.default_rng([self._entropy, chunk_index])
+
+            labels = rng.choice(self.n_clusters, size=size, p=self.cluster_weights)
+            log_supply = self.log_supply_centres[labels] + rng.standard_t(self.tail_df, size)
+            supply = 10 ** np.clip(log_supply, 1.0, 18.0)
+
+            shape = self.completion_shape[labels]
+            completion = rng.beta(shape, 5.0 - shape)
+            mined = supply * completion
+
+            ids = np.arange(start, start + size)
+            chunk = pd.DataFrame({
+                'CoinName': [f'SynthCoin {i}' for i in ids],
+                'Algorithm': self._sample_categories(rng, labels, self.algorithm_probs, self.algorithms),
+                'IsTrading': rng.random(size) < self.trading_fraction,
+                'ProofType': self._sample_categories(rng, labels, self.proof_probs, self.proof_types),
+                'TotalCoinsMined': mined,
+                'TotalCoinSupply': supply
+            }, index=pd.Index([f'S{i:0{width}d}' for i in ids]))
+
+            if include_labels:
+                chunk['TrueCluster'] = labels
+
+            yield chunk
+
+    def generate(self, n_coins: int, include_labels: bool = False) -> pd.DataFrame:
+        """
+        Generate a whole universe in memory.
+
+        Args:
+            n_coins: Number of coins
+            include_labels: Add the latent cluster as a 'TrueCluster' column
+
+        Returns:
+            DataFrame in the crypto_data.csv layout
+        """
+        return pd.concat(list(self.chunks(n_coins, include_labels=include_labels)))
+
+    def write(self, path: str, n_coins: int, chunk_size: int = 100_000,
+              include_labels: bool = False) -> Dict:
+        """
+        Stream a universe to CSV or Parquet (chosen by file extension).
+
+        Args:
+            path: Output path ending in .csv or .parquet
+            n_coins: Number of coins
+            chunk_size: Coins generated and written per chunk
+            include_labels: Add the latent cluster as a 'TrueCluster' column
+
+        Returns:
+            Dictionary with the path, row count and chunk count
+        """
+        path = Path(path)
+        chunks = self.chunks(n_coins, chunk_size, include_labels)
+        count = 0
+
+        if path.suffix == '.parquet':
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ImportError("Parquet output requires pyarrow: pip install pyarrow")
+
+            writer = None
+            try:
+                for chunk in chunks:
+                    table = pa.Table.from_pandas(chunk.rename_axis('Ticker'))
+                    if writer is None:
+                        writer = pq.ParquetWriter(path, table.schema)
+                    writer.write_table(table)
+                    count += 1
+            finally:
+                if writer is not None:
+                    writer.close()
+        else:
+            with open(path, 'w', newline='') as f:
+                for chunk in chunks:
+                    chunk.to_csv(f, header=count == 0)
+                    count += 1
+
+        return {'path': str(path), 'rows': n_coins, 'chunks': count}
+
+
+def sample_coin_data(n_coins: int, n_clusters: int = 4, seed: int = 42) -> pd.DataFrame:
+    """
+    Generate a small clustered universe for running the apps offline.
+
+    Needs only NumPy and pandas, so the apps can fall back to it when
+    loading or clustering real data fails. Class is the generator's latent
+    cluster, PC 1-3 come from an SVD of the standardized features, and the
+    well-known coins in SAMPLE_COINS replace generated names so the
+    established-coin insight rules have something to find.
+
+    Args:
+        n_coins: Number of coins
+        n_clusters: Number of latent clusters
+        seed: Generator seed
+
+    Returns:
+        DataFrame in the clustered layout (CoinName ... PC 1-3, Class)
+    """
+    coins = CoinGenerator(n_clusters=n_clusters, seed=seed).generate(n_coins, include_labels=True)
+    labels = coins['TrueCluster'].to_numpy()
+
+    names = coins['CoinName'].to_numpy(dtype=object, copy=True)
+    free = np.ones(n_coins, dtype=bool)
+    for name, cluster in SAMPLE_COINS.items():
+        candidates = np.flatnonzero(free & (labels == cluster))
+        if len(candidates) == 0:
+            candidates = np.flatnonzero(free)
+        if len(candidates) == 0:
+            break
+        names[candidates[0]] = name
+        free[candidates[0]] = False
+
+    features = pd.concat([
+        np.log10(coins[['TotalCoinsMined', 'TotalCoinSupply']]),
+        pd.get_dummies(coins[['Algorithm', 'ProofType']], dtype=float)
+    ], axis=1).to_numpy(dtype=float)
+    spread = features.std(axis=0)
+    features = (features - features.mean(axis=0)) / np.where(spread > 0, spread, 1.0)
+    u, singular, _ = np.linalg.svd(features, full_matrices=False)
+    points = u[:, :3] * singular[:3]
+
+    result = coins.drop(columns=['IsTrading', 'TrueCluster'])
+    result['CoinName'] = names
+    for i in range(3):
+        result[f'PC {i + 1}'] = points[:, i]
+    result['Class'] = labels
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic coin universe")
+    parser.add_argument('--coins', type=int, default=1_000_000)
+    parser.add_argument('--output', default='synthetic_coins.csv', help=".csv or .parquet")
+    parser.add_argument('--chunk-size', type=int, default=100_000)
+    parser.add_argument('--clusters', type=int, default=4)
+    parser.add_argument('--separation', type=float, default=1.5)
+    parser.add_argument('--cluster-strength', type=float, default=0.8)
+    parser.add_argument('--zipf', type=float, default=1.2, help="Zipf exponent for categories")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--labels', action='store_true', help="Include the latent TrueCluster column")
+    args = parser.parse_args(argv)
+
+    generator = CoinGenerator(n_clusters=args.clusters, separation=args.separation,
+                              cluster_strength=args.cluster_strength, zipf_exponent=args.zipf,
+                              seed=args.seed)
+    info = generator.write(args.output, args.coins, args.chunk_size, args.labels)
+    print(f"Wrote {info['rows']:,} coins to {info['path']} in {info['chunks']} chunks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Tests for resuming snapshot tracking from saved DriftTracker states.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cluster_drift import track_snapshots  # noqa: E402
+from snapshot_store import SnapshotStore  # noqa: E402
+from test_snapshot_store import dates, make_snapshots  # noqa: E402
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SnapshotStore(str(tmp_path / 'store'), keyframe_interval=3)
+    for date, frame in zip(dates(8), make_snapshots(8)):
+        store.append(date, frame)
+    return store
+
+
+def test_saved_states_match_full_replay(store, tmp_path):
+    state_dir = tmp_path / 'state'
+    for date in [dates(8)[4], dates(8)[7], dates(8)[2]]:
+        expected, expected_report = track_snapshots(store, until=date, n_clusters=3)
+        clustered, report = track_snapshots(store, until=date, n_clusters=3, state_dir=str(state_dir))
+        assert clustered.equals(expected)
+        assert report == expected_report
+
+
+def test_saved_date_decodes_no_snapshots(store, tmp_path, monkeypatch):
+    state_dir = str(tmp_path / 'state')
+    expected, _ = track_snapshots(store, until=dates(8)[5], n_clusters=3, state_dir=state_dir)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("snapshot decoded")
+
+    monkeypatch.setattr(store, 'iter_snapshots', fail)
+    monkeypatch.setattr(store, 'read_snapshot', fail)
+    for date in dates(8)[:6]:
+        clustered, _ = track_snapshots(store, until=date, n_clusters=3, state_dir=state_dir)
+    assert clustered.equals(expected)
+
+
+def test_new_date_resumes_from_previous_state(store, tmp_path, monkeypatch):
+    state_dir = str(tmp_path / 'state')
+    track_snapshots(store, until=dates(8)[6], n_clusters=3, state_dir=state_dir)
+
+    decoded = []
+    iter_snapshots = store.iter_snapshots
+
+    def record(start=None, end=None, columns=None):
+        for date, frame in iter_snapshots(start, end, columns):
+            decoded.append(date)
+            yield date, frame
+
+    monkeypatch.setattr(store, 'iter_snapshots', record)
+    track_snapshots(store, until=dates(8)[7], n_clusters=3, state_dir=state_dir)
+    assert decoded == [dates(8)[7]]
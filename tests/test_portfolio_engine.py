@@ -0,0 +1,93 @@
+"""
+Tests for risk-based weights and the vectorized portfolio backtest.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from portfolio_engine import (  # noqa: E402
+    STRATEGIES, backtest, compare_strategies, risk_weights, synthetic_cluster_returns
+)
+
+
+RISK_SCORES = pd.Series({0: 2.0, 1: 5.0, 2: 8.5, 3: 9.5})
+
+
+def loop_backtest(weights, returns, rebalance_every):
+    """Month-by-month reference: holdings drift and reset at each rebalance."""
+    months = returns.shape[0]
+    period = rebalance_every or months
+    values = [1.0]
+    holdings = None
+    for month in range(months):
+        if month % period == 0:
+            holdings = values[-1] * np.asarray(weights, dtype=float)
+        holdings = holdings * (1.0 + returns[month])
+        values.append(holdings.sum())
+    return np.array(values)
+
+
+@pytest.mark.parametrize('strategy', STRATEGIES)
+def test_weights_sum_to_one(strategy):
+    weights = risk_weights(RISK_SCORES, strategy)
+    assert weights.index.equals(RISK_SCORES.index)
+    assert weights.sum() == pytest.approx(1.0)
+    assert (weights >= 0).all()
+
+
+@pytest.mark.parametrize('strategy', STRATEGIES)
+def test_zero_risk_scores(strategy):
+    weights = risk_weights(pd.Series({0: 0.0, 1: 0.0, 2: 0.0}), strategy)
+    assert np.isfinite(weights).all()
+    assert weights.to_numpy() == pytest.approx([1 / 3] * 3)
+
+
+@pytest.mark.parametrize('strategy', STRATEGIES)
+def test_single_cluster_gets_everything(strategy):
+    weights = risk_weights(pd.Series({7: 9.0}), strategy)
+    assert weights.to_dict() == {7: pytest.approx(1.0)}
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        risk_weights(RISK_SCORES, 'leverage')
+
+
+@pytest.mark.parametrize('rebalance_every', [1, 3, None])
+def test_backtest_matches_monthly_loop(rebalance_every):
+    returns = synthetic_cluster_returns(RISK_SCORES, months=14, n_scenarios=5, seed=3)
+    weights = risk_weights(RISK_SCORES).to_numpy()
+
+    values = backtest(weights, returns, rebalance_every)
+    assert values.shape == (5, 15)
+    for scenario in range(5):
+        expected = loop_backtest(weights, returns[scenario], rebalance_every)
+        np.testing.assert_allclose(values[scenario], expected, rtol=1e-12)
+
+    single = backtest(weights, returns[0], rebalance_every)
+    np.testing.assert_allclose(single[0], values[0], rtol=1e-12)
+
+
+def test_compare_strategies_order():
+    returns = synthetic_cluster_returns(RISK_SCORES, months=12, n_scenarios=20, seed=1)
+    assert list(compare_strategies(RISK_SCORES, returns).index) == STRATEGIES
+
+    chosen = ['equal', 'inverse_risk', 'midpoint']
+    assert list(compare_strategies(RISK_SCORES, returns, chosen).index) == chosen
+
+
+def test_compare_strategies_ranks_by_exposure():
+    # Riskier clusters return more every month, so strategies holding more
+    # of them end higher: equal > midpoint, and inverse_risk trails equal
+    returns = np.tile(RISK_SCORES.to_numpy() / 100, (12, 1))
+    table = compare_strategies(RISK_SCORES, returns, rebalance_every=None)
+
+    assert table.loc['equal', 'median_final'] > table.loc['inverse_risk', 'median_final']
+    assert table.loc['equal', 'median_final'] > table.loc['midpoint', 'median_final']
+    assert (table['prob_loss'] == 0).all()
@@ -0,0 +1,123 @@
+"""
+Round-trip tests for the XOR-delta snapshot store.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from snapshot_store import SUPPLY_COLUMNS, SnapshotStore, load_clustered_snapshot  # noqa: E402
+
+
+def make_snapshots(days: int, seed: int = 0):
+    """Daily frames with coins added, removed and changed, plus NaN supplies."""
+    rng = np.random.default_rng(seed)
+    tickers = [f"C{i}" for i in range(40)]
+    frames = []
+
+    for day in range(days):
+        if day:
+            tickers = tickers[2:] + [f"N{day}a", f"N{day}b"]
+        n = len(tickers)
+        mined = rng.exponential(1e7, n)
+        supply = rng.exponential(1e8, n)
+        # Most values repeat day to day so the deltas exercise zero words
+        if frames:
+            previous = frames[-1]
+            for i, ticker in enumerate(tickers):
+                if ticker in previous.index and rng.random() < 0.8:
+                    mined[i] = previous.at[ticker, 'TotalCoinsMined']
+                    supply[i] = previous.at[ticker, 'TotalCoinSupply']
+        supply[rng.random(n) < 0.1] = np.nan
+
+        frames.append(pd.DataFrame({
+            'CoinName': [f"Coin {t}" for t in tickers],
+            'Algorithm': rng.choice(['SHA-256', 'Scrypt', 'Ethash'], n),
+            'IsTrading': rng.random(n) < 0.9,
+            'ProofType': rng.choice(['PoW', 'PoS'], n),
+            'TotalCoinsMined': mined,
+            'TotalCoinSupply': supply
+        }, index=pd.Index(tickers)))
+
+    return frames
+
+
+def dates(days: int):
+    return [f"2025-10-{day + 1:02d}" for day in range(days)]
+
+
+def assert_bit_exact(actual: pd.DataFrame, expected: pd.DataFrame):
+    assert list(actual.index) == list(expected.index)
+    for column in expected.columns:
+        if column in SUPPLY_COLUMNS:
+            assert np.array_equal(actual[column].to_numpy().view(np.uint64),
+                                  expected[column].to_numpy(dtype=np.float64).view(np.uint64)), column
+        else:
+            assert list(actual[column]) == list(expected[column]), column
+
+
+@pytest.mark.parametrize('interval', [1, 3, 4])
+def test_round_trip_across_keyframes(tmp_path, interval):
+    frames = make_snapshots(11)
+    store = SnapshotStore(str(tmp_path), keyframe_interval=interval)
+    for date, frame in zip(dates(11), frames):
+        store.append(date, frame)
+
+    keyframes = [p['keyframe'] for p in store.manifest['partitions']]
+    assert keyframes == [i % interval == 0 for i in range(11)]
+
+    # A fresh instance decodes from disk only
+    reopened = SnapshotStore(str(tmp_path))
+    for date, frame in zip(dates(11), frames):
+        assert_bit_exact(reopened.read_snapshot(date), frame)
+
+
+def test_read_range_matches_snapshots(tmp_path):
+    frames = make_snapshots(9)
+    store = SnapshotStore(str(tmp_path), keyframe_interval=4)
+    for date, frame in zip(dates(9), frames):
+        store.append(date, frame)
+
+    history = store.read_range(start=dates(9)[2], end=dates(9)[7])
+    assert sorted(history['date'].unique()) == dates(9)[2:8]
+    for date, frame in zip(dates(9)[2:8], frames[2:8]):
+        rows = history[history['date'] == date].set_index('ticker')
+        assert_bit_exact(rows[list(SUPPLY_COLUMNS)], frame[list(SUPPLY_COLUMNS)])
+
+
+def test_append_replaces_unlisted_partition(tmp_path):
+    frames = make_snapshots(2)
+    store = SnapshotStore(str(tmp_path))
+    store.append(dates(2)[0], frames[0])
+
+    # Simulate a writer that published the partition and crashed before the manifest
+    orphan = tmp_path / f"date={dates(2)[1]}"
+    orphan.mkdir()
+    (orphan / 'coin_id.npz').write_bytes(b'partial')
+
+    store = SnapshotStore(str(tmp_path))
+    store.append(dates(2)[1], frames[1])
+    assert_bit_exact(SnapshotStore(str(tmp_path)).read_snapshot(dates(2)[1]), frames[1])
+
+
+def test_clustered_snapshot_loads_from_saved_state(tmp_path, monkeypatch):
+    frames = make_snapshots(5)
+    store = SnapshotStore(str(tmp_path))
+    for date, frame in zip(dates(5), frames):
+        store.append(date, frame)
+
+    expected = load_clustered_snapshot(str(tmp_path), dates(5)[-1], n_clusters=3)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("snapshot decoded")
+
+    # Every date up to the loaded one now has a saved tracker state
+    monkeypatch.setattr(SnapshotStore, '_decode_step', fail)
+    for date in dates(5):
+        clustered = load_clustered_snapshot(str(tmp_path), date, n_clusters=3)
+    assert clustered.equals(expected)